@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Asset
+from .models import Asset, AssetPrice
 
 
 class AssetAdmin(admin.ModelAdmin):
@@ -19,3 +19,12 @@ class AssetAdmin(admin.ModelAdmin):
 
 
 admin.site.register(Asset, AssetAdmin)
+
+
+class AssetPriceAdmin(admin.ModelAdmin):
+    list_display = ('code', 'date', 'close')
+    search_fields = ('code',)
+    list_filter = ('date',)
+
+
+admin.site.register(AssetPrice, AssetPriceAdmin)
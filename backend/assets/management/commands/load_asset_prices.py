@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from assets.services.price_service import PRICE_CHUNK_SIZE, load_prices_from_csv
+
+
+class Command(BaseCommand):
+    help = 'Carrega cotações de fechamento a partir de arquivos CSV com as colunas code,date,close'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+')
+        parser.add_argument('--chunk-size', type=int, default=PRICE_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        for path in options['paths']:
+            try:
+                with open(path, newline='', encoding='utf-8') as price_file:
+                    result = load_prices_from_csv(price_file, chunk_size=options['chunk_size'])
+            except OSError as error:
+                raise CommandError(f'não foi possível ler {path}: {error}')
+
+            for error in result.errors[:20]:
+                self.stderr.write(f"{path}:{error['line']}: {error['error']}")
+            self.stdout.write(self.style.SUCCESS(
+                f'{path}: {result.loaded} cotações carregadas, '
+                f'{len(result.errors)} linhas com erro'
+            ))
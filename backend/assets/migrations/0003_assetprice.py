@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0002_alter_asset_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssetPrice",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("code", models.CharField(max_length=10, verbose_name="Código")),
+                ("date", models.DateField(verbose_name="Data")),
+                (
+                    "close",
+                    models.DecimalField(
+                        decimal_places=6, max_digits=18, verbose_name="Fechamento"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cotação",
+                "verbose_name_plural": "Cotações",
+                "db_table": "assets_asset_price",
+                "ordering": ["code", "-date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("code", "date"), name="unique_asset_price_per_day"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -26,3 +26,21 @@ class Asset(models.Model):
 
     def __str__(self):
         return self.code
+
+
+class AssetPrice(models.Model):
+    code = models.CharField(max_length=10, verbose_name='Código')
+    date = models.DateField(verbose_name='Data')
+    close = models.DecimalField(max_digits=18, decimal_places=6, verbose_name='Fechamento')
+
+    class Meta:
+        db_table = 'assets_asset_price'
+        verbose_name = 'Cotação'
+        verbose_name_plural = 'Cotações'
+        ordering = ['code', '-date']
+        constraints = [
+            models.UniqueConstraint(fields=['code', 'date'], name='unique_asset_price_per_day')
+        ]
+
+    def __str__(self):
+        return f'{self.code} {self.date}: {self.close}'
@@ -2,8 +2,10 @@ from .models import Asset
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 
+from core.instrumentation import TimedSerializerMixin
 
-class AssetSerializer(serializers.ModelSerializer):
+
+class AssetSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
@@ -0,0 +1,71 @@
+import csv
+import datetime
+from decimal import Decimal, InvalidOperation
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from assets.models import Asset, AssetPrice
+from core.cache_versions import bump_version_on_commit, get_version
+
+PRICE_CHUNK_SIZE = 5000
+PRICES_VERSION_KEY = 'assets:prices-version'
+
+
+class PriceLoadResult:
+    def __init__(self):
+        self.loaded = 0
+        self.errors = []
+
+
+def load_prices_from_csv(file, chunk_size: int = PRICE_CHUNK_SIZE) -> PriceLoadResult:
+    result = PriceLoadResult()
+    reader = csv.DictReader(file)
+    chunk = []
+    for line_number, row in enumerate(reader, start=2):
+        try:
+            chunk.append(AssetPrice(
+                code=row['code'].upper().strip(),
+                date=datetime.date.fromisoformat(row['date'].strip()),
+                close=Decimal(row['close'].strip())
+            ))
+        except (KeyError, AttributeError, ValueError, InvalidOperation) as error:
+            result.errors.append({'line': line_number, 'error': str(error)})
+            continue
+        if len(chunk) >= chunk_size:
+            result.loaded += _save_chunk(chunk)
+            chunk = []
+    if chunk:
+        result.loaded += _save_chunk(chunk)
+    return result
+
+
+@transaction.atomic
+def _save_chunk(chunk: list[AssetPrice]) -> int:
+    unique_prices = {(price.code, price.date): price for price in chunk}
+    AssetPrice.objects.bulk_create(
+        unique_prices.values(),
+        update_conflicts=True,
+        unique_fields=['code', 'date'],
+        update_fields=['close']
+    )
+    bump_version_on_commit(PRICES_VERSION_KEY)
+    return len(unique_prices)
+
+
+def get_prices_version() -> int:
+    return get_version(PRICES_VERSION_KEY)
+
+
+def annotate_prices_as_of(assets, date: datetime.date):
+    latest_price = AssetPrice.objects.filter(
+        code=OuterRef('code'), date__lte=date
+    ).order_by('-date')
+    return assets.annotate(
+        price=Subquery(latest_price.values('close')[:1]),
+        price_date=Subquery(latest_price.values('date')[:1])
+    )
+
+
+def user_assets_with_prices(user, date: datetime.date) -> dict[int, Asset]:
+    assets = annotate_prices_as_of(Asset.objects.filter(user=user), date)
+    return {asset.id: asset for asset in assets}
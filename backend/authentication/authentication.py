@@ -1,5 +1,7 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from .user_cache import cache_user, get_cached_user
+
 
 class CookieJWTAuthentication(JWTAuthentication):
     def authenticate(self, request):
@@ -8,3 +10,12 @@ class CookieJWTAuthentication(JWTAuthentication):
             return None
         validated_token = self.get_validated_token(raw_token)
         return self.get_user(validated_token), validated_token
+
+
+class CachedCookieJWTAuthentication(CookieJWTAuthentication):
+    def get_user(self, validated_token):
+        user = get_cached_user(validated_token)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache_user(validated_token, user)
+        return user
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from authentication.revocation import PRUNE_CHUNK_SIZE, prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = 'Remove tokens de refresh expirados das tabelas de tokens emitidos e revogados'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=PRUNE_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        pruned = prune_expired_tokens(options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{pruned['outstanding']} token(s) emitidos e "
+            f"{pruned['blacklisted']} token(s) revogados removidos"
+        ))
@@ -0,0 +1,165 @@
+import hashlib
+import math
+import threading
+import time
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from core.cache_versions import bump_version_on_commit, get_version
+
+BLACKLIST_VERSION_KEY = 'auth:blacklist-version'
+FALSE_POSITIVE_RATE = 0.01
+MIN_CAPACITY = 1024
+LOAD_CHUNK_SIZE = 20000
+LOAD_ID_OVERLAP = 1000
+PRUNE_CHUNK_SIZE = 5000
+
+
+def _digests(jtis: list[str]) -> np.ndarray:
+    digests = b''.join(hashlib.blake2b(jti.encode(), digest_size=16).digest() for jti in jtis)
+    return np.frombuffer(digests, dtype='<u8').reshape(-1, 2)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float = FALSE_POSITIVE_RATE):
+        self.capacity = capacity
+        self.size = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digests: np.ndarray) -> np.ndarray:
+        size = np.uint64(self.size)
+        first, second = digests[:, :1] % size, digests[:, 1:] % size
+        return (first + np.arange(self.hash_count, dtype=np.uint64) * second) % size
+
+    def add_many(self, jtis: list[str]) -> None:
+        if not jtis:
+            return
+        positions = self._positions(_digests(list(dict.fromkeys(jtis))))
+        bits = np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8), bitorder='little')
+        self.count += int(np.count_nonzero(~bits[positions].all(axis=1)))
+        bits[positions.ravel()] = 1
+        self.bits[:] = np.packbits(bits, bitorder='little').tobytes()
+
+    def add(self, jti: str) -> None:
+        if jti in self:
+            return
+        for position in self._positions(_digests([jti]))[0].tolist():
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, jti: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(_digests([jti]))[0].tolist()
+        )
+
+
+class RevocationFilter:
+    def __init__(self):
+        self._bloom = None
+        self._version = None
+        self._last_id = 0
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+
+    def might_be_revoked(self, jti: str) -> bool:
+        self._sync()
+        return jti in self._bloom
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._version = None
+            self._last_id = 0
+
+    def _sync(self) -> None:
+        version = get_version(BLACKLIST_VERSION_KEY)
+        if self._is_fresh(version):
+            return
+        with self._lock:
+            if self._is_fresh(version):
+                return
+            if self._bloom is None or self._bloom.count > self._bloom.capacity:
+                self._rebuild()
+            else:
+                self._last_id = max(
+                    self._last_id,
+                    self._load(self._bloom, max(self._last_id - LOAD_ID_OVERLAP, 0))
+                )
+            self._version = version
+            self._synced_at = time.monotonic()
+
+    def _is_fresh(self, version) -> bool:
+        return (
+            self._bloom is not None
+            and self._version == version
+            and time.monotonic() - self._synced_at < settings.AUTH_REVOCATION_SYNC_INTERVAL
+        )
+
+    def _rebuild(self) -> None:
+        capacity = max(MIN_CAPACITY, 2 * BlacklistedToken.objects.count())
+        bloom = BloomFilter(capacity)
+        last_id = self._load(bloom, 0)
+        self._bloom, self._last_id = bloom, last_id
+
+    @staticmethod
+    def _load(bloom: BloomFilter, after_id: int) -> int:
+        while True:
+            rows = list(
+                BlacklistedToken.objects.filter(id__gt=after_id).order_by('id').values_list(
+                    'id', 'token__jti'
+                )[:LOAD_CHUNK_SIZE]
+            )
+            if not rows:
+                return after_id
+            bloom.add_many([jti for _, jti in rows])
+            after_id = rows[-1][0]
+
+
+revocation_filter = RevocationFilter()
+
+
+def mark_revoked(jti: str) -> None:
+    revocation_filter.add(jti)
+    bump_version_on_commit(BLACKLIST_VERSION_KEY)
+
+
+def filter_enabled() -> bool:
+    return settings.AUTH_REVOCATION_FILTER_ENABLED and settings.CACHE_IS_SHARED
+
+
+class FilteredRefreshToken(RefreshToken):
+    def check_blacklist(self) -> None:
+        if filter_enabled() and not revocation_filter.might_be_revoked(
+            self.payload[api_settings.JTI_CLAIM]
+        ):
+            return
+        super().check_blacklist()
+
+
+def prune_expired_tokens(chunk_size: int = PRUNE_CHUNK_SIZE) -> dict:
+    now = aware_utcnow()
+    pruned = {'outstanding': 0, 'blacklisted': 0}
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now).order_by().values_list(
+                'id', flat=True
+            )[:chunk_size]
+        )
+        if not ids:
+            return pruned
+        with transaction.atomic():
+            pruned['blacklisted'] += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            pruned['outstanding'] += OutstandingToken.objects.filter(id__in=ids).delete()[0]
@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from authentication.revocation import mark_revoked
+from authentication.user_cache import invalidate_user
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+    transaction.on_commit(lambda: invalidate_user(instance.pk))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def track_revoked_token(sender, instance, created, **kwargs):
+    if created:
+        mark_revoked(instance.token.jti)
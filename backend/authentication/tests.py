@@ -0,0 +1,121 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from authentication.authentication import CachedCookieJWTAuthentication
+from authentication.revocation import (
+    BLACKLIST_VERSION_KEY,
+    FilteredRefreshToken,
+    revocation_filter
+)
+from authentication.user_cache import SHARED_VERSION_KEY, local_cache
+from core.cache_versions import bump_version
+from costumers.models import CustomUser
+
+
+class CachedCookieJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.user = CustomUser.objects.create_user(username='cached', password='cached-password')
+        self.token = str(AccessToken.for_user(self.user))
+        self.authentication = CachedCookieJWTAuthentication()
+
+    def _authenticate(self):
+        request = RequestFactory().get('/')
+        request.COOKIES['access_token'] = self.token
+        return self.authentication.authenticate(request)[0]
+
+    def test_repeated_requests_skip_the_user_query(self):
+        self._authenticate()
+        with self.assertNumQueries(0):
+            user = self._authenticate()
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_deactivating_the_user_rejects_the_cached_token(self):
+        self._authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_version_bump_from_another_worker_evicts_the_local_entry(self):
+        self._authenticate()
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        bump_version(SHARED_VERSION_KEY.format(user_id=self.user.pk))
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_password_change_drops_every_cached_token_of_the_user(self):
+        self._authenticate()
+        self.assertEqual(len(local_cache), 1)
+
+        self.user.set_password('new-password')
+        self.user.save()
+
+        self.assertEqual(len(local_cache), 0)
+        with self.assertNumQueries(1):
+            self._authenticate()
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class RevocationFilterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        revocation_filter.reset()
+        self.user = CustomUser.objects.create_user(username='revoked', password='revoked-password')
+        self.refresh = str(RefreshToken.for_user(self.user))
+
+    def _revoke_elsewhere(self, refresh: str) -> None:
+        jti = RefreshToken(refresh, verify=False)['jti']
+        BlacklistedToken.objects.bulk_create([
+            BlacklistedToken(token=OutstandingToken.objects.get(jti=jti))
+        ])
+        bump_version(BLACKLIST_VERSION_KEY)
+
+    def test_unrevoked_token_skips_the_blacklist_query(self):
+        FilteredRefreshToken(self.refresh)
+        with self.assertNumQueries(0):
+            FilteredRefreshToken(self.refresh)
+
+    def test_blacklisting_rejects_the_token(self):
+        FilteredRefreshToken(self.refresh)
+        with self.captureOnCommitCallbacks(execute=True):
+            RefreshToken(self.refresh).blacklist()
+
+        with self.assertRaises(TokenError):
+            FilteredRefreshToken(self.refresh)
+
+    def test_revocation_by_another_worker_is_seen_after_the_version_bump(self):
+        FilteredRefreshToken(self.refresh)
+        self._revoke_elsewhere(self.refresh)
+
+        with self.assertRaises(TokenError):
+            FilteredRefreshToken(self.refresh)
+
+    def test_revoked_tokens_stay_rejected_across_a_rebuild(self):
+        FilteredRefreshToken(self.refresh)
+        self._revoke_elsewhere(self.refresh)
+        revocation_filter.reset()
+
+        with self.assertRaises(TokenError):
+            FilteredRefreshToken(self.refresh)
+        other = str(RefreshToken.for_user(self.user))
+        FilteredRefreshToken(other)
+
+    @override_settings(CACHE_IS_SHARED=False)
+    def test_process_local_cache_always_checks_the_database(self):
+        FilteredRefreshToken(self.refresh)
+        BlacklistedToken.objects.bulk_create([
+            BlacklistedToken(token=OutstandingToken.objects.get(
+                jti=RefreshToken(self.refresh, verify=False)['jti']
+            ))
+        ])
+
+        with self.assertRaises(TokenError):
+            FilteredRefreshToken(self.refresh)
@@ -0,0 +1,136 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+
+from core.cache_versions import bump_version, get_version
+
+SHARED_USER_KEY = 'auth:token-user:{token_key}'
+SHARED_VERSION_KEY = 'auth:user-version:{user_id}'
+
+
+def token_cache_key(validated_token) -> str:
+    jti = validated_token.get(api_settings.JTI_CLAIM)
+    if jti:
+        return str(jti)
+    return hashlib.sha256(str(validated_token).encode()).hexdigest()
+
+
+def token_ttl(validated_token, now: float) -> float:
+    expires_at = validated_token.get('exp')
+    ttl = settings.AUTH_USER_CACHE_TTL
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - now)
+    return ttl
+
+
+class TokenUserCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._user_tokens = {}
+        self._lock = threading.Lock()
+
+    def get(self, token_key: str, now: float):
+        with self._lock:
+            entry = self._entries.get(token_key)
+            if entry is None:
+                return None
+            user, version, expires_at = entry
+            if expires_at <= now:
+                self._remove(token_key)
+                return None
+            self._entries.move_to_end(token_key)
+            return user, version
+
+    def set(self, token_key: str, user, version, expires_at: float) -> None:
+        with self._lock:
+            self._remove(token_key)
+            self._entries[token_key] = (user, version, expires_at)
+            self._user_tokens.setdefault(user.pk, set()).add(token_key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, token_key: str) -> None:
+        with self._lock:
+            self._remove(token_key)
+
+    def discard_user(self, user_id) -> None:
+        with self._lock:
+            for token_key in list(self._user_tokens.get(user_id, ())):
+                self._remove(token_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._user_tokens.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, token_key: str) -> None:
+        entry = self._entries.pop(token_key, None)
+        if entry is None:
+            return
+        user_id = entry[0].pk
+        tokens = self._user_tokens.get(user_id)
+        if tokens is not None:
+            tokens.discard(token_key)
+            if not tokens:
+                del self._user_tokens[user_id]
+
+
+local_cache = TokenUserCache(settings.AUTH_USER_CACHE_SIZE)
+
+
+def get_cached_user(validated_token):
+    now = time.time()
+    token_key = token_cache_key(validated_token)
+    entry = local_cache.get(token_key, now)
+    if entry is not None and entry[1] != _shared_version(entry[0].pk):
+        local_cache.discard(token_key)
+        entry = None
+    if entry is None:
+        entry = _get_shared_entry(token_key)
+        if entry is not None:
+            local_cache.set(token_key, *entry, now + token_ttl(validated_token, now))
+    return copy.copy(entry[0]) if entry is not None else None
+
+
+def cache_user(validated_token, user) -> None:
+    now = time.time()
+    ttl = token_ttl(validated_token, now)
+    if ttl <= 0:
+        return
+    token_key = token_cache_key(validated_token)
+    version = _shared_version(user.pk)
+    local_cache.set(token_key, user, version, now + ttl)
+    cache.set(
+        SHARED_USER_KEY.format(token_key=token_key), (user, version), timeout=max(int(ttl), 1)
+    )
+
+
+def _shared_version(user_id) -> int:
+    return get_version(SHARED_VERSION_KEY.format(user_id=user_id))
+
+
+def _get_shared_entry(token_key: str):
+    entry = cache.get(SHARED_USER_KEY.format(token_key=token_key))
+    if entry is None or _shared_version(entry[0].pk) != entry[1]:
+        return None
+    return entry
+
+
+def invalidate_token(validated_token) -> None:
+    token_key = token_cache_key(validated_token)
+    local_cache.discard(token_key)
+    cache.delete(SHARED_USER_KEY.format(token_key=token_key))
+
+
+def invalidate_user(user_id) -> None:
+    local_cache.discard_user(user_id)
+    bump_version(SHARED_VERSION_KEY.format(user_id=user_id))
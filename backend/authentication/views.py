@@ -5,6 +5,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
 from decouple import config
+from .revocation import FilteredRefreshToken
+from .user_cache import invalidate_token
 
 SECURE_COOKIE = config('DJANGO_ENV', default='development') == 'PRODUCTION'
 
@@ -57,7 +59,7 @@ class CookieTokenRefreshView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         try:
-            refresh = RefreshToken(refresh_token)
+            refresh = FilteredRefreshToken(refresh_token)
             new_access = str(refresh.access_token)
         
         except Exception:
@@ -85,10 +87,12 @@ class LogoutView(APIView):
         refresh_token = request.COOKIES.get('refresh_token')
         if refresh_token:
             try:
-                token = RefreshToken(refresh_token)
+                token = FilteredRefreshToken(refresh_token)
                 token.blacklist()
             except Exception:
                 pass
+        if request.auth is not None:
+            invalidate_token(request.auth)
 
         response = Response({'detail': 'Logout realizado com sucesso'})
         response.delete_cookie('access_token', path='/')
@@ -0,0 +1,2 @@
+async def afetch(queryset) -> list:
+    return [row async for row in queryset]
@@ -0,0 +1,68 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.decorators import classonlymethod
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.async_orm import afetch
+
+
+class AsyncDispatchMixin:
+    async_dispatch = False
+
+    @classonlymethod
+    def as_view(cls, *args, **initkwargs):
+        initkwargs.setdefault('async_dispatch', settings.ASYNC_VIEWS_ENABLED)
+        view = super().as_view(*args, **initkwargs)
+        if initkwargs['async_dispatch']:
+            view = markcoroutinefunction(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.async_dispatch:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            handler = getattr(self, f'a{handler.__name__}', handler)
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncAPIView(AsyncDispatchMixin, APIView):
+    pass
+
+
+class AsyncListModelMixin(AsyncDispatchMixin):
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.paginator
+        if paginator is None:
+            serializer = self.get_serializer(await afetch(queryset), many=True)
+            return Response(serializer.data)
+        if hasattr(paginator, 'apaginate_queryset'):
+            page = await paginator.apaginate_queryset(queryset, request, view=self)
+        else:
+            page = await sync_to_async(paginator.paginate_queryset)(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
@@ -0,0 +1,50 @@
+import time
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _new_version() -> int:
+    return time.time_ns()
+
+
+def get_version(key: str) -> int:
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(key: str) -> int:
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _new_version(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version(), timeout=None)
+
+
+def bump_version_on_commit(key: str) -> None:
+    transaction.on_commit(lambda: bump_version(key))
+
+
+def count(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+async def acount(key: str) -> None:
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 0, timeout=None)
+        await cache.aincr(key)
@@ -0,0 +1,74 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+from django.db import connection
+
+logger = logging.getLogger('core.instrumentation')
+
+MAX_SQL_LENGTH = 500
+MAX_DUPLICATED_STATEMENTS = 10
+
+current_metrics = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self.serializer_time = 0.0
+        self.serializing = False
+        self.statements = []
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def record_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.query_count += 1
+            self.statements.append(sql)
+
+    def duplicated_statements(self) -> list[dict]:
+        duplicated = [
+            (sql, count) for sql, count in Counter(self.statements).most_common() if count > 1
+        ]
+        return [
+            {'sql': sql[:MAX_SQL_LENGTH], 'count': count}
+            for sql, count in duplicated[:MAX_DUPLICATED_STATEMENTS]
+        ]
+
+
+class TimedSerializerMixin:
+    def to_representation(self, instance):
+        metrics = current_metrics.get()
+        if metrics is None or metrics.serializing:
+            return super().to_representation(instance)
+        metrics.serializing = True
+        started, db_started = time.perf_counter(), metrics.db_time
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializing = False
+            # Queries issued while serializing (lazy relations) are already counted as db time.
+            metrics.serializer_time += (
+                time.perf_counter() - started - (metrics.db_time - db_started)
+            )
+
+
+def watch_queries(metrics: RequestMetrics) -> ExitStack:
+    stack = ExitStack()
+    stack.enter_context(connection.execute_wrapper(metrics.record_query))
+    return stack
+
+
+def log_request(level: int, payload: dict) -> None:
+    logger.log(level, json.dumps(payload, default=str))
@@ -0,0 +1,87 @@
+import datetime
+import json
+import platform
+import time
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.authentication import CachedCookieJWTAuthentication, CookieJWTAuthentication
+from authentication.user_cache import local_cache
+from costumers.models import CustomUser
+from costumers.views import ApiUserInfoView
+
+MODES = (
+    ('sem-cache', CookieJWTAuthentication),
+    ('com-cache', CachedCookieJWTAuthentication),
+)
+
+
+class Command(BaseCommand):
+    help = 'Compara requisições por segundo da autenticação JWT com e sem o cache de usuários'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', default='bench0', help='username usado nas requisições')
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument('--output', help='arquivo onde o JSON será gravado')
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options['user'])
+        except CustomUser.DoesNotExist:
+            raise CommandError(
+                f"usuário {options['user']} não existe, rode generate_synthetic_data antes"
+            )
+
+        factory = APIRequestFactory()
+        factory.cookies['access_token'] = str(RefreshToken.for_user(user).access_token)
+        results = []
+        for name, authentication_class in MODES:
+            local_cache.clear()
+            authenticator = authentication_class()
+            view = ApiUserInfoView.as_view(authentication_classes=[authentication_class])
+            results.append({
+                'mode': name,
+                'authenticate': self._measure(
+                    lambda: authenticator.authenticate(factory.get('/api/v1/me/')),
+                    options['requests']
+                ),
+                'me_view': self._measure(
+                    lambda: view(factory.get('/api/v1/me/')), options['requests']
+                ),
+            })
+        local_cache.clear()
+
+        report = {
+            'generated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'user': user.username,
+            'requests': options['requests'],
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+            },
+            'results': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as report_file:
+                report_file.write(output)
+        self.stdout.write(output)
+
+    @staticmethod
+    def _measure(call, requests: int) -> dict:
+        call()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(requests):
+                call()
+            elapsed = time.perf_counter() - started
+        return {
+            'requests_per_second': round(requests / elapsed, 1),
+            'mean_us': round(elapsed / requests * 1_000_000, 1),
+            'queries_per_request': round(len(queries.captured_queries) / requests, 3),
+        }
@@ -0,0 +1,152 @@
+import datetime
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+import django
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from costumers.models import CustomUser
+
+
+def default_endpoints(today: datetime.date) -> list[tuple[str, str]]:
+    month_query = f'due_date__year={today.year}&due_date__month={today.month}'
+    year_range = f'from={today.year}-01&to={today.year}-12'
+    return [
+        ('me', '/api/v1/me/'),
+        ('dashboard', '/api/v1/dashboard/'),
+        ('monthly-view', f'/api/v1/monthly-view/?{month_query}'),
+        ('monthly-view-range', f'/api/v1/monthly-view/range/?{year_range}'),
+        ('monthly-summary', f'/api/v1/monthly-summary/?{month_query}'),
+        ('expenses', f'/api/v1/expenses/?{month_query}'),
+        ('categories', '/api/v1/categories/'),
+        ('installments', '/api/v1/installments/'),
+        ('recurring', '/api/v1/recurring/'),
+        ('paid-recurring', '/api/v1/paid-recurring/'),
+        ('assets', '/api/v1/assets/'),
+        ('cards-investiments', '/api/v1/cards-investiments/'),
+        ('itens-investiments', '/api/v1/itens-investiments/'),
+        ('cards-dividends', '/api/v1/cards-dividends/'),
+        ('itens-dividends', '/api/v1/itens-dividends/'),
+        ('positions', '/api/v1/positions/'),
+        ('capital-gains', f'/api/v1/capital-gains/?year={today.year}'),
+        (
+            'capital-gains-sells',
+            f'/api/v1/capital-gains/sells/?year={today.year}&month={today.month}'
+        ),
+        ('portfolio-valuation', f'/api/v1/portfolio/valuation/?date={today.isoformat()}'),
+        ('portfolio-timeseries', '/api/v1/portfolio/timeseries/?interval=monthly'),
+        ('dividend-analytics', f'/api/v1/dividends/analytics/?year={today.year}'),
+        ('dividend-projection', '/api/v1/dividends/projection/'),
+    ]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = 'Mede latência, número de queries e pico de memória dos endpoints da API em JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', default='bench0', help='username usado nas requisições')
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help='nome de um endpoint a medir (pode ser repetido); padrão: todos'
+        )
+        parser.add_argument(
+            '--cold-cache',
+            action='store_true',
+            help='limpa o cache antes de cada requisição'
+        )
+        parser.add_argument('--output', help='arquivo onde o JSON será gravado')
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options['user'])
+        except CustomUser.DoesNotExist:
+            raise CommandError(
+                f"usuário {options['user']} não existe, rode generate_synthetic_data antes"
+            )
+
+        endpoints = default_endpoints(datetime.date.today())
+        if options['endpoints']:
+            endpoints = [item for item in endpoints if item[0] in options['endpoints']]
+            if not endpoints:
+                raise CommandError('nenhum endpoint conhecido foi informado')
+
+        client = Client()
+        client.cookies['access_token'] = str(RefreshToken.for_user(user).access_token)
+
+        results = []
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            for name, url in endpoints:
+                results.append(self._measure(client, name, url, options))
+
+        report = {
+            'generated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'user': user.username,
+            'iterations': options['iterations'],
+            'cold_cache': options['cold_cache'],
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+            },
+            'endpoints': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as report_file:
+                report_file.write(output)
+        self.stdout.write(output)
+
+    def _measure(self, client: Client, name: str, url: str, options: dict) -> dict:
+        for _ in range(options['warmup']):
+            client.get(url)
+
+        latencies = []
+        query_counts = []
+        status_code = None
+        response_size = 0
+        for _ in range(options['iterations']):
+            if options['cold_cache']:
+                cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+            query_counts.append(len(queries.captured_queries))
+            status_code = response.status_code
+            response_size = len(response.content)
+
+        if options['cold_cache']:
+            cache.clear()
+        tracemalloc.start()
+        client.get(url)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        return {
+            'name': name,
+            'url': url,
+            'status': status_code,
+            'p50_ms': round(statistics.median(latencies), 3),
+            'p95_ms': round(percentile(latencies, 0.95), 3),
+            'max_ms': round(max(latencies), 3),
+            'queries': max(query_counts),
+            'peak_memory_kb': round(peak_memory / 1024, 1),
+            'response_bytes': response_size,
+        }
@@ -0,0 +1,212 @@
+import datetime
+import random
+from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from assets.models import Asset, TypeAsset
+from costumers.models import CustomUser
+from dividends.models import CardDividendMonth, ItemDividend
+from expenses.models import Category, Expense, RecurringExpense, PaidRecurringExpense
+from expenses.services.installment_manager_service import InstallmentExpenseService
+from expenses.services.monthly_cache_service import bump_data_version_on_commit
+from expenses.services.monthly_summary_service import MonthlySummaryService
+from investiments.models import CardInvestiment, ItemInvestiment, OrderType
+from investiments.services.position_service import PositionService
+
+CATEGORY_NAMES = [
+    'Moradia', 'Alimentação', 'Transporte', 'Saúde', 'Lazer',
+    'Educação', 'Assinaturas', 'Vestuário', 'Pets', 'Outros',
+]
+EXPENSE_NAMES = [
+    'Mercado', 'Farmácia', 'Padaria', 'Restaurante', 'Combustível', 'Uber',
+    'Cinema', 'Presente', 'Manutenção', 'Conta de luz', 'Conta de água', 'Internet',
+]
+INSTALLMENT_NAMES = ['Notebook', 'Geladeira', 'Celular', 'Sofá', 'Viagem', 'Curso', 'Bicicleta']
+RECURRING_NAMES = [
+    'Aluguel', 'Condomínio', 'Academia', 'Streaming', 'Plano de saúde', 'Escola', 'Seguro',
+]
+ASSET_CODES = [
+    ('PETR4', TypeAsset.ACAO), ('VALE3', TypeAsset.ACAO), ('ITUB4', TypeAsset.ACAO),
+    ('BBAS3', TypeAsset.ACAO), ('WEGE3', TypeAsset.ACAO), ('TAEE11', TypeAsset.ACAO),
+    ('MXRF11', TypeAsset.FII), ('HGLG11', TypeAsset.FII), ('KNRI11', TypeAsset.FII),
+    ('XPML11', TypeAsset.FII), ('VISC11', TypeAsset.FII), ('BCFF11', TypeAsset.FII),
+    ('AAPL34', TypeAsset.BDR), ('MSFT34', TypeAsset.BDR), ('AMZO34', TypeAsset.BDR),
+    ('BOVA11', TypeAsset.ETF), ('IVVB11', TypeAsset.ETF), ('SMAL11', TypeAsset.ETF),
+]
+
+
+class Command(BaseCommand):
+    help = 'Gera usuários com dados sintéticos realistas para testes de carga e benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1)
+        parser.add_argument('--prefix', default='bench')
+        parser.add_argument('--password', default='bench-password')
+        parser.add_argument('--months', type=int, default=36, help='meses de histórico')
+        parser.add_argument('--expenses', type=int, default=2000)
+        parser.add_argument('--installments', type=int, default=40)
+        parser.add_argument('--recurring', type=int, default=12)
+        parser.add_argument('--assets', type=int, default=15)
+        parser.add_argument('--operations-per-month', type=int, default=8)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options['seed'])
+        password_hash = make_password(options['password'])
+        today = datetime.date.today()
+        self.start_date = today.replace(day=1) - relativedelta(months=options['months'] - 1)
+        self.months = options['months']
+
+        for index in range(options['users']):
+            username = f"{options['prefix']}{index}"
+            CustomUser.objects.filter(username=username).delete()
+            with transaction.atomic():
+                user = CustomUser.objects.create(username=username, password=password_hash)
+                categories = self._create_categories(user)
+                self._create_expenses(user, categories, rnd, options['expenses'])
+                self._create_installments(user, categories, rnd, options['installments'])
+                self._create_recurring(user, categories, rnd, options['recurring'])
+                assets = self._create_assets(user, rnd, options['assets'])
+                self._create_investiments(user, assets, rnd, options['operations_per_month'])
+                self._create_dividends(user, assets, rnd)
+                MonthlySummaryService(user).rebuild()
+                PositionService.rebuild_user(user)
+                bump_data_version_on_commit(user.pk)
+            self.stdout.write(self.style.SUCCESS(f'usuário {username} gerado'))
+
+    def _random_date(self, rnd) -> datetime.date:
+        month_start = self.start_date + relativedelta(months=rnd.randrange(self.months))
+        return month_start.replace(day=rnd.randint(1, 28))
+
+    def _create_categories(self, user) -> list:
+        return Category.objects.bulk_create([
+            Category(user=user, name=name) for name in CATEGORY_NAMES
+        ])
+
+    def _create_expenses(self, user, categories, rnd, quantity) -> None:
+        today = datetime.date.today()
+        expenses = []
+        for _ in range(quantity):
+            due_date = self._random_date(rnd)
+            paid = due_date < today and rnd.random() < 0.9
+            expenses.append(Expense(
+                user=user,
+                name=rnd.choice(EXPENSE_NAMES),
+                amount=Decimal(rnd.randint(500, 60000)) / 100,
+                due_date=due_date,
+                payment_date=due_date if paid else None,
+                category=rnd.choice(categories + [None]),
+                paid=paid
+            ))
+        Expense.objects.bulk_create(expenses, batch_size=1000)
+
+    def _create_installments(self, user, categories, rnd, quantity) -> None:
+        services = [
+            InstallmentExpenseService(
+                user=user,
+                name=rnd.choice(INSTALLMENT_NAMES),
+                total_amount=Decimal(rnd.randint(30000, 1500000)) / 100,
+                installments_quantity=rnd.choice([2, 3, 6, 10, 12, 18, 24]),
+                first_due_date=self._random_date(rnd),
+                category=rnd.choice(categories)
+            )
+            for _ in range(quantity)
+        ]
+        InstallmentExpenseService.create_many(services)
+        Expense.objects.filter(
+            installment_origin__user=user, due_date__lt=datetime.date.today()
+        ).update(paid=True)
+
+    def _create_recurring(self, user, categories, rnd, quantity) -> None:
+        contracts = RecurringExpense.objects.bulk_create([
+            RecurringExpense(
+                user=user,
+                name=rnd.choice(RECURRING_NAMES),
+                amount=Decimal(rnd.randint(3000, 300000)) / 100,
+                due_day=rnd.randint(1, 31),
+                category=rnd.choice(categories),
+                start_date=self._random_date(rnd),
+                end_date=None if rnd.random() < 0.8 else datetime.date.today() + relativedelta(
+                    months=rnd.randint(-6, 24)
+                ),
+                active=rnd.random() < 0.95
+            )
+            for _ in range(quantity)
+        ])
+        today = datetime.date.today()
+        payments = []
+        for contract in contracts:
+            month = contract.start_date.replace(day=1)
+            while month <= today and (contract.end_date is None or month <= contract.end_date):
+                if rnd.random() < 0.95:
+                    payments.append(PaidRecurringExpense(
+                        recurring_expense=contract,
+                        payment_date=month,
+                        month=month.month,
+                        year=month.year
+                    ))
+                month += relativedelta(months=1)
+        PaidRecurringExpense.objects.bulk_create(payments, batch_size=1000)
+
+    def _create_assets(self, user, rnd, quantity) -> list:
+        codes = list(ASSET_CODES[:quantity])
+        while len(codes) < quantity:
+            codes.append((f'SYN{len(codes):03d}', rnd.choice(TypeAsset.values)))
+        return Asset.objects.bulk_create([
+            Asset(user=user, code=code, type=asset_type) for code, asset_type in codes
+        ])
+
+    def _create_investiments(self, user, assets, rnd, operations_per_month) -> None:
+        cards = CardInvestiment.objects.bulk_create([
+            CardInvestiment(user=user, year=month.year, month=month.month)
+            for month in (self.start_date + relativedelta(months=i) for i in range(self.months))
+        ])
+        holdings = {asset.id: Decimal('0') for asset in assets}
+        prices = {asset.id: Decimal(rnd.randint(800, 15000)) / 100 for asset in assets}
+        items = []
+        for card in cards:
+            for _ in range(operations_per_month):
+                asset = rnd.choice(assets)
+                prices[asset.id] = max(
+                    Decimal('1.00'),
+                    (prices[asset.id] * Decimal(rnd.uniform(0.95, 1.06))).quantize(Decimal('0.01'))
+                )
+                sell = holdings[asset.id] > 0 and rnd.random() < 0.2
+                if sell:
+                    quantity = Decimal(rnd.randint(1, int(holdings[asset.id])))
+                    holdings[asset.id] -= quantity
+                else:
+                    quantity = Decimal(rnd.randint(1, 100))
+                    holdings[asset.id] += quantity
+                items.append(ItemInvestiment(
+                    asset=asset,
+                    card=card,
+                    user=user,
+                    order_type=OrderType.SELL if sell else OrderType.BUY,
+                    quantity=quantity,
+                    unit_price=prices[asset.id],
+                    operation_date=datetime.date(card.year, card.month, rnd.randint(1, 28))
+                ))
+        ItemInvestiment.objects.bulk_create(items, batch_size=1000)
+
+    def _create_dividends(self, user, assets, rnd) -> None:
+        cards = CardDividendMonth.objects.bulk_create([
+            CardDividendMonth(user=user, year=month.year, month=month.month)
+            for month in (self.start_date + relativedelta(months=i) for i in range(self.months))
+        ])
+        payers = [asset for asset in assets if asset.type in (TypeAsset.FII, TypeAsset.ACAO)]
+        items = []
+        for card in cards:
+            for asset in payers:
+                if asset.type == TypeAsset.FII or rnd.random() < 0.25:
+                    items.append(ItemDividend(
+                        card_month=card,
+                        user=user,
+                        asset=asset,
+                        value=Decimal(rnd.randint(500, 50000)) / 100,
+                        received_date=datetime.date(card.year, card.month, rnd.randint(1, 28))
+                    ))
+        ItemDividend.objects.bulk_create(items, batch_size=1000)
@@ -0,0 +1,143 @@
+import datetime
+import http.client
+import json
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.commands.benchmark_endpoints import percentile
+
+
+def default_endpoints(today: datetime.date) -> list[tuple[str, str]]:
+    month_query = f'due_date__year={today.year}&due_date__month={today.month}'
+    return [
+        ('monthly-view', f'/api/v1/monthly-view/?{month_query}'),
+        ('dashboard', '/api/v1/dashboard/'),
+        ('cards-investiments', '/api/v1/cards-investiments/'),
+        ('cards-dividends', '/api/v1/cards-dividends/'),
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Gera carga concorrente contra um servidor em execução e mede vazão e latência em JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--user', default='bench0', help='username usado no login')
+        parser.add_argument('--password', required=True)
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument('--duration', type=float, default=10, help='segundos por endpoint')
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help='nome de um endpoint a medir (pode ser repetido); padrão: todos'
+        )
+        parser.add_argument('--label', help='identificação do servidor testado, ex.: wsgi')
+        parser.add_argument('--output', help='arquivo onde o JSON será gravado')
+
+    def handle(self, *args, **options):
+        self.target = urlsplit(options['base_url'])
+        cookie = self._login(options['user'], options['password'])
+
+        endpoints = default_endpoints(datetime.date.today())
+        if options['endpoints']:
+            endpoints = [item for item in endpoints if item[0] in options['endpoints']]
+            if not endpoints:
+                raise CommandError('nenhum endpoint conhecido foi informado')
+
+        results = [
+            self._load(name, url, cookie, options['concurrency'], options['duration'])
+            for name, url in endpoints
+        ]
+        report = {
+            'generated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'label': options['label'],
+            'base_url': options['base_url'],
+            'concurrency': options['concurrency'],
+            'duration_s': options['duration'],
+            'endpoints': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as report_file:
+                report_file.write(output)
+        self.stdout.write(output)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection_class = (
+            http.client.HTTPSConnection if self.target.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        return connection_class(self.target.hostname, self.target.port, timeout=60)
+
+    def _login(self, username: str, password: str) -> str:
+        connection = self._connection()
+        connection.request(
+            'POST',
+            '/api/v1/login/',
+            body=json.dumps({'username': username, 'password': password}),
+            headers={'Content-Type': 'application/json'}
+        )
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise CommandError(f'login falhou com status {response.status}')
+        cookies = [
+            value.split(';', 1)[0] for header, value in response.getheaders()
+            if header.lower() == 'set-cookie' and value.startswith('access_token=')
+        ]
+        connection.close()
+        return cookies[0]
+
+    def _load(self, name: str, url: str, cookie: str, concurrency: int, duration: float) -> dict:
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def worker():
+            connection = self._connection()
+            local_latencies = []
+            local_errors = 0
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', url, headers={'Cookie': cookie})
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        local_errors += 1
+                except (OSError, http.client.HTTPException):
+                    local_errors += 1
+                    connection.close()
+                    connection = self._connection()
+                    continue
+                local_latencies.append((time.perf_counter() - started) * 1000)
+            connection.close()
+            with lock:
+                latencies.extend(local_latencies)
+                errors.append(local_errors)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if not latencies:
+            raise CommandError(f'nenhuma requisição concluída para {name}')
+        return {
+            'name': name,
+            'url': url,
+            'requests': len(latencies),
+            'errors': sum(errors),
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(statistics.median(latencies), 2),
+            'p95_ms': round(percentile(latencies, 0.95), 2),
+            'p99_ms': round(percentile(latencies, 0.99), 2),
+        }
@@ -0,0 +1,118 @@
+import logging
+import random
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+from core import instrumentation
+
+
+class RequestInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = self._start()
+        if metrics is None:
+            return self.get_response(request)
+        token = instrumentation.current_metrics.set(metrics)
+        try:
+            with instrumentation.watch_queries(metrics):
+                response = self.get_response(request)
+        finally:
+            instrumentation.current_metrics.reset(token)
+        return self._finish(request, response, metrics, self._show_server_timing(request))
+
+    async def __acall__(self, request):
+        metrics = self._start()
+        if metrics is None:
+            return await self.get_response(request)
+        token = instrumentation.current_metrics.set(metrics)
+        # ORM calls of an async request run in its thread-sensitive worker thread, which owns
+        # the connection the wrapper has to be attached to.
+        queries = await sync_to_async(instrumentation.watch_queries)(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(queries.close)()
+            instrumentation.current_metrics.reset(token)
+        show_server_timing = (
+            settings.REQUEST_INSTRUMENTATION_SERVER_TIMING
+            and await sync_to_async(self._show_server_timing)(request)
+        )
+        return self._finish(request, response, metrics, show_server_timing)
+
+    def process_template_response(self, request, response):
+        metrics = instrumentation.current_metrics.get()
+        if metrics is not None:
+            render_started = time.perf_counter()
+
+            def record_render_time(rendered_response):
+                metrics.render_time += time.perf_counter() - render_started
+
+            response.add_post_render_callback(record_render_time)
+        return response
+
+    @staticmethod
+    def _start():
+        if not settings.REQUEST_INSTRUMENTATION_ENABLED:
+            return None
+        if random.random() >= settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE:
+            return None
+        return instrumentation.RequestMetrics()
+
+    @staticmethod
+    def _show_server_timing(request) -> bool:
+        if not settings.REQUEST_INSTRUMENTATION_SERVER_TIMING:
+            return False
+        user = getattr(request, 'user', None)
+        return bool(user and user.is_staff)
+
+    def _finish(self, request, response, metrics, show_server_timing):
+        total_ms = metrics.elapsed * 1000
+        db_ms = metrics.db_time * 1000
+        render_ms = metrics.render_time * 1000
+        serializer_ms = metrics.serializer_time * 1000
+        view_ms = max(total_ms - db_ms - render_ms - serializer_ms, 0)
+        if show_server_timing:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={db_ms:.1f};desc="{metrics.query_count} queries"',
+                f'serializer;dur={serializer_ms:.1f}',
+                f'view;dur={view_ms:.1f}',
+                f'render;dur={render_ms:.1f}',
+                f'total;dur={total_ms:.1f}',
+            ])
+
+        exceeded = []
+        if total_ms >= settings.REQUEST_INSTRUMENTATION_SLOW_MS:
+            exceeded.append('latency')
+        if metrics.query_count >= settings.REQUEST_INSTRUMENTATION_MAX_QUERIES:
+            exceeded.append('queries')
+        level = logging.WARNING if exceeded else logging.DEBUG
+        if instrumentation.logger.isEnabledFor(level):
+            resolver_match = request.resolver_match
+            instrumentation.log_request(level, {
+                'method': request.method,
+                'path': request.path,
+                'view': resolver_match.view_name if resolver_match else None,
+                'route': resolver_match.route if resolver_match else None,
+                'status': response.status_code,
+                'total_ms': round(total_ms, 2),
+                'db_ms': round(db_ms, 2),
+                'serializer_ms': round(serializer_ms, 2),
+                'view_ms': round(view_ms, 2),
+                'render_ms': round(render_ms, 2),
+                'queries': metrics.query_count,
+                'response_bytes': None if response.streaming else len(response.content),
+                'exceeded': exceeded,
+                'duplicated_queries': metrics.duplicated_statements() if exceeded else [],
+            })
+        return response
@@ -0,0 +1,146 @@
+import base64
+import binascii
+import json
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db.models import Field, Func, Q, Value
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 3
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class Row(Func):
+    template = '(%(expressions)s)'
+    output_field = Field()
+
+
+class KeysetPagination(BasePagination):
+    ordering = ('-id',)
+    page_size = StandardResultsSetPagination.page_size
+    page_size_query_param = StandardResultsSetPagination.page_size_query_param
+    max_page_size = StandardResultsSetPagination.max_page_size
+    cursor_query_param = 'cursor'
+    legacy_page_query_param = StandardResultsSetPagination.page_query_param
+    invalid_cursor_message = 'cursor inválido'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.legacy_page_query_param in request.query_params:
+            self.legacy = StandardResultsSetPagination()
+            return self.legacy.paginate_queryset(queryset, request, view)
+        self.legacy = None
+        return self._set_page(list(self._page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        if self.legacy_page_query_param in request.query_params:
+            self.legacy = StandardResultsSetPagination()
+            return await sync_to_async(self.legacy.paginate_queryset)(queryset, request, view)
+        self.legacy = None
+        return self._set_page([row async for row in self._page_queryset(queryset, request)])
+
+    def _page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.position, self.reverse = self.decode_cursor(queryset.model, request)
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [self._flip(field) for field in self.ordering]
+        if self.position is not None:
+            queryset = self._after(queryset, self.position, ordering)
+        return queryset.order_by(*ordering)[:self.page_size + 1]
+
+    def _set_page(self, results: list) -> list:
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = self.position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        if self.legacy is not None:
+            return self.legacy.get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, model, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            values, reverse = payload['p'], bool(payload['r'])
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, KeyError, ValidationError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _link(self, instance, reverse: bool) -> str:
+        values = [getattr(instance, field.lstrip('-')) for field in self.ordering]
+        payload = json.dumps({
+            'p': [value.isoformat() if hasattr(value, 'isoformat') else value for value in values],
+            'r': int(reverse),
+        }, separators=(',', ':'))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    @staticmethod
+    def _flip(field: str) -> str:
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _after(queryset, position, ordering):
+        names = [field.lstrip('-') for field in ordering]
+        directions = {field.startswith('-') for field in ordering}
+        if len(directions) == 1:
+            lookup = 'lt' if directions.pop() else 'gt'
+            return queryset.alias(keyset_position=Row(*names)).filter(**{
+                f'keyset_position__{lookup}': Row(*[Value(value) for value in position])
+            })
+
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            equal_prefix = {
+                previous.lstrip('-'): value
+                for previous, value in zip(ordering[:index], position[:index])
+            }
+            condition |= Q(**equal_prefix, **{f'{name}__{lookup}': position[index]})
+        return queryset.filter(condition)
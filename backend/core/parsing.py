@@ -0,0 +1,26 @@
+import datetime
+from decimal import Decimal, InvalidOperation
+
+CENTS = Decimal('0.01')
+
+
+def parse_amount(value, field: str, limit: Decimal) -> Decimal:
+    try:
+        amount = Decimal(str(value if value is not None else '').strip())
+    except InvalidOperation:
+        raise ValueError(f'{field} inválido: {value!r}')
+    if not amount.is_finite() or amount <= 0 or amount >= limit:
+        raise ValueError(f'{field} deve ser um valor positivo: {value!r}')
+    if amount != amount.quantize(CENTS):
+        raise ValueError(f'{field} aceita no máximo 2 casas decimais: {value!r}')
+    return amount.quantize(CENTS)
+
+
+def parse_date(value, field: str) -> datetime.date:
+    value = str(value or '').strip()
+    try:
+        if '/' in value:
+            return datetime.datetime.strptime(value, '%d/%m/%Y').date()
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'{field} inválida, use AAAA-MM-DD ou DD/MM/AAAA: {value!r}')
@@ -0,0 +1,161 @@
+import asyncio
+import datetime
+from decimal import Decimal
+from asgiref.sync import sync_to_async
+from django.db.models import Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce
+
+from assets.models import Asset
+from core.async_orm import afetch
+from dividends.models import ItemDividend
+from expenses.models import MonthlyExpenseSummary
+from expenses.services.monthly_cache_service import CachedMonthlyExpenseLogic
+from expenses.services.monthly_summary_service import SUMMARY_AMOUNT_FIELDS, MonthlySummaryService
+from investiments.models import ItemInvestiment, OrderType
+
+DASHBOARD_SECTIONS = ('user', 'expenses', 'investments', 'dividends', 'assets')
+UPCOMING_BILLS_LIMIT = 10
+MONEY_PLACES = Decimal('0.01')
+
+
+def _money_sum(expression, **kwargs):
+    money_field = DecimalField(max_digits=30, decimal_places=2)
+    return Coalesce(
+        Sum(expression, output_field=money_field, **kwargs),
+        Value(Decimal('0'), output_field=money_field)
+    )
+
+
+def _stringify_amounts(totals: dict) -> dict:
+    return {
+        field: str(value.quantize(MONEY_PLACES)) if isinstance(value, Decimal) else value
+        for field, value in totals.items()
+    }
+
+
+class DashboardService:
+    def __init__(self, user, sections=DASHBOARD_SECTIONS, today: datetime.date | None = None):
+        self.user = user
+        self.sections = sections
+        self.today = today or datetime.date.today()
+
+    def snapshot(self) -> dict:
+        snapshot = {'year': self.today.year, 'month': self.today.month}
+        for section in self.sections:
+            snapshot[section] = getattr(self, f'_{section}')()
+        return snapshot
+
+    async def asnapshot(self) -> dict:
+        snapshot = {'year': self.today.year, 'month': self.today.month}
+        sections = await asyncio.gather(
+            *(getattr(self, f'_a{section}')() for section in self.sections)
+        )
+        snapshot.update(zip(self.sections, sections))
+        return snapshot
+
+    def _user(self) -> dict:
+        return {'id': self.user.id, 'username': self.user.username, 'email': self.user.email}
+
+    async def _auser(self) -> dict:
+        return self._user()
+
+    def _expenses(self) -> dict:
+        self._ensure_summary()
+        totals = self._expense_summaries().aggregate(**self._expense_totals())
+        monthly_expenses = CachedMonthlyExpenseLogic(
+            self.user, self.today.year, self.today.month
+        ).get_monthly_expenses()
+        return self._expenses_section(totals, monthly_expenses)
+
+    async def _aexpenses(self) -> dict:
+        await sync_to_async(self._ensure_summary)()
+        totals, monthly_expenses = await asyncio.gather(
+            self._expense_summaries().aaggregate(**self._expense_totals()),
+            CachedMonthlyExpenseLogic(
+                self.user, self.today.year, self.today.month
+            ).aget_monthly_expenses()
+        )
+        return self._expenses_section(totals, monthly_expenses)
+
+    def _ensure_summary(self) -> None:
+        MonthlySummaryService(self.user).ensure_covered(self.today.year, self.today.month)
+
+    def _expense_summaries(self):
+        return MonthlyExpenseSummary.objects.filter(
+            user=self.user, year=self.today.year, month=self.today.month
+        )
+
+    @staticmethod
+    def _expense_totals() -> dict:
+        return {field: _money_sum(field) for field in SUMMARY_AMOUNT_FIELDS}
+
+    def _expenses_section(self, totals: dict, monthly_expenses: list) -> dict:
+        today = self.today.isoformat()
+        upcoming_bills = [
+            {
+                'id': expense['id'],
+                'name': expense['name'],
+                'amount': str(expense['amount']),
+                'due_date': expense['due_date'],
+                'expense_type': expense['expense_type'],
+                'overdue': expense['due_date'] < today,
+            }
+            for expense in monthly_expenses if not expense['paid']
+        ]
+        return {
+            'totals': _stringify_amounts(totals),
+            'unpaid_count': len(upcoming_bills),
+            'upcoming_bills': upcoming_bills[:UPCOMING_BILLS_LIMIT],
+        }
+
+    def _investments(self) -> dict:
+        return _stringify_amounts(
+            self._investment_items().aggregate(**self._investment_totals())
+        )
+
+    async def _ainvestments(self) -> dict:
+        return _stringify_amounts(
+            await self._investment_items().aaggregate(**self._investment_totals())
+        )
+
+    def _investment_items(self):
+        return ItemInvestiment.objects.filter(
+            user=self.user, card__year=self.today.year, card__month=self.today.month
+        )
+
+    @staticmethod
+    def _investment_totals() -> dict:
+        volume = F('quantity') * F('unit_price')
+        return {
+            'buy_volume': _money_sum(volume, filter=Q(order_type=OrderType.BUY)),
+            'sell_volume': _money_sum(volume, filter=Q(order_type=OrderType.SELL)),
+            'operations': Count('id'),
+        }
+
+    def _dividends(self) -> dict:
+        return self._dividends_section(list(self._dividend_items()))
+
+    async def _adividends(self) -> dict:
+        return self._dividends_section(await afetch(self._dividend_items()))
+
+    def _dividend_items(self):
+        return ItemDividend.objects.filter(
+            user=self.user,
+            card_month__year=self.today.year,
+            card_month__month=self.today.month
+        ).order_by('received_date', 'id').values(
+            'id', 'value', 'received_date', code=F('asset__code')
+        )
+
+    @staticmethod
+    def _dividends_section(items: list) -> dict:
+        return {
+            'total': str(sum((item['value'] for item in items), Decimal('0.00'))),
+            'payments': [{**item, 'value': str(item['value'])} for item in items],
+        }
+
+    def _assets(self) -> dict:
+        return {'count': Asset.objects.filter(user=self.user).count()}
+
+    async def _aassets(self) -> dict:
+        return {'count': await Asset.objects.filter(user=self.user).acount()}
@@ -0,0 +1,38 @@
+import os
+from django.db import connections
+
+
+def get_pool_stats(alias: str = 'default') -> dict:
+    connection = connections[alias]
+    pool = getattr(connection, 'pool', None)
+    stats = {
+        'alias': alias,
+        'vendor': connection.vendor,
+        'pid': os.getpid(),
+        'pooled': pool is not None,
+    }
+    if pool is None:
+        return stats
+
+    raw = pool.get_stats()
+    size = raw.get('pool_size', 0)
+    available = raw.get('pool_available', 0)
+    queued = raw.get('requests_queued', 0)
+    wait_ms = raw.get('requests_wait_ms', 0)
+    stats.update({
+        'min_size': raw.get('pool_min', pool.min_size),
+        'max_size': raw.get('pool_max', pool.max_size),
+        'size': size,
+        'available': available,
+        'in_use': size - available,
+        'waiting': raw.get('requests_waiting', 0),
+        'requests': raw.get('requests_num', 0),
+        'requests_queued': queued,
+        'wait_ms_total': wait_ms,
+        'wait_ms_avg': round(wait_ms / queued, 2) if queued else 0.0,
+        'request_errors': raw.get('requests_errors', 0),
+        'connections_opened': raw.get('connections_num', 0),
+        'connections_lost': raw.get('connections_lost', 0),
+        'returns_bad': raw.get('returns_bad', 0),
+    })
+    return stats
@@ -29,6 +29,7 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
     "django_filters",
+    "core",
     "costumers",
     "authentication",
     "dividends",
@@ -38,6 +39,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestInstrumentationMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -74,6 +76,10 @@ if DJANGO_ENV == 'PRODUCTION':
             conn_max_age=600
         )
     }
+elif config('DATABASE_URL', default=''):
+    DATABASES = {
+        "default": dj_database_url.config()
+    }
 else:
     DATABASES = {
         "default": {
@@ -82,6 +88,31 @@ else:
         }
     }
 
+DATABASE_POOL_ENABLED = config('DATABASE_POOL_ENABLED', default=False, cast=bool)
+if DATABASE_POOL_ENABLED and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = config(
+        'DATABASE_POOL_CHECK', default=True, cast=bool
+    )
+    DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+        'name': 'default',
+        'min_size': config('DATABASE_POOL_MIN_SIZE', default=2, cast=int),
+        'max_size': config('DATABASE_POOL_MAX_SIZE', default=10, cast=int),
+        'timeout': config('DATABASE_POOL_TIMEOUT', default=10, cast=float),
+        'max_idle': config('DATABASE_POOL_MAX_IDLE', default=300, cast=float),
+        'max_lifetime': config('DATABASE_POOL_MAX_LIFETIME', default=1800, cast=float),
+    }
+
+CACHES = {
+    'default': {
+        'BACKEND': config(
+            'CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': config('CACHE_LOCATION', default='shadow-finance'),
+    }
+}
+CACHE_IS_SHARED = not CACHES['default']['BACKEND'].endswith(('LocMemCache', 'DummyCache'))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -111,9 +142,55 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
+REQUEST_INSTRUMENTATION_ENABLED = config(
+    'REQUEST_INSTRUMENTATION_ENABLED', default=False, cast=bool
+)
+REQUEST_INSTRUMENTATION_SAMPLE_RATE = config(
+    'REQUEST_INSTRUMENTATION_SAMPLE_RATE', default=0.05, cast=float
+)
+REQUEST_INSTRUMENTATION_SERVER_TIMING = config(
+    'REQUEST_INSTRUMENTATION_SERVER_TIMING', default=True, cast=bool
+)
+REQUEST_INSTRUMENTATION_SLOW_MS = config('REQUEST_INSTRUMENTATION_SLOW_MS', default=500, cast=int)
+REQUEST_INSTRUMENTATION_MAX_QUERIES = config(
+    'REQUEST_INSTRUMENTATION_MAX_QUERIES', default=30, cast=int
+)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'instrumentation': {'class': 'logging.StreamHandler', 'formatter': 'message'},
+    },
+    'loggers': {
+        'core.instrumentation': {
+            'handlers': ['instrumentation'],
+            'level': config('REQUEST_INSTRUMENTATION_LOG_LEVEL', default='WARNING'),
+            'propagate': False,
+        },
+    },
+}
+
+SERVER_MODE = config('SERVER_MODE', default='wsgi')
+ASYNC_VIEWS_ENABLED = config('ASYNC_VIEWS_ENABLED', default=SERVER_MODE == 'asgi', cast=bool)
+
+AUTH_USER_CACHE_ENABLED = config('AUTH_USER_CACHE_ENABLED', default=False, cast=bool)
+AUTH_USER_CACHE_SIZE = config('AUTH_USER_CACHE_SIZE', default=1024, cast=int)
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=60, cast=int)
+if AUTH_USER_CACHE_ENABLED and not CACHE_IS_SHARED:
+    raise ValueError(
+        "AUTH_USER_CACHE_ENABLED exige um CACHE_BACKEND compartilhado entre os workers."
+    )
+AUTH_REVOCATION_FILTER_ENABLED = config('AUTH_REVOCATION_FILTER_ENABLED', default=True, cast=bool)
+AUTH_REVOCATION_SYNC_INTERVAL = config('AUTH_REVOCATION_SYNC_INTERVAL', default=5, cast=int)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'authentication.authentication.CookieJWTAuthentication',
+        'authentication.authentication.CachedCookieJWTAuthentication'
+        if AUTH_USER_CACHE_ENABLED else 'authentication.authentication.CookieJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -121,7 +198,7 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'dividends.pagination.StandardResultsSetPagination'
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.StandardResultsSetPagination'
 }
 
 SIMPLE_JWT = {
@@ -131,6 +208,18 @@ SIMPLE_JWT = {
 
 AUTH_USER_MODEL = 'costumers.CustomUser'
 
+EXPENSE_SUMMARY_HORIZON_MONTHS = config('EXPENSE_SUMMARY_HORIZON_MONTHS', default=24, cast=int)
+MONTHLY_VIEW_CACHE_TIMEOUT = config('MONTHLY_VIEW_CACHE_TIMEOUT', default=60 * 60, cast=int)
+PORTFOLIO_TIMESERIES_CACHE_TIMEOUT = config(
+    'PORTFOLIO_TIMESERIES_CACHE_TIMEOUT', default=60 * 60, cast=int
+)
+DIVIDEND_ANALYTICS_CACHE_TIMEOUT = config(
+    'DIVIDEND_ANALYTICS_CACHE_TIMEOUT', default=60 * 60, cast=int
+)
+DIVIDEND_PROJECTION_CACHE_TIMEOUT = config(
+    'DIVIDEND_PROJECTION_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int
+)
+
 if DEBUG:
     CORS_ALLOW_ALL_ORIGINS = True
 else:
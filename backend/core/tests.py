@@ -0,0 +1,173 @@
+import datetime
+import json
+from decimal import Decimal
+from io import StringIO
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from assets.models import Asset
+from core.services.dashboard_service import DashboardService
+from costumers.models import CustomUser
+from dividends.models import CardDividendMonth, ItemDividend
+from expenses.models import Category, Expense, RecurringExpense
+from investiments.models import CardInvestiment, ItemInvestiment, OrderType
+
+
+@override_settings(
+    REQUEST_INSTRUMENTATION_ENABLED=True,
+    REQUEST_INSTRUMENTATION_SAMPLE_RATE=1.0,
+    REQUEST_INSTRUMENTATION_SERVER_TIMING=True
+)
+class RequestInstrumentationMiddlewareTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='staff', password='staff-password', is_staff=True
+        )
+        for index in range(5):
+            Category.objects.create(user=self.user, name=f'Categoria {index}')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _server_timing(self, response) -> dict:
+        metrics = {}
+        for entry in response['Server-Timing'].split(', '):
+            name, duration = entry.split(';')[:2]
+            metrics[name] = float(duration.removeprefix('dur='))
+        return metrics
+
+    def test_staff_responses_report_every_phase(self):
+        response = self.client.get(reverse('expense-category-list'))
+
+        self.assertEqual(response.status_code, 200)
+        metrics = self._server_timing(response)
+        self.assertEqual(list(metrics), ['db', 'serializer', 'view', 'render', 'total'])
+        self.assertGreater(metrics['serializer'], 0)
+        self.assertLessEqual(
+            metrics['db'] + metrics['serializer'] + metrics['render'], metrics['total']
+        )
+
+    def test_non_staff_responses_omit_server_timing(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.get(reverse('expense-category-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(REQUEST_INSTRUMENTATION_ENABLED=False)
+    def test_disabled_instrumentation_adds_nothing(self):
+        response = self.client.get(reverse('expense-category-list'))
+        self.assertNotIn('Server-Timing', response)
+
+
+class DashboardViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='dashboard', password='dashboard')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        first_day = datetime.date.today().replace(day=1)
+        Expense.objects.create(
+            user=self.user, name='Internet', amount=Decimal('120.50'), due_date=first_day
+        )
+        RecurringExpense.objects.create(
+            user=self.user, name='Academia', amount=Decimal('50.00'), due_day=1,
+            start_date=first_day
+        )
+        asset = Asset.objects.create(user=self.user, code='BBSE3', type='ACAO')
+        ItemInvestiment.objects.create(
+            card=CardInvestiment.objects.create(
+                user=self.user, year=first_day.year, month=first_day.month
+            ),
+            asset=asset, order_type=OrderType.BUY, quantity=Decimal('2.5'),
+            unit_price=Decimal('49.38'), operation_date=first_day
+        )
+        ItemDividend.objects.create(
+            card_month=CardDividendMonth.objects.create(
+                user=self.user, year=first_day.year, month=first_day.month
+            ),
+            asset=asset, value=Decimal('8.50'), received_date=first_day
+        )
+
+    def _assert_amounts_are_strings(self, snapshot: dict):
+        totals = snapshot['expenses']['totals']
+        self.assertEqual(totals['unpaid_amount'], '170.50')
+        self.assertEqual(totals['paid_amount'], '0.00')
+        self.assertEqual(
+            sorted(bill['amount'] for bill in snapshot['expenses']['upcoming_bills']),
+            ['120.50', '50.00']
+        )
+        self.assertEqual(snapshot['investments'], {
+            'buy_volume': '123.45', 'sell_volume': '0.00', 'operations': 1
+        })
+        self.assertEqual(snapshot['dividends']['total'], '8.50')
+        self.assertEqual(snapshot['dividends']['payments'][0]['value'], '8.50')
+
+    def test_amounts_are_decimal_strings(self):
+        response = self.client.get(reverse('dashboard'))
+
+        self.assertEqual(response.status_code, 200)
+        self._assert_amounts_are_strings(response.data)
+
+    def test_async_snapshot_matches_the_sync_one(self):
+        snapshot = async_to_sync(DashboardService(self.user).asnapshot)()
+
+        self._assert_amounts_are_strings(snapshot)
+        self.assertEqual(snapshot, DashboardService(self.user).snapshot())
+
+    def test_unknown_sections_are_rejected(self):
+        response = self.client.get(reverse('dashboard'), {'sections': 'expenses,salary'})
+        self.assertEqual(response.status_code, 400)
+
+
+class MonthlyExpenseCacheStatsViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = CustomUser.objects.create_user(
+            username='admin', password='admin-password', is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_monthly_view_reads_are_counted(self):
+        params = {'due_date__year': 2025, 'due_date__month': 1}
+        for _ in range(3):
+            self.client.get(reverse('monthly-expenses-view'), params)
+
+        response = self.client.get(reverse('instrumentation-monthly-expenses-cache'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {
+            'hits': 2, 'misses': 1, 'hit_ratio': 0.6667, 'shared': False
+        })
+
+    def test_non_admin_users_are_forbidden(self):
+        self.admin.is_staff = False
+        self.admin.save()
+
+        response = self.client.get(reverse('instrumentation-monthly-expenses-cache'))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class BenchmarkEndpointsCommandTest(TestCase):
+    def test_every_default_endpoint_answers(self):
+        CustomUser.objects.create_user(username='bench0', password='bench0-password')
+        output = StringIO()
+
+        call_command('benchmark_endpoints', iterations=1, warmup=0, stdout=output)
+
+        endpoints = json.loads(output.getvalue())['endpoints']
+        self.assertEqual(
+            [(endpoint['name'], endpoint['status']) for endpoint in endpoints],
+            [(endpoint['name'], 200) for endpoint in endpoints]
+        )
+        self.assertTrue({
+            'dashboard', 'positions', 'capital-gains', 'portfolio-timeseries',
+            'dividend-analytics', 'dividend-projection'
+        } <= {endpoint['name'] for endpoint in endpoints})
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from core.views import DashboardView, DatabasePoolStatsView, MonthlyExpenseCacheStatsView
+
 
 urlpatterns = [
     path('api/v1/', include('expenses.urls')),
@@ -9,5 +11,16 @@ urlpatterns = [
     path('api/v1/', include('dividends.urls')),
     path('api/v1/', include('assets.urls')),
     path('api/v1/', include('investiments.urls')),
+    path('api/v1/dashboard/', DashboardView.as_view(), name='dashboard'),
+    path(
+        'api/v1/instrumentation/db-pool/',
+        DatabasePoolStatsView.as_view(),
+        name='instrumentation-db-pool'
+    ),
+    path(
+        'api/v1/instrumentation/monthly-expenses-cache/',
+        MonthlyExpenseCacheStatsView.as_view(),
+        name='instrumentation-monthly-expenses-cache'
+    ),
     path("admin/", admin.site.urls),
 ]
@@ -0,0 +1,60 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.async_views import AsyncAPIView
+from core.services.dashboard_service import DASHBOARD_SECTIONS, DashboardService
+from core.services.db_pool_service import get_pool_stats
+from expenses.services.monthly_cache_service import get_cache_stats
+
+
+class DashboardView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        sections = self._get_sections(request)
+        if sections is None:
+            return self._invalid_sections_response()
+        return Response(DashboardService(request.user, sections).snapshot())
+
+    async def aget(self, request, *args, **kwargs):
+        sections = self._get_sections(request)
+        if sections is None:
+            return self._invalid_sections_response()
+        return Response(await DashboardService(request.user, sections).asnapshot())
+
+    @staticmethod
+    def _get_sections(request) -> tuple | None:
+        sections = request.query_params.get('sections')
+        if not sections:
+            return DASHBOARD_SECTIONS
+        sections = tuple(dict.fromkeys(
+            section.strip() for section in sections.split(',') if section.strip()
+        ))
+        invalid = [section for section in sections if section not in DASHBOARD_SECTIONS]
+        if invalid or not sections:
+            return None
+        return sections
+
+    @staticmethod
+    def _invalid_sections_response() -> Response:
+        return Response(
+            {'error': f'seções inválidas, use: {", ".join(DASHBOARD_SECTIONS)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+class DatabasePoolStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_pool_stats())
+
+
+class MonthlyExpenseCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response({**get_cache_stats(), 'shared': settings.CACHE_IS_SHARED})
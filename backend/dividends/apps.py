@@ -5,3 +5,6 @@ class DividendConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dividends"
     verbose_name = 'Dividendos'
+
+    def ready(self):
+        from . import signals  # noqa: F401
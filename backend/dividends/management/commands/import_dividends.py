@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from costumers.models import CustomUser
+from dividends.services.dividend_import_service import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    DividendImportService,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa um extrato de dividendos (CSV ou JSON lines) com os campos '
+        'code,value,received_date; linhas já importadas são ignoradas'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--user', type=int, required=True, dest='user_id')
+        parser.add_argument(
+            '--format',
+            choices=IMPORT_FORMATS,
+            help='formato do arquivo; padrão: deduzido pela extensão'
+        )
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(pk=options['user_id'])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"usuário {options['user_id']} não encontrado")
+
+        path = options['path']
+        file_format = options['format'] or (
+            'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv'
+        )
+        service = DividendImportService(user, chunk_size=options['chunk_size'])
+        try:
+            with open(path, newline='', encoding='utf-8-sig') as statement_file:
+                result = service.import_file(statement_file, file_format)
+        except OSError as error:
+            raise CommandError(f'não foi possível ler {path}: {error}')
+
+        for error in result.errors[:20]:
+            self.stderr.write(f"{path}:{error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f'{path}: {result.imported} dividendos importados, '
+            f'{result.duplicates} já existentes, {result.created_cards} cards criados, '
+            f'{result.error_count} linhas com erro'
+        ))
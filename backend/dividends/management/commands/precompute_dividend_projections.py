@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from costumers.models import CustomUser
+from dividends.models import ItemDividend
+from dividends.services.projection_cache_service import CachedDividendProjection
+
+
+class Command(BaseCommand):
+    help = 'Calcula e grava em cache a projeção de dividendos dos próximos 12 meses'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='id do usuário (pode ser repetido); padrão: todos com dividendos'
+        )
+
+    def handle(self, *args, **options):
+        if not settings.CACHE_IS_SHARED:
+            raise CommandError(
+                'o CACHE_BACKEND atual é local ao processo; configure um cache compartilhado '
+                'para que os workers enxerguem as projeções calculadas'
+            )
+        user_ids = ItemDividend.objects.values('user_id')
+        users = CustomUser.objects.filter(pk__in=user_ids).order_by('pk')
+        if options['user_ids']:
+            users = users.filter(pk__in=options['user_ids'])
+
+        computed = 0
+        for user in users.iterator():
+            CachedDividendProjection(user).refresh()
+            computed += 1
+        self.stdout.write(
+            self.style.SUCCESS(f'projeções calculadas para {computed} usuário(s)')
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_assetprice"),
+        ("dividends", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="itemdividend",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                null=True,
+                verbose_name="Hash Do Extrato",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="itemdividend",
+            constraint=models.UniqueConstraint(
+                fields=("card_month", "content_hash"),
+                name="unique_dividend_statement_row",
+            ),
+        ),
+    ]
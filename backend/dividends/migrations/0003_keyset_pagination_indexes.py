@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_assetprice"),
+        ("dividends", "0002_itemdividend_content_hash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="carddividendmonth",
+            index=models.Index(
+                fields=["user", "-year", "-month", "-id"],
+                name="card_div_user_period_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="itemdividend",
+            index=models.Index(
+                fields=["-received_date", "-id"], name="item_div_date_idx"
+            ),
+        ),
+    ]
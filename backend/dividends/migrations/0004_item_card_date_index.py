@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_assetprice"),
+        ("dividends", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="itemdividend",
+            name="item_div_date_idx",
+        ),
+        migrations.AddIndex(
+            model_name="itemdividend",
+            index=models.Index(
+                fields=["card_month", "-received_date", "-id"],
+                name="item_div_card_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dividends", "0005_itemdividend_user"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="itemdividend",
+            name="user",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="dividend_items",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Usuário",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="itemdividend",
+            index=models.Index(
+                fields=["user", "-received_date", "-id"], name="item_div_user_date_idx"
+            ),
+        ),
+    ]
@@ -15,6 +15,11 @@ class CardDividendMonth(models.Model):
         verbose_name_plural = 'Cards de Dividendos do mês'
         unique_together = ('user', 'month', 'year')
         ordering = ['-year', '-month']
+        indexes = [
+            models.Index(
+                fields=['user', '-year', '-month', '-id'], name='card_div_user_period_idx'
+            ),
+        ]
 
 
 class ItemDividend(models.Model):
@@ -24,11 +29,42 @@ class ItemDividend(models.Model):
         related_name='itens',
         verbose_name='Card Do Mês'
     )
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='dividend_items',
+        verbose_name='Usuário',
+        editable=False
+    )
     asset = models.ForeignKey(Asset, on_delete=models.CASCADE, verbose_name='Ativo')
     value = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Valor')
     received_date = models.DateField(verbose_name='Data de Recebimento')
+    content_hash = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Hash Do Extrato'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         verbose_name = 'Item de Dividendo Do Mês'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['card_month', '-received_date', '-id'], name='item_div_card_date_idx'
+            ),
+            models.Index(
+                fields=['user', '-received_date', '-id'], name='item_div_user_date_idx'
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['card_month', 'content_hash'], name='unique_dividend_statement_row'
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        self.user_id = self.card_month.user_id
+        super().save(*args, **kwargs)
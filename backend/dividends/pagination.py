@@ -1,7 +1,9 @@
-from rest_framework.pagination import PageNumberPagination
+from core.pagination import KeysetPagination
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 3
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+class CardDividendMonthKeysetPagination(KeysetPagination):
+    ordering = ('-year', '-month', '-id')
+
+
+class ItemDividendKeysetPagination(KeysetPagination):
+    ordering = ('-received_date', '-id')
@@ -3,9 +3,10 @@ from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 from assets.serializer import AssetSerializer
 from assets.models import Asset
+from core.instrumentation import TimedSerializerMixin
 
 
-class ItemDividendSerializer(serializers.ModelSerializer):
+class ItemDividendSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     asset = AssetSerializer(read_only=True)
     asset_id = serializers.PrimaryKeyRelatedField(
         queryset=Asset.objects.all(), source='asset', write_only=True
@@ -19,7 +20,7 @@ class ItemDividendSerializer(serializers.ModelSerializer):
         }
 
 
-class CardDividendMonthSerializer(serializers.ModelSerializer):
+class CardDividendMonthSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
     itens = ItemDividendSerializer(many=True, read_only=True)
 
@@ -0,0 +1,65 @@
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.cache_versions import bump_version, bump_version_on_commit, get_version
+from dividends.models import CardDividendMonth
+from dividends.services.dividend_analytics_service import DividendAnalyticsService
+
+VERSION_KEY = 'dividends:data-version:{user_id}'
+ANALYTICS_KEY = 'dividends:analytics:v2:{user_id}:{version}:{year}'
+
+_pending = threading.local()
+
+
+def get_data_version(user_id: int) -> int:
+    return get_version(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_data_version_on_commit(user_id: int) -> None:
+    bump_version_on_commit(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_card_data_version_on_commit(card_month_id: int) -> None:
+    if not hasattr(_pending, 'card_users'):
+        _pending.card_users = {}
+        _pending.users = set()
+    if card_month_id not in _pending.card_users:
+        _pending.card_users[card_month_id] = CardDividendMonth.objects.filter(
+            pk=card_month_id
+        ).values_list('user_id', flat=True).first()
+    user_id = _pending.card_users[card_month_id]
+    if user_id is not None:
+        _pending.users.add(user_id)
+        transaction.on_commit(flush_pending_versions)
+
+
+def flush_pending_versions() -> None:
+    users = getattr(_pending, 'users', None)
+    if not users:
+        return
+    _pending.card_users = {}
+    _pending.users = set()
+    for user_id in users:
+        bump_version(VERSION_KEY.format(user_id=user_id))
+
+
+class CachedDividendAnalytics:
+    def __init__(self, user, year: int | None = None):
+        self.user = user
+        self.year = year
+        self.hit = False
+
+    def analytics(self) -> dict:
+        key = ANALYTICS_KEY.format(
+            user_id=self.user.pk, version=get_data_version(self.user.pk), year=self.year
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            self.hit = True
+            return cached
+
+        analytics = DividendAnalyticsService(self.user, self.year).analytics()
+        cache.set(key, analytics, timeout=settings.DIVIDEND_ANALYTICS_CACHE_TIMEOUT)
+        return analytics
@@ -0,0 +1,105 @@
+from decimal import Decimal
+from django.db.models import Count, F, Func, Max, Sum, Window
+from django.db.models.functions import Lag, Rank
+
+from dividends.models import ItemDividend
+
+MONEY_PLACES = Decimal('0.01')
+SHARE_PLACES = Decimal('0.0001')
+
+
+MONEY_FIELDS = ('total', 'previous_total', 'year_to_date')
+
+
+class WindowSum(Func):
+    function = 'SUM'
+    window_compatible = True
+
+
+def quantize_money(row: dict) -> dict:
+    for field in MONEY_FIELDS:
+        if row.get(field) is not None:
+            row[field] = str(Decimal(row[field]).quantize(MONEY_PLACES))
+    return row
+
+
+class DividendAnalyticsService:
+    def __init__(self, user, year: int | None = None):
+        self.user = user
+        self.year = year
+
+    def analytics(self) -> dict:
+        years = self.by_year()
+        return {
+            'year': self.year,
+            'total': str(sum((Decimal(row['total']) for row in years), Decimal('0.00'))),
+            'by_year': years,
+            'by_month': self.by_month(),
+            'by_asset': self.by_asset(),
+            'by_type': self.by_type(),
+        }
+
+    def _items(self, filter_year=True):
+        items = ItemDividend.objects.filter(user=self.user)
+        if filter_year and self.year is not None:
+            items = items.filter(card_month__year=self.year)
+        return items.order_by()
+
+    def by_year(self) -> list[dict]:
+        rows = self._items(filter_year=False).values(year=F('card_month__year')).annotate(
+            total=Sum('value'), payments=Count('id')
+        ).annotate(
+            previous_total=Window(Lag('total'), order_by=F('year').asc())
+        ).order_by('year')
+        return [
+            self._year_row(row) for row in rows if self.year is None or row['year'] == self.year
+        ]
+
+    @staticmethod
+    def _year_row(row: dict) -> dict:
+        previous_total = row.pop('previous_total')
+        growth = None
+        if previous_total:
+            growth = str(
+                ((row['total'] - previous_total) / previous_total).quantize(SHARE_PLACES)
+            )
+        return quantize_money({**row, 'previous_total': previous_total, 'growth': growth})
+
+    def by_month(self) -> list[dict]:
+        rows = self._items().values(
+            year=F('card_month__year'), month=F('card_month__month')
+        ).annotate(
+            total=Sum('value'), payments=Count('id')
+        ).annotate(
+            year_to_date=Window(
+                WindowSum('total'), partition_by=F('year'), order_by=F('month').asc()
+            )
+        ).order_by('year', 'month')
+        return [quantize_money(row) for row in rows]
+
+    def by_asset(self) -> list[dict]:
+        rows = self._items().values(
+            'asset_id', code=F('asset__code'), type=F('asset__type')
+        ).annotate(
+            total=Sum('value'), payments=Count('id'), last_received_date=Max('received_date')
+        ).annotate(
+            rank=Window(Rank(), order_by=F('total').desc()),
+            grand_total=Window(WindowSum('total'))
+        ).order_by('rank', 'code')
+        return [self._with_share(row) for row in rows]
+
+    def by_type(self) -> list[dict]:
+        rows = self._items().values(type=F('asset__type')).annotate(
+            total=Sum('value'), payments=Count('id')
+        ).annotate(
+            grand_total=Window(WindowSum('total'))
+        ).order_by('-total')
+        return [self._with_share(row) for row in rows]
+
+    @staticmethod
+    def _with_share(row: dict) -> dict:
+        grand_total = row.pop('grand_total')
+        row['share'] = (
+            str((row['total'] / grand_total).quantize(SHARE_PLACES)) if grand_total else None
+        )
+        return quantize_money(row)
@@ -0,0 +1,156 @@
+import csv
+import hashlib
+import json
+from collections import defaultdict
+from decimal import Decimal
+from django.db import transaction
+
+from assets.models import Asset
+from core.parsing import parse_amount, parse_date
+from dividends.models import CardDividendMonth, ItemDividend
+from dividends.services.analytics_cache_service import bump_data_version_on_commit
+
+IMPORT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+IMPORT_FORMATS = ('csv', 'jsonl')
+VALUE_LIMIT = Decimal('1e8')
+
+
+class DividendImportResult:
+    def __init__(self):
+        self.imported = 0
+        self.duplicates = 0
+        self.created_cards = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line: int, error: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': error})
+
+    def as_dict(self) -> dict:
+        return {
+            'imported': self.imported,
+            'duplicates': self.duplicates,
+            'created_cards': self.created_cards,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
+
+
+def iter_csv_rows(file):
+    reader = csv.DictReader(file)
+    for line_number, row in enumerate(reader, start=2):
+        yield line_number, row
+
+
+def iter_jsonl_rows(file):
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line, parse_float=Decimal)
+        except ValueError as error:
+            yield line_number, error
+            continue
+        yield line_number, row if isinstance(row, dict) else ValueError('esperado um objeto JSON')
+
+
+class DividendImportService:
+    def __init__(self, user, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.assets = dict(Asset.objects.filter(user=user).values_list('code', 'id'))
+        self.cards = {
+            (year, month): card_id
+            for year, month, card_id in CardDividendMonth.objects.filter(
+                user=user
+            ).values_list('year', 'month', 'id')
+        }
+        self.occurrences = defaultdict(int)
+
+    def import_file(self, file, file_format: str = 'csv') -> DividendImportResult:
+        rows = iter_jsonl_rows(file) if file_format == 'jsonl' else iter_csv_rows(file)
+        result = DividendImportResult()
+        chunk = []
+        line_number = 0
+        try:
+            for line_number, row in rows:
+                if isinstance(row, Exception):
+                    result.add_error(line_number, f'linha JSON inválida: {row}')
+                    continue
+                try:
+                    chunk.append(self._build_item(row))
+                except (ValueError, AttributeError) as error:
+                    result.add_error(line_number, str(error))
+                    continue
+                if len(chunk) >= self.chunk_size:
+                    self._save_chunk(chunk, result)
+                    chunk = []
+            if chunk:
+                self._save_chunk(chunk, result)
+        except (csv.Error, UnicodeDecodeError) as error:
+            result.add_error(line_number + 1, f'arquivo inválido: {error}')
+        return result
+
+    def _build_item(self, row: dict) -> ItemDividend:
+        code = str(row.get('code') or '').upper().strip()
+        asset_id = self.assets.get(code)
+        if asset_id is None:
+            raise ValueError(f'ativo não cadastrado: {code!r}')
+        value = parse_amount(row.get('value'), 'value', VALUE_LIMIT)
+        received_date = parse_date(row.get('received_date'), 'data de recebimento')
+
+        row_key = f'{code}|{received_date.isoformat()}|{value}'
+        self.occurrences[row_key] += 1
+        content_hash = hashlib.sha256(
+            f'{row_key}|{self.occurrences[row_key]}'.encode()
+        ).hexdigest()
+        return ItemDividend(
+            asset_id=asset_id,
+            value=value,
+            received_date=received_date,
+            content_hash=content_hash
+        )
+
+    @transaction.atomic
+    def _save_chunk(self, chunk: list[ItemDividend], result: DividendImportResult) -> None:
+        result.created_cards += self._create_missing_cards(chunk)
+        for item in chunk:
+            item.card_month_id = self.cards[(item.received_date.year, item.received_date.month)]
+            item.user = self.user
+
+        existing = ItemDividend.objects.filter(
+            card_month_id__in={item.card_month_id for item in chunk},
+            content_hash__in=[item.content_hash for item in chunk]
+        ).count()
+        ItemDividend.objects.bulk_create(chunk, batch_size=1000, ignore_conflicts=True)
+        result.imported += len(chunk) - existing
+        result.duplicates += existing
+        if len(chunk) > existing:
+            bump_data_version_on_commit(self.user.pk)
+
+    def _create_missing_cards(self, chunk: list[ItemDividend]) -> int:
+        missing = {
+            (item.received_date.year, item.received_date.month) for item in chunk
+        } - self.cards.keys()
+        if not missing:
+            return 0
+        self._load_cards(missing)
+        to_create = missing - self.cards.keys()
+        if not to_create:
+            return 0
+        CardDividendMonth.objects.bulk_create([
+            CardDividendMonth(year=year, month=month, user=self.user) for year, month in to_create
+        ], ignore_conflicts=True)
+        self._load_cards(to_create)
+        return len(to_create)
+
+    def _load_cards(self, keys: set) -> None:
+        self.cards.update({
+            (year, month): card_id
+            for year, month, card_id in CardDividendMonth.objects.filter(
+                user=self.user, year__in={year for year, _ in keys}
+            ).values_list('year', 'month', 'id')
+        })
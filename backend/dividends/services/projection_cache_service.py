@@ -0,0 +1,42 @@
+import datetime
+from django.conf import settings
+from django.core.cache import cache
+
+from dividends.services.analytics_cache_service import get_data_version
+from dividends.services.projection_service import DividendProjectionService
+from investiments.services.portfolio_cache_service import (
+    get_data_version as get_investments_version,
+)
+
+PROJECTION_KEY = 'dividends:projection:v2:{user_id}:{version}:{investments_version}:{date}'
+
+
+class CachedDividendProjection:
+    def __init__(self, user, reference_date: datetime.date | None = None):
+        self.user = user
+        self.reference_date = reference_date or datetime.date.today()
+        self.hit = False
+
+    @property
+    def key(self) -> str:
+        return PROJECTION_KEY.format(
+            user_id=self.user.pk,
+            version=get_data_version(self.user.pk),
+            investments_version=get_investments_version(self.user.pk),
+            date=self.reference_date.isoformat()
+        )
+
+    def project(self) -> dict:
+        key = self.key
+        cached = cache.get(key)
+        if cached is not None:
+            self.hit = True
+            return cached
+        return self.refresh(key)
+
+    def refresh(self, key: str | None = None) -> dict:
+        projection = DividendProjectionService(self.user, self.reference_date).project()
+        cache.set(
+            key or self.key, projection, timeout=settings.DIVIDEND_PROJECTION_CACHE_TIMEOUT
+        )
+        return projection
@@ -0,0 +1,171 @@
+import datetime
+from bisect import bisect_right
+from collections import defaultdict
+from decimal import Decimal
+from statistics import median
+from dateutil.relativedelta import relativedelta
+
+from assets.models import Asset
+from dividends.models import ItemDividend
+from investiments.models import PositionSnapshot
+
+MONEY_PLACES = Decimal('0.01')
+PER_SHARE_PLACES = Decimal('0.000001')
+PERIODICITIES = (1, 2, 3, 6, 12)
+HISTORY_MONTHS = 24
+PROJECTION_MONTHS = 12
+AVERAGE_WINDOW_MONTHS = 12
+STALE_PERIODS = 2
+
+
+def month_index(date: datetime.date) -> int:
+    return date.year * 12 + date.month - 1
+
+
+def month_from_index(index: int) -> tuple[int, int]:
+    return index // 12, index % 12 + 1
+
+
+def _decimal_str(value: Decimal | None) -> str | None:
+    return None if value is None else str(value)
+
+
+class AssetPaymentPattern:
+    def __init__(self, asset_id: int):
+        self.asset_id = asset_id
+        self.payments = []
+
+    def add(self, month: int, value: Decimal, quantity: Decimal) -> None:
+        self.payments.append((month, value, quantity))
+
+    @property
+    def periodicity(self) -> int:
+        months = sorted({month for month, _, _ in self.payments})
+        if len(months) < 2:
+            return 12
+        gap = median(later - earlier for earlier, later in zip(months, months[1:]))
+        return min(PERIODICITIES, key=lambda periodicity: abs(periodicity - gap))
+
+    @property
+    def last_month(self) -> int:
+        return max(month for month, _, _ in self.payments)
+
+    def next_month_after(self, current_month: int) -> int:
+        next_month = self.last_month + self.periodicity
+        while next_month <= current_month:
+            next_month += self.periodicity
+        return next_month
+
+    def expected_payment(self, quantity: Decimal | None) -> tuple[Decimal | None, Decimal]:
+        window = max(AVERAGE_WINDOW_MONTHS, self.periodicity)
+        recent = [payment for payment in self.payments if payment[0] > self.last_month - window]
+        per_share = [value / held for _, value, held in recent if held > 0]
+        if per_share and quantity is not None:
+            average_per_share = sum(per_share) / len(per_share)
+            return average_per_share.quantize(PER_SHARE_PLACES), average_per_share * quantity
+        return None, sum(value for _, value, _ in recent) / len(recent)
+
+
+class DividendProjectionService:
+    def __init__(self, user, reference_date: datetime.date | None = None):
+        self.user = user
+        self.reference_date = reference_date or datetime.date.today()
+
+    def project(self) -> dict:
+        current_month = month_index(self.reference_date)
+        history_start = self.reference_date.replace(day=1) - relativedelta(months=HISTORY_MONTHS)
+        quantities = self._quantity_history()
+
+        patterns = {}
+        history = ItemDividend.objects.filter(
+            user=self.user,
+            received_date__gte=history_start,
+            received_date__lte=self.reference_date
+        ).order_by('received_date').values_list('asset_id', 'received_date', 'value')
+        for asset_id, received_date, value in history:
+            month = month_index(received_date)
+            pattern = patterns.setdefault(asset_id, AssetPaymentPattern(asset_id))
+            pattern.add(month, value, self._quantity_before(quantities.get(asset_id), month))
+
+        assets = Asset.objects.in_bulk(patterns.keys())
+        monthly = defaultdict(list)
+        asset_rows = []
+        for asset_id, pattern in patterns.items():
+            if current_month - pattern.last_month > STALE_PERIODS * pattern.periodicity:
+                continue
+            quantity_history = quantities.get(asset_id)
+            quantity = None
+            if quantity_history is not None:
+                quantity = self._quantity_before(quantity_history, current_month + 1)
+                if quantity <= 0:
+                    continue
+            per_share, expected_value = pattern.expected_payment(quantity)
+            expected_value = expected_value.quantize(MONEY_PLACES)
+
+            next_month = pattern.next_month_after(current_month)
+            projected_months = range(
+                next_month, current_month + PROJECTION_MONTHS + 1, pattern.periodicity
+            )
+            asset = assets[asset_id]
+            for month in projected_months:
+                monthly[month].append({'code': asset.code, 'expected_value': expected_value})
+            year, month_number = month_from_index(next_month)
+            asset_rows.append({
+                'asset': {'id': asset.id, 'code': asset.code, 'type': asset.type},
+                'periodicity_months': pattern.periodicity,
+                'per_share_value': per_share,
+                'quantity': quantity,
+                'expected_payment': expected_value,
+                'projected_total': expected_value * len(projected_months),
+                'next_payment': f'{year:04d}-{month_number:02d}',
+            })
+        asset_rows.sort(key=lambda row: row['projected_total'], reverse=True)
+        for row in asset_rows:
+            for field in ('per_share_value', 'quantity', 'expected_payment', 'projected_total'):
+                row[field] = _decimal_str(row[field])
+
+        months = []
+        total = Decimal('0.00')
+        for month in range(current_month + 1, current_month + PROJECTION_MONTHS + 1):
+            year, month_number = month_from_index(month)
+            payments = sorted(monthly[month], key=lambda payment: payment['code'])
+            month_total = sum(
+                (payment['expected_value'] for payment in payments), Decimal('0.00')
+            )
+            total += month_total
+            months.append({
+                'year': year,
+                'month': month_number,
+                'total': str(month_total),
+                'payments': [
+                    {**payment, 'expected_value': str(payment['expected_value'])}
+                    for payment in payments
+                ],
+            })
+        return {
+            'reference_date': self.reference_date,
+            'total': str(total),
+            'months': months,
+            'assets': asset_rows,
+        }
+
+    def _quantity_history(self) -> dict[int, tuple[list[int], list[Decimal]]]:
+        history = defaultdict(lambda: ([], []))
+        snapshots = PositionSnapshot.objects.filter(
+            user=self.user, reference_month__lte=self.reference_date
+        ).order_by('asset_id', 'reference_month').values_list(
+            'asset_id', 'reference_month', 'quantity'
+        )
+        for asset_id, reference_month, quantity in snapshots:
+            months, quantities = history[asset_id]
+            months.append(month_index(reference_month))
+            quantities.append(quantity)
+        return history
+
+    @staticmethod
+    def _quantity_before(history, month: int) -> Decimal:
+        if history is None:
+            return Decimal('0')
+        months, quantities = history
+        position = bisect_right(months, month - 1)
+        return quantities[position - 1] if position else Decimal('0')
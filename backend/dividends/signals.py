@@ -0,0 +1,31 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from assets.models import Asset
+from dividends.models import CardDividendMonth, ItemDividend
+from dividends.services.analytics_cache_service import (
+    bump_card_data_version_on_commit,
+    bump_data_version_on_commit
+)
+
+
+@receiver(post_save, sender=ItemDividend)
+@receiver(post_delete, sender=ItemDividend)
+def bump_analytics_version(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_card_data_version_on_commit(instance.card_month_id)
+
+
+@receiver(post_save, sender=CardDividendMonth)
+def bump_analytics_version_on_card_change(sender, instance, raw=False, created=False, **kwargs):
+    if raw or created:
+        return
+    bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(post_save, sender=Asset)
+def bump_analytics_version_on_asset_change(sender, instance, raw=False, created=False, **kwargs):
+    if raw or created:
+        return
+    bump_data_version_on_commit(instance.user_id)
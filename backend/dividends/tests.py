@@ -0,0 +1,180 @@
+import datetime
+from decimal import Decimal
+from io import StringIO
+from dateutil.relativedelta import relativedelta
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from assets.models import Asset
+from costumers.models import CustomUser
+from dividends.models import CardDividendMonth, ItemDividend
+from dividends.services.dividend_import_service import DividendImportService
+
+
+class PrecomputeDividendProjectionsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='projection', password='projection')
+        asset = Asset.objects.create(code='TAEE11', type='ACAO', user=self.user)
+        today = datetime.date.today()
+        for months_ago in range(1, 7):
+            received_date = today.replace(day=1) - relativedelta(months=months_ago)
+            card = CardDividendMonth.objects.create(
+                user=self.user, year=received_date.year, month=received_date.month
+            )
+            ItemDividend.objects.create(
+                card_month=card, asset=asset, value=Decimal('12.50'), received_date=received_date
+            )
+
+    def test_refuses_to_run_against_a_process_local_cache(self):
+        with self.assertRaises(CommandError):
+            call_command('precompute_dividend_projections', stdout=StringIO())
+
+    @override_settings(CACHE_IS_SHARED=True)
+    def test_precomputed_projection_is_served_from_the_cache(self):
+        call_command('precompute_dividend_projections', stdout=StringIO())
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(reverse('dividend-projection'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(len(response.data['months']), 12)
+
+    def test_projection_amounts_are_decimal_strings(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(reverse('dividend-projection'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total'], '150.00')
+        month = response.data['months'][0]
+        self.assertEqual(month['total'], '12.50')
+        self.assertEqual(month['payments'], [{'code': 'TAEE11', 'expected_value': '12.50'}])
+        [asset] = response.data['assets']
+        self.assertIsNone(asset['per_share_value'])
+        self.assertIsNone(asset['quantity'])
+        self.assertEqual(asset['expected_payment'], '12.50')
+        self.assertEqual(asset['projected_total'], '150.00')
+
+
+class DividendImportServiceTest(TestCase):
+    statement = (
+        'code,value,received_date\n'
+        'MXRF11,10.50,2025-01-15\n'
+        'MXRF11,10.50,2025-01-15\n'
+        'HGLG11,32.00,2025-01-20\n'
+        'MXRF11,11.00,2025-02-15\n'
+        'HGLG11,32.00,2025-03-20\n'
+    )
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='importer', password='importer')
+        for code in ('MXRF11', 'HGLG11'):
+            Asset.objects.create(code=code, type='FII', user=self.user)
+
+    def _import(self, content: str, service=None, file_format='csv'):
+        service = service or DividendImportService(self.user, chunk_size=2)
+        return service.import_file(StringIO(content), file_format).as_dict()
+
+    def test_rows_are_imported_across_chunks(self):
+        result = self._import(self.statement)
+
+        self.assertEqual(result['imported'], 5)
+        self.assertEqual(result['duplicates'], 0)
+        self.assertEqual(result['created_cards'], 3)
+        self.assertEqual(ItemDividend.objects.filter(user=self.user).count(), 5)
+
+    def test_reimporting_the_same_statement_only_reports_duplicates(self):
+        self._import(self.statement)
+
+        result = self._import(self.statement)
+
+        self.assertEqual(result['imported'], 0)
+        self.assertEqual(result['duplicates'], 5)
+        self.assertEqual(result['created_cards'], 0)
+        self.assertEqual(ItemDividend.objects.count(), 5)
+
+    def test_cards_created_by_another_import_are_not_counted(self):
+        service = DividendImportService(self.user, chunk_size=2)
+        CardDividendMonth.objects.create(user=self.user, year=2025, month=1)
+
+        result = self._import(self.statement, service)
+
+        self.assertEqual(result['created_cards'], 2)
+        self.assertEqual(CardDividendMonth.objects.filter(user=self.user).count(), 3)
+
+    def test_invalid_rows_are_reported_with_their_line(self):
+        result = self._import(
+            'code,value,received_date\n'
+            'XPTO11,1.00,2025-01-01\n'
+            'MXRF11,abc,2025-01-01\n'
+            'MXRF11,1.00,2025-01-01\n'
+        )
+
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual(result['error_count'], 2)
+        self.assertEqual([error['line'] for error in result['errors']], [2, 3])
+
+    def test_jsonl_statements_are_supported(self):
+        result = self._import(
+            '{"code": "MXRF11", "value": "10.50", "received_date": "2025-01-15"}\n'
+            'not json\n',
+            file_format='jsonl'
+        )
+
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual(result['errors'][0]['line'], 2)
+
+
+class DividendAnalyticsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='analytics', password='analytics')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        payments = [
+            ('TAEE11', 'ACAO', datetime.date(2024, 3, 10), '100.00'),
+            ('TAEE11', 'ACAO', datetime.date(2025, 1, 10), '60.00'),
+            ('MXRF11', 'FII', datetime.date(2025, 1, 15), '30.00'),
+            ('MXRF11', 'FII', datetime.date(2025, 2, 15), '40.00'),
+        ]
+        for code, asset_type, received_date, value in payments:
+            asset, _ = Asset.objects.get_or_create(
+                code=code, user=self.user, defaults={'type': asset_type}
+            )
+            card, _ = CardDividendMonth.objects.get_or_create(
+                user=self.user, year=received_date.year, month=received_date.month
+            )
+            ItemDividend.objects.create(
+                card_month=card, asset=asset, value=Decimal(value), received_date=received_date
+            )
+
+    def test_amounts_are_decimal_strings(self):
+        response = self.client.get(reverse('dividend-analytics'), {'year': 2025})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total'], '130.00')
+        [year] = response.data['by_year']
+        self.assertEqual(year['total'], '130.00')
+        self.assertEqual(year['previous_total'], '100.00')
+        self.assertEqual(year['growth'], '0.3000')
+        self.assertEqual(
+            [(month['total'], month['year_to_date']) for month in response.data['by_month']],
+            [('90.00', '90.00'), ('40.00', '130.00')]
+        )
+        self.assertEqual(
+            [(row['type'], row['total'], row['share']) for row in response.data['by_type']],
+            [('FII', '70.00', '0.5385'), ('ACAO', '60.00', '0.4615')]
+        )
+
+    def test_first_year_has_no_growth(self):
+        response = self.client.get(reverse('dividend-analytics'), {'year': 2024})
+
+        [year] = response.data['by_year']
+        self.assertIsNone(year['previous_total'])
+        self.assertIsNone(year['growth'])
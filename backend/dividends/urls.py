@@ -2,7 +2,10 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     CardDividendMonthViewSet,
-    ItemDividendViewSet
+    ItemDividendViewSet,
+    DividendImportView,
+    DividendAnalyticsView,
+    DividendProjectionView
 )
 
 
@@ -24,5 +27,8 @@ item_dividend_detail = ItemDividendViewSet.as_view({
 urlpatterns = [
     path('', include(router.urls)),
     path('itens-dividends/', item_dividend_list, name='item-dividend-list'),
-    path('itens-dividends/<int:pk>/', item_dividend_detail, name='item-dividend-detail')
+    path('itens-dividends/import/', DividendImportView.as_view(), name='item-dividend-import'),
+    path('itens-dividends/<int:pk>/', item_dividend_detail, name='item-dividend-detail'),
+    path('dividends/analytics/', DividendAnalyticsView.as_view(), name='dividend-analytics'),
+    path('dividends/projection/', DividendProjectionView.as_view(), name='dividend-projection')
 ]
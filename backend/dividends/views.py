@@ -1,17 +1,30 @@
-from rest_framework import viewsets, serializers
+import io
+from django.db.models import Prefetch
+from rest_framework import viewsets, serializers, status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from .models import CardDividendMonth, ItemDividend
 from .filters import CardDividendMonthFilter
+from .pagination import CardDividendMonthKeysetPagination, ItemDividendKeysetPagination
 from . serializer import ItemDividendSerializer, CardDividendMonthSerializer
+from .services.dividend_import_service import IMPORT_FORMATS, DividendImportService
+from .services.analytics_cache_service import CachedDividendAnalytics
+from .services.projection_cache_service import CachedDividendProjection
+from core.async_views import AsyncListModelMixin
 
 
-class CardDividendMonthViewSet(viewsets.ModelViewSet):
+class CardDividendMonthViewSet(AsyncListModelMixin, viewsets.ModelViewSet):
     serializer_class = CardDividendMonthSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = CardDividendMonthFilter
+    pagination_class = CardDividendMonthKeysetPagination
 
     def get_queryset(self):
-        return CardDividendMonth.objects.filter(user=self.request.user)
+        return CardDividendMonth.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch('itens', queryset=ItemDividend.objects.select_related('asset'))
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -20,9 +33,10 @@ class CardDividendMonthViewSet(viewsets.ModelViewSet):
 class ItemDividendViewSet(viewsets.ModelViewSet):
     serializer_class = ItemDividendSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ItemDividendKeysetPagination
 
     def get_queryset(self):
-        return ItemDividend.objects.filter(card_month__user=self.request.user)
+        return ItemDividend.objects.filter(user=self.request.user).select_related('asset')
 
     def perform_create(self, serializer):
         card_month_id = self.request.data.get('card_month')
@@ -39,3 +53,61 @@ class ItemDividendViewSet(viewsets.ModelViewSet):
                 {'detail': 'card de Mês inválido ou não pertence a voce'}
             )
         serializer.save(card_month=parent_card)
+
+
+class DividendImportView(APIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'error': 'envie o extrato no campo "file"'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        file_format = request.data.get('format') or (
+            'jsonl' if upload.name.endswith(('.jsonl', '.ndjson')) else 'csv'
+        )
+        if file_format not in IMPORT_FORMATS:
+            return Response(
+                {'error': f'formato inválido, use um de: {", ".join(IMPORT_FORMATS)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        statement_file = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        result = DividendImportService(request.user).import_file(statement_file, file_format)
+        if result.imported:
+            response_status = status.HTTP_201_CREATED
+        elif result.duplicates:
+            response_status = status.HTTP_200_OK
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(result.as_dict(), status=response_status)
+
+
+class DividendAnalyticsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        year = request.query_params.get('year')
+        try:
+            year = int(year) if year else None
+        except ValueError:
+            return Response(
+                {'error': 'parametro de ano inválido'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        analytics = CachedDividendAnalytics(request.user, year)
+        response = Response(analytics.analytics())
+        response['X-Cache'] = 'HIT' if analytics.hit else 'MISS'
+        return response
+
+
+class DividendProjectionView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        projection = CachedDividendProjection(request.user)
+        response = Response(projection.project())
+        response['X-Cache'] = 'HIT' if projection.hit else 'MISS'
+        return response
@@ -1,5 +1,12 @@
 from django.contrib import admin
-from .models import Category, Expense, InstallmentExpense, RecurringExpense, PaidRecurringExpense
+from .models import (
+    Category,
+    Expense,
+    InstallmentExpense,
+    RecurringExpense,
+    PaidRecurringExpense,
+    MonthlyExpenseSummary
+)
 from .services.installment_manager_service import InstallmentExpenseService
 
 
@@ -73,7 +80,8 @@ class InstallmentExpenseAdmin(admin.ModelAdmin):
             )
             service.create()
         else:
-            return super().save_model(request, obj, form, change)
+            super().save_model(request, obj, form, change)
+            InstallmentExpenseService.from_contract(obj).sync_installments(obj)
 
 
 @admin.register(RecurringExpense)
@@ -90,3 +98,17 @@ class PaidRecurringExpenseAdmin(admin.ModelAdmin):
     @admin.display(description='Despesa Recorrente')
     def get_recurring_name(self, obj):
         return obj.recurring_expense.name
+
+
+@admin.register(MonthlyExpenseSummary)
+class MonthlyExpenseSummaryAdmin(admin.ModelAdmin):
+    list_display = (
+        'user', 'year', 'month', 'category', 'paid_amount', 'unpaid_amount', 'updated_at',
+    )
+    list_filter = ('year', 'month', 'user', )
+    ordering = ('-year', '-month', )
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        queryset = queryset.filter(user=request.user)
+        return queryset
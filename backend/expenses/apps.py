@@ -5,3 +5,6 @@ class ExpensesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "expenses"
     verbose_name = "Despesas"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,11 +1,33 @@
+import datetime
+from dateutil.relativedelta import relativedelta
 from .models import Expense
 import django_filters
 
 
 class ExpenseFilter(django_filters.FilterSet):
-    due_date__year = django_filters.NumberFilter(field_name='due_date', lookup_expr='year')
-    due_date__month = django_filters.NumberFilter(field_name='due_date', lookup_expr='month')
+    due_date__year = django_filters.NumberFilter(method='filter_due_date_period')
+    due_date__month = django_filters.NumberFilter(method='filter_due_date_period')
+    due_date = django_filters.DateFromToRangeFilter(field_name='due_date')
+    amount = django_filters.RangeFilter(field_name='amount')
 
     class Meta:
         model = Expense
         fields = ['paid', 'category']
+
+    def filter_due_date_period(self, queryset, name, value):
+        year = self.form.cleaned_data.get('due_date__year')
+        month = self.form.cleaned_data.get('due_date__month')
+        if year is None:
+            return queryset.filter(due_date__month=value)
+        if name == 'due_date__month':
+            return queryset
+        try:
+            if month is None:
+                first_date = datetime.date(int(year), 1, 1)
+                next_date = first_date + relativedelta(years=1)
+            else:
+                first_date = datetime.date(int(year), int(month), 1)
+                next_date = first_date + relativedelta(months=1)
+        except ValueError:
+            return queryset.none()
+        return queryset.filter(due_date__gte=first_date, due_date__lt=next_date)
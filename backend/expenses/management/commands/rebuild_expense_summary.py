@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from costumers.models import CustomUser
+from expenses.services.monthly_summary_service import MonthlySummaryService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula a tabela de resumo mensal de despesas a partir dos lançamentos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='id do usuário a recalcular (pode ser repetido); padrão: todos'
+        )
+
+    def handle(self, *args, **options):
+        users = CustomUser.objects.order_by('pk')
+        if options['user_ids']:
+            users = users.filter(pk__in=options['user_ids'])
+
+        rebuilt = 0
+        for user_id in users.values_list('pk', flat=True).iterator():
+            MonthlySummaryService(user_id).rebuild()
+            rebuilt += 1
+        self.stdout.write(
+            self.style.SUCCESS(f'resumo mensal recalculado para {rebuilt} usuário(s)')
+        )
@@ -0,0 +1,118 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0005_recurringexpense_paidrecurringexpense"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyExpenseSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveIntegerField(verbose_name="Ano de Referência")),
+                (
+                    "month",
+                    models.PositiveIntegerField(verbose_name="Mês de Referência"),
+                ),
+                (
+                    "paid_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Total Pago",
+                    ),
+                ),
+                (
+                    "unpaid_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Total Em Aberto",
+                    ),
+                ),
+                (
+                    "installment_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Total Parcelado",
+                    ),
+                ),
+                (
+                    "recurring_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Total Recorrente",
+                    ),
+                ),
+                (
+                    "simple_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Total Avulso",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_summaries",
+                        to="expenses.category",
+                        verbose_name="Categoria",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_expense_summaries",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumo Mensal De Despesas",
+                "verbose_name_plural": "Resumos Mensais De Despesas",
+                "ordering": ["year", "month"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("category__isnull", False)),
+                        fields=("user", "year", "month", "category"),
+                        name="unique_monthly_summary_per_category",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("category__isnull", True)),
+                        fields=("user", "year", "month"),
+                        name="unique_monthly_summary_without_category",
+                    ),
+                ],
+            },
+        ),
+    ]
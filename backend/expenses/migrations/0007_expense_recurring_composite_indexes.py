@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0006_monthlyexpensesummary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="expense",
+            index=models.Index(
+                fields=["user", "due_date"], name="expense_user_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expense",
+            index=models.Index(
+                fields=["user", "paid", "due_date"], name="expense_user_paid_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recurringexpense",
+            index=models.Index(
+                fields=["user", "active", "start_date"],
+                name="recurring_user_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0007_expense_recurring_composite_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="expense",
+            name="expense_user_due_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="expense",
+            name="expense_user_paid_due_idx",
+        ),
+        migrations.AddIndex(
+            model_name="expense",
+            index=models.Index(
+                fields=["user", "due_date", "paid"], name="expense_user_due_paid_idx"
+            ),
+        ),
+    ]
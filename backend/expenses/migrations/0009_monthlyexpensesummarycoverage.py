@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("costumers", "0001_initial"),
+        ("expenses", "0008_expense_user_due_paid_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyExpenseSummaryCoverage",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="monthly_expense_summary_coverage",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+                (
+                    "covered_until",
+                    models.DateField(verbose_name="Resumo Calculado Até"),
+                ),
+            ],
+            options={
+                "verbose_name": "Cobertura Do Resumo Mensal",
+                "verbose_name_plural": "Coberturas Do Resumo Mensal",
+            },
+        ),
+    ]
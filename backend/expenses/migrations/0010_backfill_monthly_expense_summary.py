@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:50
+
+from django.db import migrations
+
+
+def backfill_summaries(apps, schema_editor):
+    # The aggregation lives in the service; historical models would have to duplicate it.
+    from expenses.services.monthly_summary_service import MonthlySummaryService
+
+    CustomUser = apps.get_model("costumers", "CustomUser")
+    for user_id in CustomUser.objects.order_by("pk").values_list("pk", flat=True).iterator():
+        MonthlySummaryService(user_id).rebuild()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0009_monthlyexpensesummarycoverage"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
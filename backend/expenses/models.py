@@ -92,6 +92,9 @@ class Expense(models.Model):
         verbose_name = 'Despesa'
         verbose_name_plural = 'despesas'
         ordering = ['due_date']
+        indexes = [
+            models.Index(fields=['user', 'due_date', 'paid'], name='expense_user_due_paid_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -128,6 +131,11 @@ class RecurringExpense(models.Model):
         verbose_name = 'Despesa Recorrente'
         verbose_name_plural = 'Despesas Recorrentes'
         ordering = ['name']
+        indexes = [
+            models.Index(
+                fields=['user', 'active', 'start_date'], name='recurring_user_active_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.name} (R$ {self.amount}) todo dia {self.due_day}'
@@ -152,3 +160,76 @@ class PaidRecurringExpense(models.Model):
 
     def __str__(self):
         return f'Pagamento de {self.recurring_expense.name} para {self.month}/{self.year}'
+
+
+class MonthlyExpenseSummary(models.Model):
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='monthly_expense_summaries',
+        verbose_name='Usuário'
+    )
+    year = models.PositiveIntegerField(verbose_name='Ano de Referência')
+    month = models.PositiveIntegerField(verbose_name='Mês de Referência')
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='monthly_summaries',
+        verbose_name='Categoria',
+        null=True,
+        blank=True
+    )
+    paid_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, verbose_name='Total Pago'
+    )
+    unpaid_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, verbose_name='Total Em Aberto'
+    )
+    installment_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, verbose_name='Total Parcelado'
+    )
+    recurring_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, verbose_name='Total Recorrente'
+    )
+    simple_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, verbose_name='Total Avulso'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Resumo Mensal De Despesas'
+        verbose_name_plural = 'Resumos Mensais De Despesas'
+        ordering = ['year', 'month']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'year', 'month', 'category'],
+                condition=models.Q(category__isnull=False),
+                name='unique_monthly_summary_per_category'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'year', 'month'],
+                condition=models.Q(category__isnull=True),
+                name='unique_monthly_summary_without_category'
+            )
+        ]
+
+    def __str__(self):
+        return f'Resumo {self.month}/{self.year} de {self.user}'
+
+
+class MonthlyExpenseSummaryCoverage(models.Model):
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='monthly_expense_summary_coverage',
+        verbose_name='Usuário'
+    )
+    covered_until = models.DateField(verbose_name='Resumo Calculado Até')
+
+    class Meta:
+        verbose_name = 'Cobertura Do Resumo Mensal'
+        verbose_name_plural = 'Coberturas Do Resumo Mensal'
+
+    def __str__(self):
+        return f'Resumo de {self.user} até {self.covered_until:%m/%Y}'
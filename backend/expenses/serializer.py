@@ -1,9 +1,17 @@
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
-from .models import Expense, Category, InstallmentExpense, PaidRecurringExpense, RecurringExpense
+from .models import (
+    Expense,
+    Category,
+    InstallmentExpense,
+    PaidRecurringExpense,
+    RecurringExpense,
+    MonthlyExpenseSummary
+)
+from core.instrumentation import TimedSerializerMixin
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
@@ -18,7 +26,7 @@ class CategorySerializer(serializers.ModelSerializer):
         ]
 
 
-class InstallmentExpenseSerializer(serializers.ModelSerializer):
+class InstallmentExpenseSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(),
@@ -39,9 +47,29 @@ class InstallmentExpenseSerializer(serializers.ModelSerializer):
             'category',
             'category_id'
         ]
+        extra_kwargs = {
+            'installments_quantity': {'min_value': 1}
+        }
 
 
-class ExpenseSerializer(serializers.ModelSerializer):
+class InstallmentExpenseBulkItemSerializer(serializers.ModelSerializer):
+    category_id = serializers.IntegerField(allow_null=True, required=False)
+
+    class Meta:
+        model = InstallmentExpense
+        fields = [
+            'name',
+            'total_amount',
+            'installments_quantity',
+            'first_due_date',
+            'category_id'
+        ]
+        extra_kwargs = {
+            'installments_quantity': {'min_value': 1}
+        }
+
+
+class ExpenseSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(),
@@ -68,7 +96,7 @@ class ExpenseSerializer(serializers.ModelSerializer):
         ]
 
 
-class RecurringExpenseSerializer(serializers.ModelSerializer):
+class RecurringExpenseSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(),
@@ -93,7 +121,7 @@ class RecurringExpenseSerializer(serializers.ModelSerializer):
         ]
 
 
-class PaidRecurringExpenseSerializer(serializers.ModelSerializer):
+class PaidRecurringExpenseSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     recurring_expense_id = serializers.PrimaryKeyRelatedField(
         queryset=RecurringExpense.objects.all(),
         source='recurring_expense',
@@ -109,3 +137,40 @@ class PaidRecurringExpenseSerializer(serializers.ModelSerializer):
             'month',
             'year'
         ]
+
+
+class MonthlyExpenseSummarySerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    category = CategorySerializer(read_only=True)
+
+    class Meta:
+        model = MonthlyExpenseSummary
+        fields = [
+            'category',
+            'paid_amount',
+            'unpaid_amount',
+            'installment_amount',
+            'recurring_amount',
+            'simple_amount'
+        ]
+
+
+class RecurringPaymentReferenceSerializer(serializers.Serializer):
+    recurring_expense_id = serializers.IntegerField()
+    year = serializers.IntegerField(min_value=1, max_value=9999)
+    month = serializers.IntegerField(min_value=1, max_value=12)
+
+
+class BulkPaymentSerializer(serializers.Serializer):
+    paid = serializers.BooleanField(default=True)
+    payment_date = serializers.DateField(required=False, allow_null=True)
+    expense_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list, max_length=500
+    )
+    recurring = RecurringPaymentReferenceSerializer(
+        many=True, required=False, default=list, max_length=500
+    )
+
+    def validate(self, attrs):
+        if not attrs['expense_ids'] and not attrs['recurring']:
+            raise serializers.ValidationError('informe ao menos uma despesa para atualizar')
+        return attrs
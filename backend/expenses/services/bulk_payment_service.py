@@ -0,0 +1,133 @@
+import datetime
+from calendar import monthrange
+from functools import reduce
+from operator import or_
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from costumers.models import CustomUser
+from expenses.models import Expense, RecurringExpense, PaidRecurringExpense
+from expenses.services.monthly_cache_service import bump_data_version_on_commit
+from expenses.services.monthly_summary_service import mark_user_months, month_key
+
+
+class BulkPaymentService:
+    def __init__(
+        self,
+        user: CustomUser,
+        expense_ids: list[int],
+        recurring_payments: list[tuple[int, int, int]],
+        payment_date: datetime.date | None = None
+    ):
+        self.user = user
+        self.expense_ids = set(expense_ids)
+        self.recurring_payments = set(recurring_payments)
+        self.payment_date = payment_date or timezone.localdate()
+        self._expense_months = None
+
+    def find_invalid_ids(self) -> dict:
+        errors = {}
+        missing = sorted(self.expense_ids - self._get_expense_months().keys())
+        if missing:
+            errors['expense_ids'] = missing
+
+        recurring_ids = {recurring_id for recurring_id, _, _ in self.recurring_payments}
+        if recurring_ids:
+            contracts = {
+                recurring_id: (start_date, end_date)
+                for recurring_id, start_date, end_date in RecurringExpense.objects.filter(
+                    user=self.user, id__in=recurring_ids
+                ).values_list('id', 'start_date', 'end_date')
+            }
+            missing = sorted(recurring_ids - contracts.keys())
+            if missing:
+                errors['recurring'] = missing
+            out_of_range = sorted(
+                payment for payment in self.recurring_payments
+                if payment[0] in contracts
+                and not self._in_contract(payment, contracts[payment[0]])
+            )
+            if out_of_range:
+                errors['recurring_out_of_range'] = out_of_range
+        return errors
+
+    @transaction.atomic
+    def pay(self) -> dict:
+        updated = 0
+        if self.expense_ids:
+            updated = Expense.objects.filter(user=self.user, id__in=self.expense_ids).update(
+                paid=True, payment_date=self.payment_date, updated_at=timezone.now()
+            )
+        created = 0
+        new_payments = self.recurring_payments - self._get_paid_recurring()
+        if new_payments:
+            created = len(PaidRecurringExpense.objects.bulk_create(
+                [
+                    PaidRecurringExpense(
+                        recurring_expense_id=recurring_id,
+                        year=year,
+                        month=month,
+                        payment_date=self.payment_date
+                    )
+                    for recurring_id, year, month in new_payments
+                ],
+                ignore_conflicts=True
+            ))
+        self._mark_changed()
+        return {'expenses': updated, 'recurring': created}
+
+    @transaction.atomic
+    def unpay(self) -> dict:
+        updated = 0
+        if self.expense_ids:
+            updated = Expense.objects.filter(user=self.user, id__in=self.expense_ids).update(
+                paid=False, payment_date=None, updated_at=timezone.now()
+            )
+        deleted = 0
+        if self.recurring_payments:
+            deleted = PaidRecurringExpense.objects.filter(
+                reduce(or_, (
+                    Q(recurring_expense_id=recurring_id, year=year, month=month)
+                    for recurring_id, year, month in self.recurring_payments
+                )),
+                recurring_expense__user=self.user
+            ).delete()[0]
+        self._mark_changed()
+        return {'expenses': updated, 'recurring': deleted}
+
+    def _get_paid_recurring(self) -> set:
+        if not self.recurring_payments:
+            return set()
+        return set(PaidRecurringExpense.objects.filter(
+            reduce(or_, (
+                Q(recurring_expense_id=recurring_id, year=year, month=month)
+                for recurring_id, year, month in self.recurring_payments
+            ))
+        ).values_list('recurring_expense_id', 'year', 'month'))
+
+    @staticmethod
+    def _in_contract(payment: tuple, contract_period: tuple) -> bool:
+        _, year, month = payment
+        start_date, end_date = contract_period
+        month_first = datetime.date(year, month, 1)
+        month_last = datetime.date(year, month, monthrange(year, month)[1])
+        return start_date <= month_last and (end_date is None or end_date >= month_first)
+
+    def _get_expense_months(self) -> dict:
+        if self._expense_months is None:
+            self._expense_months = {}
+            if self.expense_ids:
+                self._expense_months = {
+                    expense_id: month_key(due_date)
+                    for expense_id, due_date in Expense.objects.filter(
+                        user=self.user, id__in=self.expense_ids
+                    ).values_list('id', 'due_date')
+                }
+        return self._expense_months
+
+    def _mark_changed(self) -> None:
+        months = set(self._get_expense_months().values())
+        months |= {(year, month) for _, year, month in self.recurring_payments}
+        mark_user_months(self.user.pk, months)
+        bump_data_version_on_commit(self.user.pk)
@@ -2,12 +2,17 @@ import datetime
 from decimal import Decimal
 from dateutil.relativedelta import relativedelta
 from django.db import transaction
+from django.utils import timezone
 
 from costumers.models import CustomUser
 from expenses.models import InstallmentExpense, Expense, Category
+from expenses.services.monthly_cache_service import bump_data_version_on_commit
+from expenses.services.monthly_summary_service import mark_user_months, month_key
 
 
 class InstallmentExpenseService:
+    synced_fields = ('name', 'amount', 'due_date', 'category_id')
+
     def __init__(
         self,
         user: CustomUser,
@@ -26,18 +31,77 @@ class InstallmentExpenseService:
 
     @transaction.atomic
     def create(self) -> InstallmentExpense:
-        installment_contract = InstallmentExpense.objects.create(
-            user=self.user,
-            name=self.name,
-            total_amount=self.total_amount,
-            installments_quantity=self.installments_quantity,
-            first_due_date=self.first_due_date,
-            category=self.category
-        )
-        self._create_individual_installments(installment_contract)
+        installment_contract = InstallmentExpense.objects.create(**self._contract_fields())
+        self._save_installments(self.user, self._build_installments(installment_contract))
         return installment_contract
 
-    def _create_individual_installments(self, contract: InstallmentExpense):
+    @classmethod
+    @transaction.atomic
+    def create_many(cls, services: list['InstallmentExpenseService']) -> list[InstallmentExpense]:
+        if not services:
+            return []
+        user = services[0].user
+        contracts = InstallmentExpense.objects.bulk_create([
+            InstallmentExpense(**service._contract_fields()) for service in services
+        ])
+        expenses_to_create = []
+        for service, contract in zip(services, contracts):
+            expenses_to_create.extend(service._build_installments(contract))
+        cls._save_installments(user, expenses_to_create)
+        return contracts
+
+    @classmethod
+    def from_contract(cls, contract: InstallmentExpense) -> 'InstallmentExpenseService':
+        return cls(
+            user=contract.user,
+            name=contract.name,
+            total_amount=contract.total_amount,
+            installments_quantity=contract.installments_quantity,
+            first_due_date=contract.first_due_date,
+            category=contract.category
+        )
+
+    @transaction.atomic
+    def sync_installments(self, contract: InstallmentExpense) -> None:
+        existing = list(contract.installments.order_by('due_date', 'id'))
+        schedule = self._build_installments(contract)
+        now = timezone.now()
+        touched_months = set()
+        to_update = []
+        for expense, planned in zip(existing, schedule):
+            changed = False
+            for field in self.synced_fields:
+                if getattr(expense, field) != getattr(planned, field):
+                    touched_months.add(month_key(expense.due_date))
+                    setattr(expense, field, getattr(planned, field))
+                    changed = True
+            if changed:
+                expense.updated_at = now
+                touched_months.add(month_key(expense.due_date))
+                to_update.append(expense)
+
+        if to_update:
+            Expense.objects.bulk_update(to_update, [*self.synced_fields, 'updated_at'])
+            mark_user_months(self.user.pk, touched_months)
+            bump_data_version_on_commit(self.user.pk)
+        if len(schedule) > len(existing):
+            self._save_installments(self.user, schedule[len(existing):])
+        if len(existing) > len(schedule):
+            Expense.objects.filter(
+                id__in=[expense.id for expense in existing[len(schedule):]]
+            ).delete()
+
+    def _contract_fields(self) -> dict:
+        return {
+            'user': self.user,
+            'name': self.name,
+            'total_amount': self.total_amount,
+            'installments_quantity': self.installments_quantity,
+            'first_due_date': self.first_due_date,
+            'category': self.category,
+        }
+
+    def _build_installments(self, contract: InstallmentExpense) -> list[Expense]:
         installment_amount = round(self.total_amount / self.installments_quantity, 2)
         expenses_to_create = []
         for i in range(self.installments_quantity):
@@ -52,4 +116,12 @@ class InstallmentExpenseService:
                 installment_origin=contract
             )
             expenses_to_create.append(expense)
-        Expense.objects.bulk_create(expenses_to_create)
+        return expenses_to_create
+
+    @staticmethod
+    def _save_installments(user: CustomUser, expenses_to_create: list[Expense]):
+        Expense.objects.bulk_create(expenses_to_create, batch_size=500)
+        mark_user_months(
+            user.pk, [month_key(expense.due_date) for expense in expenses_to_create]
+        )
+        bump_data_version_on_commit(user.pk)
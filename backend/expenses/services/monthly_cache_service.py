@@ -0,0 +1,111 @@
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.cache_versions import (
+    acount, aget_version, bump_version, bump_version_on_commit, count, get_version
+)
+from expenses.models import RecurringExpense
+from expenses.services.virtualization_logic_service import MonthlyExpenseLogic
+
+VERSION_KEY = 'expenses:data-version:{user_id}'
+MONTHLY_VIEW_KEY = 'expenses:monthly-view:{user_id}:{version}:{year}:{month}'
+HITS_KEY = 'expenses:monthly-view:hits'
+MISSES_KEY = 'expenses:monthly-view:misses'
+
+_pending = threading.local()
+
+
+def get_data_version(user_id: int) -> int:
+    return get_version(VERSION_KEY.format(user_id=user_id))
+
+
+async def aget_data_version(user_id: int) -> int:
+    return await aget_version(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_data_version(user_id: int) -> None:
+    bump_version(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_data_version_on_commit(user_id: int) -> None:
+    bump_version_on_commit(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_recurring_owner_version_on_commit(recurring_expense_id: int) -> None:
+    if not hasattr(_pending, 'recurring_ids'):
+        _pending.recurring_ids = set()
+    _pending.recurring_ids.add(recurring_expense_id)
+    transaction.on_commit(_flush_recurring_owner_versions)
+
+
+def _flush_recurring_owner_versions() -> None:
+    recurring_ids = getattr(_pending, 'recurring_ids', None)
+    if not recurring_ids:
+        return
+    _pending.recurring_ids = set()
+    user_ids = set(RecurringExpense.objects.filter(
+        pk__in=recurring_ids
+    ).values_list('user_id', flat=True))
+    for user_id in user_ids:
+        bump_data_version(user_id)
+
+
+def get_cache_stats() -> dict:
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else 0.0,
+    }
+
+
+class CachedMonthlyExpenseLogic:
+    def __init__(self, user, year: int, month: int):
+        self.user = user
+        self.year = year
+        self.month = month
+        self.hit = False
+
+    def get_monthly_expenses(self) -> list:
+        key = MONTHLY_VIEW_KEY.format(
+            user_id=self.user.pk,
+            version=get_data_version(self.user.pk),
+            year=self.year,
+            month=self.month
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            self.hit = True
+            count(HITS_KEY)
+            return cached
+
+        count(MISSES_KEY)
+        monthly_expenses = MonthlyExpenseLogic(
+            user=self.user, year=self.year, month=self.month
+        ).get_monthly_expenses()
+        cache.set(key, monthly_expenses, timeout=settings.MONTHLY_VIEW_CACHE_TIMEOUT)
+        return monthly_expenses
+
+    async def aget_monthly_expenses(self) -> list:
+        key = MONTHLY_VIEW_KEY.format(
+            user_id=self.user.pk,
+            version=await aget_data_version(self.user.pk),
+            year=self.year,
+            month=self.month
+        )
+        cached = await cache.aget(key)
+        if cached is not None:
+            self.hit = True
+            await acount(HITS_KEY)
+            return cached
+
+        await acount(MISSES_KEY)
+        monthly_expenses = await MonthlyExpenseLogic(
+            user=self.user, year=self.year, month=self.month
+        ).aget_monthly_expenses()
+        await cache.aset(key, monthly_expenses, timeout=settings.MONTHLY_VIEW_CACHE_TIMEOUT)
+        return monthly_expenses
@@ -0,0 +1,257 @@
+import datetime
+import threading
+from collections import defaultdict
+from decimal import Decimal
+from calendar import monthrange
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, Sum, Min, Max, Case, When, Value, BooleanField
+from django.db.models.functions import ExtractYear, ExtractMonth
+
+from costumers.models import CustomUser
+from expenses.models import (
+    Expense,
+    RecurringExpense,
+    PaidRecurringExpense,
+    MonthlyExpenseSummary,
+    MonthlyExpenseSummaryCoverage
+)
+
+SUMMARY_AMOUNT_FIELDS = (
+    'paid_amount',
+    'unpaid_amount',
+    'installment_amount',
+    'recurring_amount',
+    'simple_amount',
+)
+
+_pending = threading.local()
+
+
+def month_key(date: datetime.date) -> tuple[int, int]:
+    return date.year, date.month
+
+
+def next_month(key: tuple[int, int]) -> tuple[int, int]:
+    year, month = key
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def iter_months(start: tuple[int, int], end: tuple[int, int]):
+    year, month = start
+    while (year, month) <= end:
+        yield year, month
+        year, month = next_month((year, month))
+
+
+def summary_horizon() -> tuple[int, int]:
+    horizon = datetime.date.today() + relativedelta(
+        months=settings.EXPENSE_SUMMARY_HORIZON_MONTHS
+    )
+    return month_key(horizon)
+
+
+def recurring_months(start_date, end_date, active=True) -> set[tuple[int, int]]:
+    if not active:
+        return set()
+    end = summary_horizon()
+    if end_date is not None:
+        end = min(end, month_key(end_date))
+    return set(iter_months(month_key(start_date), end))
+
+
+def _get_pending() -> dict:
+    if not hasattr(_pending, 'users'):
+        _pending.users = defaultdict(set)
+        _pending.recurring = defaultdict(set)
+        _pending.contract_owners = set()
+    return _pending
+
+
+def mark_user_months(user_id: int, months) -> None:
+    months = set(months)
+    if not months:
+        return
+    _get_pending().users[user_id] |= months
+    transaction.on_commit(flush_pending_summaries)
+
+
+def mark_contract_months(user_id: int, months) -> None:
+    # Open-ended contracts also reach every month the user's table covers past the horizon.
+    _get_pending().contract_owners.add(user_id)
+    mark_user_months(user_id, months)
+
+
+def mark_recurring_months(recurring_expense_id: int, months) -> None:
+    months = set(months)
+    if not months:
+        return
+    _get_pending().recurring[recurring_expense_id] |= months
+    transaction.on_commit(flush_pending_summaries)
+
+
+def flush_pending_summaries() -> None:
+    pending = _get_pending()
+    users, recurring, contract_owners = pending.users, pending.recurring, pending.contract_owners
+    if not users and not recurring:
+        return
+    pending.users, pending.recurring = defaultdict(set), defaultdict(set)
+    pending.contract_owners = set()
+
+    if recurring:
+        owners = RecurringExpense.objects.filter(
+            id__in=recurring.keys()
+        ).values_list('id', 'user_id')
+        for recurring_id, user_id in owners:
+            users[user_id] |= recurring[recurring_id]
+
+    coverage = {}
+    if contract_owners:
+        coverage = dict(MonthlyExpenseSummaryCoverage.objects.filter(
+            user_id__in=contract_owners
+        ).values_list('user_id', 'covered_until'))
+
+    for user_id, months in users.items():
+        end = max(months)
+        if user_id in coverage:
+            end = max(end, month_key(coverage[user_id]))
+        MonthlySummaryService(user_id).refresh_span(min(months), end)
+
+
+class MonthlySummaryService:
+    def __init__(self, user: CustomUser | int):
+        self.user_id = user if isinstance(user, int) else user.pk
+
+    @transaction.atomic
+    def refresh_span(self, start: tuple[int, int], end: tuple[int, int]) -> None:
+        self._lock_user()
+        first_date = datetime.date(start[0], start[1], 1)
+        last_date = datetime.date(end[0], end[1], monthrange(end[0], end[1])[1])
+
+        totals = defaultdict(lambda: dict.fromkeys(SUMMARY_AMOUNT_FIELDS, Decimal('0')))
+        self._add_real_expenses(totals, first_date, last_date)
+        self._add_recurring_expenses(totals, first_date, last_date, start, end)
+
+        MonthlyExpenseSummary.objects.filter(
+            self._span_filter(start, end), user_id=self.user_id
+        ).delete()
+        MonthlyExpenseSummary.objects.bulk_create([
+            MonthlyExpenseSummary(
+                user_id=self.user_id,
+                year=year,
+                month=month,
+                category_id=category_id,
+                **amounts
+            )
+            for (year, month, category_id), amounts in totals.items()
+        ])
+
+    def ensure_covered(self, year: int, month: int) -> None:
+        covered_until = MonthlyExpenseSummaryCoverage.objects.filter(
+            user_id=self.user_id
+        ).values_list('covered_until', flat=True).first()
+        if covered_until is None:
+            self.rebuild(until=(year, month))
+        elif (year, month) > month_key(covered_until):
+            self._extend((year, month))
+
+    @transaction.atomic
+    def _extend(self, end: tuple[int, int]) -> None:
+        self._lock_user()
+        covered_until = MonthlyExpenseSummaryCoverage.objects.get(
+            user_id=self.user_id
+        ).covered_until
+        if end <= month_key(covered_until):
+            return
+        self.refresh_span(next_month(month_key(covered_until)), end)
+        self._set_coverage(end)
+
+    def _lock_user(self) -> None:
+        list(CustomUser.objects.select_for_update().filter(pk=self.user_id).values_list('pk'))
+
+    def _set_coverage(self, end: tuple[int, int]) -> None:
+        MonthlyExpenseSummaryCoverage.objects.update_or_create(
+            user_id=self.user_id, defaults={'covered_until': datetime.date(end[0], end[1], 1)}
+        )
+
+    def rebuild(self, until: tuple[int, int] | None = None) -> None:
+        bounds = Expense.objects.filter(user_id=self.user_id).aggregate(
+            first=Min('due_date'), last=Max('due_date')
+        )
+        recurring_start = RecurringExpense.objects.filter(
+            user_id=self.user_id, active=True
+        ).aggregate(first=Min('start_date'))['first']
+
+        candidates_start = [d for d in (bounds['first'], recurring_start) if d]
+        end = summary_horizon()
+        if bounds['last']:
+            end = max(end, month_key(bounds['last']))
+        if until is not None:
+            end = max(end, until)
+
+        with transaction.atomic():
+            self._lock_user()
+            MonthlyExpenseSummary.objects.filter(user_id=self.user_id).delete()
+            if candidates_start:
+                self.refresh_span(month_key(min(candidates_start)), end)
+            self._set_coverage(end)
+
+    def _add_real_expenses(self, totals, first_date, last_date) -> None:
+        grouped_expenses = Expense.objects.filter(
+            user_id=self.user_id,
+            due_date__gte=first_date,
+            due_date__lte=last_date
+        ).annotate(
+            year=ExtractYear('due_date'),
+            month=ExtractMonth('due_date'),
+            is_installment=Case(
+                When(installment_origin__isnull=True, then=Value(False)),
+                default=Value(True),
+                output_field=BooleanField()
+            )
+        ).order_by().values(
+            'year', 'month', 'category_id', 'paid', 'is_installment'
+        ).annotate(total=Sum('amount'))
+
+        for row in grouped_expenses:
+            amounts = totals[(row['year'], row['month'], row['category_id'])]
+            amounts['paid_amount' if row['paid'] else 'unpaid_amount'] += row['total']
+            if row['is_installment']:
+                amounts['installment_amount'] += row['total']
+            else:
+                amounts['simple_amount'] += row['total']
+
+    def _add_recurring_expenses(self, totals, first_date, last_date, start, end) -> None:
+        contracts = list(RecurringExpense.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=first_date),
+            user_id=self.user_id,
+            active=True,
+            start_date__lte=last_date
+        ).values_list('id', 'category_id', 'amount', 'start_date', 'end_date'))
+        if not contracts:
+            return
+
+        paid_keys = set(PaidRecurringExpense.objects.filter(
+            recurring_expense__user_id=self.user_id,
+            year__gte=start[0],
+            year__lte=end[0]
+        ).values_list('recurring_expense_id', 'year', 'month'))
+
+        for recurring_id, category_id, amount, start_date, end_date in contracts:
+            contract_end = end
+            if end_date is not None:
+                contract_end = min(contract_end, month_key(end_date))
+            for year, month in iter_months(max(start, month_key(start_date)), contract_end):
+                amounts = totals[(year, month, category_id)]
+                amounts['recurring_amount'] += amount
+                if (recurring_id, year, month) in paid_keys:
+                    amounts['paid_amount'] += amount
+                else:
+                    amounts['unpaid_amount'] += amount
+
+    @staticmethod
+    def _span_filter(start: tuple[int, int], end: tuple[int, int]) -> Q:
+        after_start = Q(year__gt=start[0]) | Q(year=start[0], month__gte=start[1])
+        before_end = Q(year__lt=end[0]) | Q(year=end[0], month__lte=end[1])
+        return after_start & before_end
@@ -1,8 +1,42 @@
+import asyncio
 import datetime
+from dateutil.relativedelta import relativedelta
+from django.db.models import Q
 from expenses.models import Expense, RecurringExpense, PaidRecurringExpense
 from expenses.serializer import ExpenseSerializer, CategorySerializer
 from calendar import monthrange
 
+from core.async_orm import afetch
+
+
+def serialize_real_expenses(expenses) -> list:
+    real_expenses_data = ExpenseSerializer(expenses, many=True).data
+    for expense_data in real_expenses_data:
+        expense_data['is_recurring'] = False
+        if expense_data.get('installment_origin'):
+            expense_data['expense_type'] = 'installment'
+        else:
+            expense_data['expense_type'] = 'simple'
+    return real_expenses_data
+
+
+def build_virtual_expense(contract: RecurringExpense, year: int, month: int, paid: bool) -> dict:
+    last_day = monthrange(year, month)[1]
+    due_date = datetime.date(year, month, min(contract.due_day, last_day))
+    return {
+        'id': contract.id,
+        'name': contract.name,
+        'amount': contract.amount,
+        'due_date': due_date.isoformat(),
+        'category': CategorySerializer(contract.category).data if contract.category else None,
+        'paid': paid,
+        'is_recurring': True,
+        'expense_type': 'recurring',
+        'payment_date': None,
+        'installment_origin': None,
+        'created_at': contract.created_at.isoformat()
+    }
+
 
 class MonthlyExpenseLogic:
     def __init__(self, user, year: int, month: int):
@@ -11,61 +45,128 @@ class MonthlyExpenseLogic:
         self.month = month
 
     def get_monthly_expenses(self) -> list:
-        real_expenses = self._get_real_expenses()
-        virtual_expenses = self._get_virtual_recurring_expenses()
-        real_expenses_data = ExpenseSerializer(real_expenses, many=True).data
+        return self._combine(
+            self._get_real_expenses(),
+            self._get_active_contracts(),
+            set(self._get_paid_recurring_ids())
+        )
 
-        for expense_data in real_expenses_data:
-            expense_data['is_recurring'] = False
-            if expense_data.get('installment_origin'):
-                expense_data['expense_type'] = 'installment'
-            else:
-                expense_data['expense_type'] = 'simple'
+    async def aget_monthly_expenses(self) -> list:
+        real_expenses, active_contracts, paid_recurring_ids = await asyncio.gather(
+            afetch(self._get_real_expenses()),
+            afetch(self._get_active_contracts()),
+            afetch(self._get_paid_recurring_ids())
+        )
+        return self._combine(real_expenses, active_contracts, set(paid_recurring_ids))
+
+    def _combine(self, real_expenses, active_contracts, paid_recurring_ids: set) -> list:
+        real_expenses_data = serialize_real_expenses(real_expenses)
+        virtual_expenses = [
+            build_virtual_expense(
+                contract, self.year, self.month, contract.id in paid_recurring_ids
+            )
+            for contract in active_contracts
+        ]
 
         combined_list = real_expenses_data + virtual_expenses
         combined_list.sort(key=lambda x: x['due_date'])
         return combined_list
 
     def _get_real_expenses(self):
+        first_date = datetime.date(self.year, self.month, 1)
         return Expense.objects.filter(
             user=self.user,
-            due_date__year=self.year,
-            due_date__month=self.month
-        )
+            due_date__gte=first_date,
+            due_date__lt=first_date + relativedelta(months=1)
+        ).select_related('category', 'installment_origin__category').order_by('due_date', 'id')
 
-    def _get_virtual_recurring_expenses(self) -> list:
+    def _get_active_contracts(self):
         last_day = monthrange(self.year, self.month)[1]
-        active_contracts = RecurringExpense.objects.filter(
+        first_date = datetime.date(self.year, self.month, 1)
+        return RecurringExpense.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=first_date),
             user=self.user,
             active=True,
             start_date__lte=datetime.date(self.year, self.month, last_day)
-        )
+        ).select_related('category')
 
-        paid_recurring_ids = PaidRecurringExpense.objects.filter(
+    def _get_paid_recurring_ids(self):
+        return PaidRecurringExpense.objects.filter(
             recurring_expense__user=self.user,
             year=self.year,
             month=self.month
         ).values_list('recurring_expense_id', flat=True)
 
-        virtual_expenses = []
-        for contract in active_contracts:
-            if contract.end_date and contract.end_date < datetime.date(self.year, self.month, 1):
-                continue
-
-            due_day = min(contract.due_day, last_day)
-            due_date = datetime.date(self.year, self.month, due_day)
-            virtual_expense = {
-                'id': contract.id,
-                'name': contract.name,
-                'amount': contract.amount,
-                'due_date': due_date.isoformat(),
-                'category': CategorySerializer(contract.category).data if contract.category else None,
-                'paid': contract.id in paid_recurring_ids,
-                'is_recurring': True,
-                'expense_type': 'recurring',
-                'payment_date': None,
-                'installment_origin': None,
-                'created_at': contract.created_at.isoformat()
-            }
-            virtual_expenses.append(virtual_expense)
-        return virtual_expenses
+
+class MonthlyRangeExpenseLogic:
+    def __init__(self, user, start: tuple[int, int], end: tuple[int, int]):
+        self.user = user
+        self.start = start
+        self.end = end
+
+    def get_months(self) -> list[tuple[int, int]]:
+        year, month = self.start
+        months = []
+        while (year, month) <= self.end:
+            months.append((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
+
+    def get_range_expenses(self) -> dict:
+        months = self.get_months()
+        if not months:
+            return {}
+        first_date = datetime.date(months[0][0], months[0][1], 1)
+        end_year, end_month = months[-1]
+        last_date = datetime.date(end_year, end_month, monthrange(end_year, end_month)[1])
+
+        real_by_month = {key: [] for key in months}
+        real_expenses = self._get_real_expenses(first_date, last_date)
+        for expense_data in serialize_real_expenses(real_expenses):
+            due_date = datetime.date.fromisoformat(expense_data['due_date'])
+            real_by_month[(due_date.year, due_date.month)].append(expense_data)
+
+        contracts = list(self._get_recurring_contracts(first_date, last_date))
+        paid_keys = set(self._get_paid_recurring_keys(months))
+
+        result = {}
+        for year, month in months:
+            month_first = datetime.date(year, month, 1)
+            month_last = datetime.date(year, month, monthrange(year, month)[1])
+            virtual_expenses = [
+                build_virtual_expense(
+                    contract, year, month, (contract.id, year, month) in paid_keys
+                )
+                for contract in contracts
+                if contract.start_date <= month_last
+                and (contract.end_date is None or contract.end_date >= month_first)
+            ]
+            combined_list = real_by_month[(year, month)] + virtual_expenses
+            combined_list.sort(key=lambda x: x['due_date'])
+            result[f'{year:04d}-{month:02d}'] = combined_list
+        return result
+
+    def _get_real_expenses(self, first_date: datetime.date, last_date: datetime.date):
+        return Expense.objects.filter(
+            user=self.user,
+            due_date__gte=first_date,
+            due_date__lte=last_date
+        ).select_related('category', 'installment_origin__category').order_by('due_date', 'id')
+
+    def _get_recurring_contracts(self, first_date: datetime.date, last_date: datetime.date):
+        return RecurringExpense.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=first_date),
+            user=self.user,
+            active=True,
+            start_date__lte=last_date
+        ).select_related('category')
+
+    def _get_paid_recurring_keys(self, months: list[tuple[int, int]]):
+        start_year, end_year = months[0][0], months[-1][0]
+        paid_rows = PaidRecurringExpense.objects.filter(
+            recurring_expense__user=self.user,
+            year__gte=start_year,
+            year__lte=end_year
+        ).values_list('recurring_expense_id', 'year', 'month')
+        wanted = set(months)
+        return (row for row in paid_rows if (row[1], row[2]) in wanted)
@@ -0,0 +1,113 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from expenses.models import (
+    Category,
+    Expense,
+    InstallmentExpense,
+    RecurringExpense,
+    PaidRecurringExpense
+)
+from expenses.services.monthly_cache_service import (
+    bump_data_version_on_commit,
+    bump_recurring_owner_version_on_commit,
+)
+from expenses.services.monthly_summary_service import (
+    MonthlySummaryService,
+    mark_contract_months,
+    mark_user_months,
+    mark_recurring_months,
+    month_key,
+    recurring_months,
+)
+
+
+@receiver(pre_save, sender=Expense)
+def remember_previous_expense_month(sender, instance, raw=False, **kwargs):
+    instance._previous_summary_key = None
+    if instance.pk and not raw:
+        previous = sender.objects.filter(pk=instance.pk).values('user_id', 'due_date').first()
+        if previous:
+            instance._previous_summary_key = (
+                previous['user_id'], month_key(previous['due_date'])
+            )
+
+
+@receiver(post_save, sender=Expense)
+def refresh_summary_on_expense_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous_key = getattr(instance, '_previous_summary_key', None)
+    if previous_key:
+        mark_user_months(previous_key[0], [previous_key[1]])
+    mark_user_months(instance.user_id, [month_key(instance.due_date)])
+
+
+@receiver(post_delete, sender=Expense)
+def refresh_summary_on_expense_delete(sender, instance, **kwargs):
+    mark_user_months(instance.user_id, [month_key(instance.due_date)])
+
+
+@receiver(pre_save, sender=RecurringExpense)
+def remember_previous_recurring_span(sender, instance, raw=False, **kwargs):
+    instance._previous_summary_months = set()
+    if instance.pk and not raw:
+        previous = sender.objects.filter(pk=instance.pk).values(
+            'start_date', 'end_date', 'active'
+        ).first()
+        if previous:
+            instance._previous_summary_months = recurring_months(**previous)
+
+
+@receiver(post_save, sender=RecurringExpense)
+def refresh_summary_on_recurring_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    months = getattr(instance, '_previous_summary_months', set())
+    months |= recurring_months(instance.start_date, instance.end_date, instance.active)
+    mark_contract_months(instance.user_id, months)
+
+
+@receiver(post_delete, sender=RecurringExpense)
+def refresh_summary_on_recurring_delete(sender, instance, **kwargs):
+    mark_contract_months(
+        instance.user_id,
+        recurring_months(instance.start_date, instance.end_date, instance.active)
+    )
+
+
+@receiver(post_save, sender=PaidRecurringExpense)
+@receiver(post_delete, sender=PaidRecurringExpense)
+def refresh_summary_on_recurring_payment(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    mark_recurring_months(instance.recurring_expense_id, [(instance.year, instance.month)])
+
+
+@receiver(post_delete, sender=Category)
+def rebuild_summary_on_category_delete(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: MonthlySummaryService(user_id).rebuild())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+@receiver(post_save, sender=InstallmentExpense)
+@receiver(post_delete, sender=InstallmentExpense)
+@receiver(post_save, sender=RecurringExpense)
+@receiver(post_delete, sender=RecurringExpense)
+def bump_monthly_view_version(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_data_version_on_commit(instance.user_id)
+
+
+@receiver(post_save, sender=PaidRecurringExpense)
+@receiver(post_delete, sender=PaidRecurringExpense)
+def bump_monthly_view_version_on_payment(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_recurring_owner_version_on_commit(instance.recurring_expense_id)
@@ -0,0 +1,437 @@
+import datetime
+from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from costumers.models import CustomUser
+from expenses.filters import ExpenseFilter
+from expenses.models import (
+    Category,
+    Expense,
+    InstallmentExpense,
+    MonthlyExpenseSummary,
+    MonthlyExpenseSummaryCoverage,
+    PaidRecurringExpense,
+    RecurringExpense
+)
+from expenses.services.virtualization_logic_service import MonthlyExpenseLogic
+
+
+class MonthlyExpenseQueryCountTest(TestCase):
+    year = 2025
+    month = 3
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='monthly', password='monthly-password')
+
+    def _populate(self, scale: int) -> None:
+        due_date = datetime.date(self.year, self.month, 10)
+        for index in range(scale):
+            category = Category.objects.create(user=self.user, name=f'Categoria {index}')
+            Expense.objects.create(
+                user=self.user, name=f'Avulsa {index}', amount=Decimal('10.00'),
+                due_date=due_date, category=category
+            )
+            installment = InstallmentExpense.objects.create(
+                user=self.user, name=f'Parcelada {index}', total_amount=Decimal('30.00'),
+                installments_quantity=3, first_due_date=due_date, category=category
+            )
+            Expense.objects.create(
+                user=self.user, name=f'Parcela {index}', amount=Decimal('10.00'),
+                due_date=due_date, category=category, installment_origin=installment
+            )
+            recurring = RecurringExpense.objects.create(
+                user=self.user, name=f'Recorrente {index}', amount=Decimal('50.00'),
+                due_day=5, category=category, start_date=datetime.date(self.year, 1, 1)
+            )
+            PaidRecurringExpense.objects.create(
+                recurring_expense=recurring, payment_date=due_date,
+                month=self.month, year=self.year
+            )
+
+    def _assert_month_queries(self, scale: int) -> None:
+        logic = MonthlyExpenseLogic(user=self.user, year=self.year, month=self.month)
+        with self.assertNumQueries(3):
+            expenses = logic.get_monthly_expenses()
+        self.assertEqual(len(expenses), 3 * scale)
+        self.assertTrue(all(item['category'] for item in expenses))
+
+    def test_query_count_is_constant_at_1x(self):
+        self._populate(1)
+        self._assert_month_queries(1)
+
+    def test_query_count_is_constant_at_10x(self):
+        self._populate(10)
+        self._assert_month_queries(10)
+
+
+class ExpenseMonthIndexTest(TestCase):
+    index_name = 'expense_user_due_paid_idx'
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='indexed', password='indexed-password')
+        other = CustomUser.objects.create_user(username='other', password='other-password')
+        Expense.objects.bulk_create([
+            Expense(
+                user=user, name=f'Despesa {day}', amount=Decimal('10.00'),
+                due_date=datetime.date(2025, 1, 1) + datetime.timedelta(days=day)
+            )
+            for user in (self.user, other) for day in range(365)
+        ])
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE expenses_expense')
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def test_monthly_logic_uses_user_due_date_index(self):
+        queryset = MonthlyExpenseLogic(user=self.user, year=2025, month=3)._get_real_expenses()
+        self.assertIn(self.index_name, queryset.explain())
+
+    def test_filter_month_uses_user_due_date_index(self):
+        queryset = ExpenseFilter(
+            {'due_date__year': '2025', 'due_date__month': '3', 'paid': 'false'},
+            queryset=Expense.objects.filter(user=self.user)
+        ).qs
+        self.assertIn(self.index_name, queryset.explain())
+
+
+class MonthlyExpensesRangeViewTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='range', password='range-password')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('monthly-expenses-range-view')
+
+    def test_missing_bounds_return_bad_request(self):
+        for params in ({}, {'from': '2026-01'}, {'to': '2026-01'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn('error', response.data)
+
+    def test_malformed_bounds_return_bad_request(self):
+        for value in ('2026', '2026-13', 'janeiro-2026', '2026-01-01'):
+            response = self.client.get(self.url, {'from': value, 'to': '2026-12'})
+            self.assertEqual(response.status_code, 400, value)
+
+    def test_range_lists_every_month_with_recurring_contracts(self):
+        RecurringExpense.objects.create(
+            user=self.user, name='Aluguel', amount=Decimal('1000.00'),
+            due_day=5, start_date=datetime.date(2026, 2, 1)
+        )
+        Expense.objects.create(
+            user=self.user, name='Mercado', amount=Decimal('200.00'),
+            due_date=datetime.date(2026, 3, 15)
+        )
+        response = self.client.get(self.url, {'from': '2026-01', 'to': '2026-03'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data), ['2026-01', '2026-02', '2026-03'])
+        self.assertEqual(response.data['2026-01'], [])
+        self.assertEqual([item['name'] for item in response.data['2026-02']], ['Aluguel'])
+        self.assertEqual(
+            [item['name'] for item in response.data['2026-03']], ['Aluguel', 'Mercado']
+        )
+
+    def test_range_longer_than_limit_is_rejected(self):
+        response = self.client.get(self.url, {'from': '2024-01', 'to': '2026-12'})
+        self.assertEqual(response.status_code, 400)
+
+
+class InstallmentExpenseSyncTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='sync', password='sync-password')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        response = self.client.post(reverse('installment-expense-list'), {
+            'name': 'Notebook',
+            'total_amount': '300.00',
+            'installments_quantity': 3,
+            'first_due_date': '2026-01-10',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.contract = InstallmentExpense.objects.get(pk=response.data['id'])
+        self.url = reverse('installment-expense-detail', args=[self.contract.pk])
+
+    def _installments(self):
+        return list(self.contract.installments.order_by('due_date', 'id'))
+
+    def test_zero_installments_is_rejected(self):
+        response = self.client.patch(self.url, {'installments_quantity': 0}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('installments_quantity', response.data)
+        self.assertEqual(len(self._installments()), 3)
+
+    def test_growing_the_count_keeps_rows_and_paid_flags(self):
+        first = self._installments()[0]
+        Expense.objects.filter(pk=first.pk).update(paid=True)
+
+        response = self.client.patch(self.url, {'installments_quantity': 4}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        installments = self._installments()
+        self.assertEqual(len(installments), 4)
+        self.assertEqual(installments[0].pk, first.pk)
+        self.assertTrue(installments[0].paid)
+        self.assertEqual(
+            [expense.name for expense in installments],
+            [f'Notebook ({index}/4)' for index in range(1, 5)]
+        )
+        self.assertTrue(all(expense.amount == Decimal('75.00') for expense in installments))
+        self.assertEqual(installments[3].due_date, datetime.date(2026, 4, 10))
+
+    def test_shrinking_the_count_drops_trailing_installments(self):
+        kept_ids = [expense.pk for expense in self._installments()[:2]]
+
+        response = self.client.patch(self.url, {'installments_quantity': 2}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        installments = self._installments()
+        self.assertEqual([expense.pk for expense in installments], kept_ids)
+        self.assertTrue(all(expense.amount == Decimal('150.00') for expense in installments))
+
+    def test_moving_the_start_date_shifts_every_installment(self):
+        original = self._installments()
+        Expense.objects.filter(pk=original[1].pk).update(paid=True)
+
+        response = self.client.patch(self.url, {'first_due_date': '2026-03-05'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        installments = self._installments()
+        self.assertEqual(
+            [expense.pk for expense in installments], [expense.pk for expense in original]
+        )
+        self.assertEqual(
+            [expense.due_date for expense in installments],
+            [datetime.date(2026, 3, 5), datetime.date(2026, 4, 5), datetime.date(2026, 5, 5)]
+        )
+        self.assertEqual([expense.paid for expense in installments], [False, True, False])
+
+
+class MonthlyExpenseSummaryTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='summary', password='summary-password')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('monthly-expense-summary')
+        self.today = datetime.date.today()
+
+    def _summary(self, date: datetime.date) -> dict:
+        response = self.client.get(
+            self.url, {'due_date__year': date.year, 'due_date__month': date.month}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data['totals']
+
+    def test_existing_data_without_summary_rows_is_rebuilt_on_read(self):
+        Expense.objects.bulk_create([
+            Expense(user=self.user, name='Luz', amount=Decimal('80.00'), due_date=self.today),
+            Expense(
+                user=self.user, name='Água', amount=Decimal('40.00'),
+                due_date=self.today, paid=True
+            ),
+        ])
+        self.assertFalse(MonthlyExpenseSummary.objects.filter(user=self.user).exists())
+
+        totals = self._summary(self.today)
+
+        self.assertEqual(totals['unpaid_amount'], '80.00')
+        self.assertEqual(totals['paid_amount'], '40.00')
+        self.assertEqual(totals['simple_amount'], '120.00')
+        self.assertTrue(MonthlyExpenseSummaryCoverage.objects.filter(user=self.user).exists())
+
+    def test_changes_are_reflected_after_commit(self):
+        self._summary(self.today)
+        with self.captureOnCommitCallbacks(execute=True):
+            expense = Expense.objects.create(
+                user=self.user, name='Internet', amount=Decimal('100.00'), due_date=self.today
+            )
+        self.assertEqual(self._summary(self.today)['unpaid_amount'], '100.00')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            expense.paid = True
+            expense.save()
+        totals = self._summary(self.today)
+        self.assertEqual(totals['unpaid_amount'], '0.00')
+        self.assertEqual(totals['paid_amount'], '100.00')
+
+    def test_months_past_the_horizon_are_computed_on_demand(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            RecurringExpense.objects.create(
+                user=self.user, name='Aluguel', amount=Decimal('1500.00'), due_day=5,
+                start_date=self.today.replace(day=1)
+            )
+        far_month = self.today + relativedelta(years=10)
+
+        totals = self._summary(far_month)
+
+        self.assertEqual(totals['recurring_amount'], '1500.00')
+        coverage = MonthlyExpenseSummaryCoverage.objects.get(user=self.user)
+        self.assertEqual(coverage.covered_until, far_month.replace(day=1))
+
+    def test_recurring_edits_refresh_every_covered_month(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            contract = RecurringExpense.objects.create(
+                user=self.user, name='Academia', amount=Decimal('90.00'), due_day=10,
+                start_date=self.today.replace(day=1)
+            )
+        far_month = self.today + relativedelta(years=5)
+        self._summary(far_month)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            contract.amount = Decimal('120.00')
+            contract.save()
+
+        self.assertEqual(self._summary(far_month)['recurring_amount'], '120.00')
+
+    def test_invalid_month_is_rejected(self):
+        response = self.client.get(self.url, {'due_date__year': 2026, 'due_date__month': 13})
+        self.assertEqual(response.status_code, 400)
+
+
+class InstallmentExpenseBulkTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='bulk', password='bulk-password')
+        other = CustomUser.objects.create_user(username='bulk-other', password='bulk-password')
+        self.category = Category.objects.create(user=self.user, name='Casa')
+        self.other_category = Category.objects.create(user=other, name='Alheia')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('installment-expense-bulk')
+
+    def _purchase(self, name: str, **overrides) -> dict:
+        return {
+            'name': name,
+            'total_amount': '200.00',
+            'installments_quantity': 2,
+            'first_due_date': '2026-03-15',
+            **overrides,
+        }
+
+    def test_purchases_are_created_with_their_installments(self):
+        response = self.client.post(self.url, [
+            self._purchase('Geladeira', category_id=self.category.pk),
+            self._purchase('Sofá', installments_quantity=4),
+        ], format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([contract['name'] for contract in response.data], ['Geladeira', 'Sofá'])
+        self.assertEqual(
+            Expense.objects.filter(user=self.user, installment_origin__isnull=False).count(), 6
+        )
+        self.assertEqual(
+            set(Expense.objects.filter(
+                installment_origin__name='Geladeira'
+            ).values_list('category_id', flat=True)),
+            {self.category.pk}
+        )
+
+    def test_errors_are_reported_by_index_and_nothing_is_created(self):
+        response = self.client.post(self.url, [
+            self._purchase('Geladeira'),
+            self._purchase('Sofá', installments_quantity=0),
+            self._purchase('Mesa', category_id=self.other_category.pk),
+            self._purchase('Cadeira', category_id=0),
+        ], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [(error['index'], list(error['errors'])) for error in response.data['errors']],
+            [(1, ['installments_quantity']), (2, ['category_id']), (3, ['category_id'])]
+        )
+        self.assertFalse(InstallmentExpense.objects.filter(user=self.user).exists())
+
+    def test_payload_must_be_a_non_empty_list_within_the_limit(self):
+        self.assertEqual(self.client.post(self.url, [], format='json').status_code, 400)
+        self.assertEqual(
+            self.client.post(self.url, self._purchase('Geladeira'), format='json').status_code,
+            400
+        )
+        too_many = [self._purchase(f'Compra {index}') for index in range(201)]
+        self.assertEqual(self.client.post(self.url, too_many, format='json').status_code, 400)
+
+
+class BulkPaymentTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='payer', password='payer-password')
+        other = CustomUser.objects.create_user(username='stranger', password='payer-password')
+        self.expenses = [
+            Expense.objects.create(
+                user=self.user, name=f'Conta {day}', amount=Decimal('10.00'),
+                due_date=datetime.date(2026, 2, day)
+            )
+            for day in (5, 10)
+        ]
+        self.foreign_expense = Expense.objects.create(
+            user=other, name='Alheia', amount=Decimal('10.00'), due_date=datetime.date(2026, 2, 5)
+        )
+        self.contract = RecurringExpense.objects.create(
+            user=self.user, name='Aluguel', amount=Decimal('900.00'), due_day=5,
+            start_date=datetime.date(2026, 1, 1), end_date=datetime.date(2026, 6, 30)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('expense-bulk-payment')
+
+    def _pay(self, **payload):
+        return self.client.post(self.url, payload, format='json')
+
+    def _recurring(self, *months) -> list[dict]:
+        return [
+            {'recurring_expense_id': self.contract.pk, 'year': 2026, 'month': month}
+            for month in months
+        ]
+
+    def test_expenses_and_recurring_months_are_paid(self):
+        response = self._pay(
+            expense_ids=[expense.pk for expense in self.expenses],
+            recurring=self._recurring(2, 3),
+            payment_date='2026-02-20'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'expenses': 2, 'recurring': 2})
+        self.assertEqual(
+            set(Expense.objects.filter(user=self.user).values_list('paid', 'payment_date')),
+            {(True, datetime.date(2026, 2, 20))}
+        )
+
+    def test_paying_twice_only_counts_new_recurring_payments(self):
+        self._pay(recurring=self._recurring(2))
+
+        response = self._pay(recurring=self._recurring(2, 3))
+
+        self.assertEqual(response.data, {'expenses': 0, 'recurring': 1})
+        self.assertEqual(PaidRecurringExpense.objects.filter(
+            recurring_expense=self.contract
+        ).count(), 2)
+
+    def test_foreign_and_out_of_range_ids_reject_the_whole_batch(self):
+        response = self._pay(
+            expense_ids=[self.expenses[0].pk, self.foreign_expense.pk],
+            recurring=self._recurring(2, 7)
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['expense_ids'], [self.foreign_expense.pk])
+        self.assertEqual(response.data['recurring_out_of_range'], [(self.contract.pk, 2026, 7)])
+        self.assertFalse(Expense.objects.filter(paid=True).exists())
+        self.assertFalse(PaidRecurringExpense.objects.exists())
+
+    def test_unpaying_clears_payments(self):
+        self._pay(expense_ids=[self.expenses[0].pk], recurring=self._recurring(2))
+
+        response = self._pay(
+            paid=False, expense_ids=[self.expenses[0].pk], recurring=self._recurring(2)
+        )
+
+        self.assertEqual(response.data, {'expenses': 1, 'recurring': 1})
+        self.expenses[0].refresh_from_db()
+        self.assertFalse(self.expenses[0].paid)
+        self.assertIsNone(self.expenses[0].payment_date)
+        self.assertFalse(PaidRecurringExpense.objects.exists())
+
+    def test_empty_requests_are_rejected(self):
+        self.assertEqual(self._pay().status_code, 400)
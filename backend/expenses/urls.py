@@ -4,7 +4,9 @@ from .views import (
     InstallmentExpenseViewSet,
     RecurringExpenseViewSet,
     PaidRecurringExpenseViewSet,
-    MonthlyExpensesView
+    MonthlyExpensesView,
+    MonthlyExpensesRangeView,
+    MonthlyExpenseSummaryView
 )
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
@@ -19,5 +21,11 @@ router.register(r'paid-recurring', PaidRecurringExpenseViewSet, basename='paid-r
 
 urlpatterns = [
     path('monthly-view/', MonthlyExpensesView.as_view(), name='monthly-expenses-view'),
+    path(
+        'monthly-view/range/',
+        MonthlyExpensesRangeView.as_view(),
+        name='monthly-expenses-range-view'
+    ),
+    path('monthly-summary/', MonthlyExpenseSummaryView.as_view(), name='monthly-expense-summary'),
     path('', include(router.urls))
 ]
@@ -1,22 +1,39 @@
 from rest_framework import viewsets, status, serializers
 from rest_framework.response import Response
+from rest_framework.decorators import action
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.filters import SearchFilter
-from .models import Expense, Category, InstallmentExpense, PaidRecurringExpense, RecurringExpense
+from .models import (
+    Expense,
+    Category,
+    InstallmentExpense,
+    PaidRecurringExpense,
+    RecurringExpense,
+    MonthlyExpenseSummary
+)
 from .serializer import (
     ExpenseSerializer,
     CategorySerializer,
     InstallmentExpenseSerializer,
+    InstallmentExpenseBulkItemSerializer,
     PaidRecurringExpenseSerializer,
-    RecurringExpenseSerializer
+    RecurringExpenseSerializer,
+    MonthlyExpenseSummarySerializer,
+    BulkPaymentSerializer
 )
 from expenses.services.installment_manager_service import InstallmentExpenseService
+from expenses.services.bulk_payment_service import BulkPaymentService
 from .mixins import UserQuerysetMixin
+from core.async_views import AsyncAPIView
 from .filters import ExpenseFilter
 import django_filters
 import datetime
-from expenses.services.virtualization_logic_service import MonthlyExpenseLogic
+from django.db import transaction
+from decimal import Decimal
+from expenses.services.monthly_summary_service import SUMMARY_AMOUNT_FIELDS, MonthlySummaryService
+from expenses.services.monthly_cache_service import CachedMonthlyExpenseLogic
+from expenses.services.virtualization_logic_service import MonthlyRangeExpenseLogic
 
 
 class CategoryViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
@@ -30,7 +47,7 @@ class CategoryViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
 
 
 class ExpenseViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
-    queryset = Expense.objects.all()
+    queryset = Expense.objects.select_related('category', 'installment_origin__category')
     serializer_class = ExpenseSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = ExpenseFilter
@@ -41,12 +58,36 @@ class ExpenseViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['post'], url_path='bulk-payment')
+    def bulk_payment(self, request, *args, **kwargs):
+        serializer = BulkPaymentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
+        service = BulkPaymentService(
+            user=request.user,
+            expense_ids=validated_data['expense_ids'],
+            recurring_payments=[
+                (item['recurring_expense_id'], item['year'], item['month'])
+                for item in validated_data['recurring']
+            ],
+            payment_date=validated_data.get('payment_date')
+        )
+        invalid_ids = service.find_invalid_ids()
+        if invalid_ids:
+            return Response(
+                {'detail': 'despesas inválidas ou que não pertencem a você', **invalid_ids},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        result = service.pay() if validated_data['paid'] else service.unpay()
+        return Response(result)
+
 
 class InstallmentExpenseViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
-    queryset = InstallmentExpense.objects.all()
+    queryset = InstallmentExpense.objects.select_related('category')
     serializer_class = InstallmentExpenseSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None
+    max_bulk_items = 200
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -64,9 +105,77 @@ class InstallmentExpenseViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
         response_serializer = self.get_serializer(installment_expense)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @transaction.atomic
+    def perform_update(self, serializer):
+        installment_expense = serializer.save()
+        InstallmentExpenseService.from_contract(installment_expense).sync_installments(
+            installment_expense
+        )
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request, *args, **kwargs):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'error': 'envie uma lista de compras parceladas'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > self.max_bulk_items:
+            return Response(
+                {'error': f'o limite é de {self.max_bulk_items} compras por requisição'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        errors = {}
+        validated_items = []
+        for index, item in enumerate(items):
+            item_serializer = InstallmentExpenseBulkItemSerializer(data=item)
+            if item_serializer.is_valid():
+                validated_items.append((index, item_serializer.validated_data))
+            else:
+                errors[index] = item_serializer.errors
+
+        category_ids = {
+            data['category_id'] for _, data in validated_items
+            if data.get('category_id') is not None
+        }
+        categories = {}
+        if category_ids:
+            categories = {
+                category.id: category
+                for category in Category.objects.filter(user=request.user, id__in=category_ids)
+            }
+
+        services = []
+        for index, data in validated_items:
+            category_id = data.get('category_id')
+            if category_id is not None and category_id not in categories:
+                errors[index] = {'category_id': ['categoria inválida ou não pertence a você']}
+                continue
+            services.append(InstallmentExpenseService(
+                user=request.user,
+                name=data['name'],
+                total_amount=data['total_amount'],
+                installments_quantity=data['installments_quantity'],
+                first_due_date=data['first_due_date'],
+                category=categories.get(category_id)
+            ))
+
+        if errors:
+            return Response(
+                {'errors': [
+                    {'index': index, 'errors': errors[index]} for index in sorted(errors)
+                ]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        contracts = InstallmentExpenseService.create_many(services)
+        response_serializer = self.get_serializer(contracts, many=True)
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
 
 class RecurringExpenseViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
-    queryset = RecurringExpense.objects.all()
+    queryset = RecurringExpense.objects.select_related('category')
     serializer_class = RecurringExpenseSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None
@@ -90,7 +199,83 @@ class PaidRecurringExpenseViewSet(UserQuerysetMixin, viewsets.ModelViewSet):
         serializer.save()
 
 
-class MonthlyExpensesView(APIView):
+class MonthlyExpensesView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        try:
+            logic_service = self._get_logic_service(request)
+        except (TypeError, ValueError):
+            return self._invalid_period_response()
+        combined_list = logic_service.get_monthly_expenses()
+
+        return Response(combined_list, headers={'X-Cache': 'HIT' if logic_service.hit else 'MISS'})
+
+    async def aget(self, request, *args, **kwargs):
+        try:
+            logic_service = self._get_logic_service(request)
+        except (TypeError, ValueError):
+            return self._invalid_period_response()
+        combined_list = await logic_service.aget_monthly_expenses()
+
+        return Response(combined_list, headers={'X-Cache': 'HIT' if logic_service.hit else 'MISS'})
+
+    @staticmethod
+    def _get_logic_service(request) -> CachedMonthlyExpenseLogic:
+        year = int(request.query_params.get('due_date__year', datetime.date.today().year))
+        month = int(request.query_params.get('due_date__month', datetime.date.today().month))
+        return CachedMonthlyExpenseLogic(user=request.user, year=year, month=month)
+
+    @staticmethod
+    def _invalid_period_response() -> Response:
+        return Response({
+            'error': 'parametros de ano/mês inválidos'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+class MonthlyExpensesRangeView(APIView):
+    permission_classes = [IsAuthenticated]
+    pagination_class = None
+    max_range_months = 24
+
+    def get(self, request, *args, **kwargs):
+        try:
+            start = self._parse_year_month(request.query_params.get('from'))
+            end = self._parse_year_month(request.query_params.get('to'))
+        except (TypeError, ValueError):
+            return Response({
+                'error': 'parametros from/to inválidos, use o formato AAAA-MM'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if start > end:
+            return Response({
+                'error': 'o parametro from deve ser anterior ou igual ao to'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        months_in_range = (end[0] - start[0]) * 12 + end[1] - start[1] + 1
+        if months_in_range > self.max_range_months:
+            return Response({
+                'error': f'o intervalo máximo é de {self.max_range_months} meses'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        logic_service = MonthlyRangeExpenseLogic(user=request.user, start=start, end=end)
+        return Response(logic_service.get_range_expenses())
+
+    @staticmethod
+    def _parse_year_month(value: str | None) -> tuple[int, int]:
+        if value is None:
+            raise ValueError('parametro ausente')
+        year, month = value.split('-')
+        year, month = int(year), int(month)
+        if not 1 <= month <= 12 or not 1 <= year <= 9999:
+            raise ValueError(value)
+        return year, month
+
+
+class MonthlyExpenseSummaryView(APIView):
     permission_classes = [IsAuthenticated]
     pagination_class = None
 
@@ -98,13 +283,27 @@ class MonthlyExpensesView(APIView):
         try:
             year = int(request.query_params.get('due_date__year', datetime.date.today().year))
             month = int(request.query_params.get('due_date__month', datetime.date.today().month))
+            datetime.date(year, month, 1)
         except (TypeError, ValueError):
             return Response({
                 'error': 'parametros de ano/mês inválidos'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        logic_service = MonthlyExpenseLogic(user=request.user, year=year, month=month)
-        combined_list = logic_service.get_monthly_expenses()
+        MonthlySummaryService(request.user).ensure_covered(year, month)
+        summaries = MonthlyExpenseSummary.objects.filter(
+            user=request.user, year=year, month=month
+        ).select_related('category')
+        categories_data = MonthlyExpenseSummarySerializer(summaries, many=True).data
+
+        totals = dict.fromkeys(SUMMARY_AMOUNT_FIELDS, Decimal('0.00'))
+        for summary in summaries:
+            for field in SUMMARY_AMOUNT_FIELDS:
+                totals[field] += getattr(summary, field)
 
-        return Response(combined_list)
+        return Response({
+            'year': year,
+            'month': month,
+            'totals': {field: str(value) for field, value in totals.items()},
+            'categories': categories_data
+        })
@@ -0,0 +1,10 @@
+import decouple
+
+bind = decouple.config('GUNICORN_BIND', default='0.0.0.0:8000')
+workers = decouple.config('GUNICORN_WORKERS', default=1, cast=int)
+
+if decouple.config('SERVER_MODE', default='wsgi') == 'asgi':
+    wsgi_app = 'core.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'core.wsgi:application'
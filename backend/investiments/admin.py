@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ItemInvestiment, CardInvestiment
+from .models import ItemInvestiment, CardInvestiment, PositionSnapshot
 
 
 @admin.register(CardInvestiment)
@@ -43,3 +43,15 @@ class ItemInvestimentAdmin(admin.ModelAdmin):
             if not request.user.is_superuser:
                 kwargs['queryset'] = CardInvestiment.objects.filter(user=request.user)
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(PositionSnapshot)
+class PositionSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('id', 'asset', 'reference_month', 'quantity', 'average_price', 'user')
+    list_filter = ('reference_month', 'user',)
+    ordering = ('-reference_month',)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        queryset = queryset.filter(user=request.user)
+        return queryset
@@ -5,3 +5,6 @@ class InvestimentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "investiments"
     verbose_name = 'Investimentos'
+
+    def ready(self):
+        from . import signals  # noqa: F401
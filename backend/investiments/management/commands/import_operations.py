@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from costumers.models import CustomUser
+from investiments.services.operation_import_service import (
+    IMPORT_CHUNK_SIZE,
+    OperationImportService,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa operações de um CSV da corretora com as colunas '
+        'code,type,order_type,quantity,unit_price,operation_date'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--user', type=int, required=True, dest='user_id')
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(pk=options['user_id'])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"usuário {options['user_id']} não encontrado")
+
+        path = options['path']
+        service = OperationImportService(user, chunk_size=options['chunk_size'])
+        try:
+            with open(path, newline='', encoding='utf-8-sig') as operations_file:
+                result = service.import_csv(operations_file)
+        except OSError as error:
+            raise CommandError(f'não foi possível ler {path}: {error}')
+
+        for error in result.errors[:20]:
+            self.stderr.write(f"{path}:{error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f'{path}: {result.imported} operações importadas, '
+            f'{result.created_assets} ativos e {result.created_cards} cards criados, '
+            f'{result.error_count} linhas com erro'
+        ))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from costumers.models import CustomUser
+from investiments.services.position_service import PositionService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula as posições mensais de todos os ativos a partir das operações'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='id do usuário a recalcular (pode ser repetido); padrão: todos'
+        )
+
+    def handle(self, *args, **options):
+        users = CustomUser.objects.order_by('pk')
+        if options['user_ids']:
+            users = users.filter(pk__in=options['user_ids'])
+
+        rebuilt = 0
+        for user in users.iterator():
+            PositionService.rebuild_user(user)
+            rebuilt += 1
+        self.stdout.write(
+            self.style.SUCCESS(f'posições recalculadas para {rebuilt} usuário(s)')
+        )
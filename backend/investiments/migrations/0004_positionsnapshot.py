@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0002_alter_asset_options"),
+        ("investiments", "0003_alter_cardinvestiment_options_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PositionSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("reference_month", models.DateField(verbose_name="Mês De Referência")),
+                (
+                    "quantity",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=18, verbose_name="Quantidade"
+                    ),
+                ),
+                (
+                    "average_price",
+                    models.DecimalField(
+                        decimal_places=6, max_digits=18, verbose_name="Preço Médio"
+                    ),
+                ),
+                (
+                    "invested_capital",
+                    models.DecimalField(
+                        decimal_places=2,
+                        max_digits=20,
+                        verbose_name="Capital Investido",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "asset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="position_snapshots",
+                        to="assets.asset",
+                        verbose_name="Ativo",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="position_snapshots",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Posição Do Ativo No Mês",
+                "verbose_name_plural": "Posições Dos Ativos Por Mês",
+                "ordering": ["asset", "reference_month"],
+                "indexes": [
+                    models.Index(
+                        fields=["user", "reference_month"],
+                        name="position_user_month_idx",
+                    )
+                ],
+                "unique_together": {("asset", "reference_month")},
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("investiments", "0004_positionsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="positionsnapshot",
+            name="realized_result",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                max_digits=20,
+                verbose_name="Resultado Realizado No Mês",
+            ),
+        ),
+        migrations.AddField(
+            model_name="positionsnapshot",
+            name="sold_amount",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                max_digits=20,
+                verbose_name="Total Vendido No Mês",
+            ),
+        ),
+    ]
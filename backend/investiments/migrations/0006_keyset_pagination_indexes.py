@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_assetprice"),
+        ("investiments", "0005_positionsnapshot_realized_result"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cardinvestiment",
+            index=models.Index(
+                fields=["user", "-year", "-month", "-id"],
+                name="card_inv_user_period_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="iteminvestiment",
+            index=models.Index(
+                fields=["-operation_date", "-id"], name="item_inv_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_assetprice"),
+        ("investiments", "0006_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="iteminvestiment",
+            name="item_inv_date_idx",
+        ),
+        migrations.AddIndex(
+            model_name="iteminvestiment",
+            index=models.Index(
+                fields=["card", "-operation_date", "-id"], name="item_inv_card_date_idx"
+            ),
+        ),
+    ]
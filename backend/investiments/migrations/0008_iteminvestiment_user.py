@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_card_user(apps, schema_editor):
+    CardInvestiment = apps.get_model("investiments", "CardInvestiment")
+    ItemInvestiment = apps.get_model("investiments", "ItemInvestiment")
+    ItemInvestiment.objects.update(
+        user_id=Subquery(
+            CardInvestiment.objects.filter(pk=OuterRef("card_id")).values("user_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("investiments", "0007_item_card_date_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="iteminvestiment",
+            name="user",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="investiment_items",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Usuário",
+            ),
+        ),
+        migrations.RunPython(copy_card_user, migrations.RunPython.noop),
+    ]
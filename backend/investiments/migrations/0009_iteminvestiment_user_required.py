@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("investiments", "0008_iteminvestiment_user"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="iteminvestiment",
+            name="user",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="investiment_items",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Usuário",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="iteminvestiment",
+            index=models.Index(
+                fields=["user", "-operation_date", "-id"], name="item_inv_user_date_idx"
+            ),
+        ),
+    ]
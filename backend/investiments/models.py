@@ -24,6 +24,11 @@ class CardInvestiment(models.Model):
         verbose_name = 'Card De Investimento Do Mês'
         unique_together = ('month', 'year', 'user')
         ordering = ['-year', '-month']
+        indexes = [
+            models.Index(
+                fields=['user', '-year', '-month', '-id'], name='card_inv_user_period_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.year}/{self.month}'
@@ -41,6 +46,13 @@ class ItemInvestiment(models.Model):
         related_name='itens',
         verbose_name='Card do Mês'
     )
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='investiment_items',
+        verbose_name='Usuário',
+        editable=False
+    )
     order_type = models.CharField(
         max_length=6,
         choices=OrderType.choices,
@@ -63,6 +75,60 @@ class ItemInvestiment(models.Model):
 
     class Meta:
         verbose_name = 'Item De Investimento Do Mês'
+        indexes = [
+            models.Index(
+                fields=['card', '-operation_date', '-id'], name='item_inv_card_date_idx'
+            ),
+            models.Index(
+                fields=['user', '-operation_date', '-id'], name='item_inv_user_date_idx'
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.user_id = self.card.user_id
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f'{self.order_type} de {self.asset.code} em {self.operation_date}'
+
+
+class PositionSnapshot(models.Model):
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='position_snapshots',
+        verbose_name='Usuário'
+    )
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.CASCADE,
+        related_name='position_snapshots',
+        verbose_name='Ativo'
+    )
+    reference_month = models.DateField(verbose_name='Mês De Referência')
+    quantity = models.DecimalField(max_digits=18, decimal_places=2, verbose_name='Quantidade')
+    average_price = models.DecimalField(
+        max_digits=18, decimal_places=6, verbose_name='Preço Médio'
+    )
+    invested_capital = models.DecimalField(
+        max_digits=20, decimal_places=2, verbose_name='Capital Investido'
+    )
+    sold_amount = models.DecimalField(
+        max_digits=20, decimal_places=2, default=0, verbose_name='Total Vendido No Mês'
+    )
+    realized_result = models.DecimalField(
+        max_digits=20, decimal_places=2, default=0, verbose_name='Resultado Realizado No Mês'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Posição Do Ativo No Mês'
+        verbose_name_plural = 'Posições Dos Ativos Por Mês'
+        ordering = ['asset', 'reference_month']
+        unique_together = ('asset', 'reference_month')
+        indexes = [
+            models.Index(fields=['user', 'reference_month'], name='position_user_month_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.asset} em {self.reference_month:%m/%Y}: {self.quantity}'
@@ -1,7 +1,9 @@
-from rest_framework.pagination import PageNumberPagination
+from core.pagination import KeysetPagination
 
 
-class StardardResultSetPagination(PageNumberPagination):
-    page_size = 3
-    page_query_param = 'page_size'
-    max_page_size = 100
+class CardInvestimentKeysetPagination(KeysetPagination):
+    ordering = ('-year', '-month', '-id')
+
+
+class ItemInvestimentKeysetPagination(KeysetPagination):
+    ordering = ('-operation_date', '-id')
@@ -1,11 +1,12 @@
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
-from .models import CardInvestiment, ItemInvestiment
+from .models import CardInvestiment, ItemInvestiment, PositionSnapshot
 from assets.serializer import AssetSerializer
 from assets.models import Asset
+from core.instrumentation import TimedSerializerMixin
 
 
-class ItemInvestimentSerializer(serializers.ModelSerializer):
+class ItemInvestimentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     asset = AssetSerializer(read_only=True)
     asset_id = serializers.PrimaryKeyRelatedField(
         queryset=Asset.objects.all(),
@@ -30,7 +31,7 @@ class ItemInvestimentSerializer(serializers.ModelSerializer):
         }
 
 
-class CardInvestimentSerializer(serializers.ModelSerializer):
+class CardInvestimentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
     itens = ItemInvestimentSerializer(many=True, read_only=True)
 
@@ -44,3 +45,30 @@ class CardInvestimentSerializer(serializers.ModelSerializer):
                 message='Já existe um registro de investimentos para este mês e ano.',
             )
         ]
+
+
+class CardInvestimentSummarySerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    buy_volume = serializers.DecimalField(max_digits=20, decimal_places=2, read_only=True)
+    sell_volume = serializers.DecimalField(max_digits=20, decimal_places=2, read_only=True)
+    items_count = serializers.IntegerField(read_only=True)
+    distinct_assets = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = CardInvestiment
+        fields = [
+            'id',
+            'month',
+            'year',
+            'buy_volume',
+            'sell_volume',
+            'items_count',
+            'distinct_assets'
+        ]
+
+
+class PositionSnapshotSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    asset = AssetSerializer(read_only=True)
+
+    class Meta:
+        model = PositionSnapshot
+        fields = ['asset', 'reference_month', 'quantity', 'average_price', 'invested_capital']
@@ -0,0 +1,114 @@
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+from django.db.models import Sum
+
+from assets.models import TypeAsset
+from investiments.models import ItemInvestiment, OrderType, PositionSnapshot
+from investiments.services.position_service import MONEY_PLACES, Position, PositionService
+
+TAX_RATES = {
+    TypeAsset.ACAO: Decimal('0.15'),
+    TypeAsset.FII: Decimal('0.20'),
+    TypeAsset.BDR: Decimal('0.15'),
+    TypeAsset.ETF: Decimal('0.15'),
+}
+LOSS_GROUPS = {
+    TypeAsset.ACAO: 'common',
+    TypeAsset.BDR: 'common',
+    TypeAsset.ETF: 'common',
+    TypeAsset.FII: 'fii',
+}
+STOCK_SALES_EXEMPTION_LIMIT = Decimal('20000.00')
+
+
+class CapitalGainsService:
+    def __init__(self, user):
+        self.user = user
+
+    def monthly_results(self, year: int) -> list[dict]:
+        rows = PositionSnapshot.objects.filter(
+            user=self.user, reference_month__lt=datetime.date(year + 1, 1, 1)
+        ).values('reference_month', 'asset__type').annotate(
+            sold_amount=Sum('sold_amount'), realized_result=Sum('realized_result')
+        ).order_by('reference_month')
+
+        by_month = defaultdict(dict)
+        for row in rows:
+            by_month[row['reference_month']][row['asset__type']] = row
+
+        carried_losses = defaultdict(Decimal)
+        results = []
+        for month in sorted(by_month):
+            month_result = {'month': month.strftime('%Y-%m'), 'types': {}}
+            month_tax_due = Decimal('0')
+            # losses of the month offset gains of the same group in that month
+            month_rows = sorted(
+                by_month[month].items(), key=lambda item: (item[1]['realized_result'] or 0) >= 0
+            )
+            for asset_type, row in month_rows:
+                entry = self._apply_month(asset_type, row, carried_losses)
+                month_result['types'][asset_type] = entry
+                month_tax_due += Decimal(entry['tax_due'])
+            month_result['types'] = dict(sorted(month_result['types'].items()))
+            month_result['tax_due'] = str(month_tax_due)
+            if month.year == year:
+                results.append(month_result)
+        return results
+
+    def _apply_month(self, asset_type: str, row: dict, carried_losses: dict) -> dict:
+        sold_amount = row['sold_amount'] or Decimal('0')
+        realized_result = row['realized_result'] or Decimal('0')
+        exempt = (
+            asset_type == TypeAsset.ACAO
+            and realized_result > 0
+            and sold_amount <= STOCK_SALES_EXEMPTION_LIMIT
+        )
+        loss_group = LOSS_GROUPS.get(asset_type, asset_type)
+        loss_used = Decimal('0')
+        taxable_result = Decimal('0')
+        if realized_result < 0:
+            carried_losses[loss_group] += -realized_result
+        elif not exempt:
+            loss_used = min(carried_losses[loss_group], realized_result)
+            carried_losses[loss_group] -= loss_used
+            taxable_result = realized_result - loss_used
+
+        tax_rate = TAX_RATES.get(asset_type, Decimal('0'))
+        return {
+            'sold_amount': str(sold_amount.quantize(MONEY_PLACES)),
+            'realized_result': str(realized_result.quantize(MONEY_PLACES)),
+            'exempt': exempt,
+            'loss_used': str(loss_used.quantize(MONEY_PLACES)),
+            'loss_carried_forward': str(carried_losses[loss_group].quantize(MONEY_PLACES)),
+            'taxable_result': str(taxable_result.quantize(MONEY_PLACES)),
+            'tax_rate': str(tax_rate),
+            'tax_due': str((taxable_result * tax_rate).quantize(MONEY_PLACES)),
+        }
+
+    def sells(self, year: int, month: int) -> list[dict]:
+        first_date = datetime.date(year, month, 1)
+        positions = PositionService.positions_before_month(self.user, first_date)
+        items = ItemInvestiment.objects.filter(
+            user=self.user,
+            operation_date__gte=first_date,
+            operation_date__lt=(first_date + datetime.timedelta(days=32)).replace(day=1)
+        ).select_related('asset').order_by('operation_date', 'id')
+
+        sells = []
+        for item in items:
+            position = positions.setdefault(item.asset_id, Position())
+            average_price = position.average_price
+            realized_result = position.apply(item.order_type, item.quantity, item.unit_price)
+            if item.order_type != OrderType.SELL:
+                continue
+            sells.append({
+                'id': item.id,
+                'asset': {'id': item.asset_id, 'code': item.asset.code, 'type': item.asset.type},
+                'operation_date': item.operation_date,
+                'quantity': str(item.quantity),
+                'unit_price': str(item.unit_price),
+                'average_price': str(average_price),
+                'realized_result': str(realized_result.quantize(MONEY_PLACES)),
+            })
+        return sells
@@ -0,0 +1,186 @@
+import csv
+from decimal import Decimal
+from django.db import transaction
+
+from assets.models import Asset, TypeAsset
+from core.parsing import parse_amount, parse_date
+from investiments.models import CardInvestiment, ItemInvestiment, OrderType
+from investiments.services.portfolio_cache_service import bump_data_version_on_commit
+from investiments.services.position_service import PositionService, first_day_of_month
+
+IMPORT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+ORDER_TYPES = {
+    'BUY': OrderType.BUY,
+    'C': OrderType.BUY,
+    'COMPRA': OrderType.BUY,
+    'SELL': OrderType.SELL,
+    'V': OrderType.SELL,
+    'VENDA': OrderType.SELL,
+}
+CODE_MAX_LENGTH = Asset._meta.get_field('code').max_length
+UNIT_PRICE_LIMIT = Decimal('1e8')
+QUANTITY_LIMIT = Decimal('1e16')
+
+
+class OperationImportResult:
+    def __init__(self):
+        self.imported = 0
+        self.created_assets = 0
+        self.created_cards = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line: int, error: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': error})
+
+    def as_dict(self) -> dict:
+        return {
+            'imported': self.imported,
+            'created_assets': self.created_assets,
+            'created_cards': self.created_cards,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
+
+
+class ParsedOperation:
+    def __init__(self, code, asset_type, order_type, quantity, unit_price, operation_date):
+        self.code = code
+        self.asset_type = asset_type
+        self.order_type = order_type
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.operation_date = operation_date
+
+    @property
+    def card_key(self) -> tuple[int, int]:
+        return self.operation_date.year, self.operation_date.month
+
+
+def parse_operation(row: dict) -> ParsedOperation:
+    code = (row.get('code') or '').upper().strip()
+    if not code or len(code) > CODE_MAX_LENGTH:
+        raise ValueError(f'código do ativo inválido: {code!r}')
+
+    asset_type = (row.get('type') or TypeAsset.ACAO).upper().strip()
+    if asset_type not in TypeAsset.values:
+        raise ValueError(f'tipo de ativo inválido: {asset_type!r}')
+
+    order_type = ORDER_TYPES.get((row.get('order_type') or '').upper().strip())
+    if order_type is None:
+        raise ValueError(f"tipo de ordem inválido: {row.get('order_type')!r}")
+
+    quantity = parse_amount(row.get('quantity'), 'quantity', QUANTITY_LIMIT)
+    unit_price = parse_amount(row.get('unit_price'), 'unit_price', UNIT_PRICE_LIMIT)
+    operation_date = parse_date(row.get('operation_date'), 'data da operação')
+    return ParsedOperation(code, asset_type, order_type, quantity, unit_price, operation_date)
+
+
+class OperationImportService:
+    def __init__(self, user, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.assets = dict(Asset.objects.filter(user=user).values_list('code', 'id'))
+        self.cards = {
+            (year, month): card_id
+            for year, month, card_id in CardInvestiment.objects.filter(
+                user=user
+            ).values_list('year', 'month', 'id')
+        }
+        self.dirty_assets = {}
+
+    def import_csv(self, file) -> OperationImportResult:
+        result = OperationImportResult()
+        reader = csv.DictReader(file)
+        chunk = []
+        try:
+            for line_number, row in enumerate(reader, start=2):
+                try:
+                    chunk.append(parse_operation(row))
+                except (ValueError, AttributeError) as error:
+                    result.add_error(line_number, str(error))
+                    continue
+                if len(chunk) >= self.chunk_size:
+                    self._save_chunk(chunk, result)
+                    chunk = []
+            if chunk:
+                self._save_chunk(chunk, result)
+        except (csv.Error, UnicodeDecodeError) as error:
+            result.add_error(reader.line_num + 1, f'arquivo CSV inválido: {error}')
+        finally:
+            if self.dirty_assets:
+                PositionService.recompute(self.dirty_assets)
+        return result
+
+    @transaction.atomic
+    def _save_chunk(self, chunk: list[ParsedOperation], result: OperationImportResult) -> None:
+        result.created_assets += self._create_missing_assets(chunk)
+        result.created_cards += self._create_missing_cards(chunk)
+        ItemInvestiment.objects.bulk_create([
+            ItemInvestiment(
+                asset_id=self.assets[operation.code],
+                card_id=self.cards[operation.card_key],
+                user=self.user,
+                order_type=operation.order_type,
+                quantity=operation.quantity,
+                unit_price=operation.unit_price,
+                operation_date=operation.operation_date
+            )
+            for operation in chunk
+        ], batch_size=1000)
+        result.imported += len(chunk)
+
+        for operation in chunk:
+            asset_id = self.assets[operation.code]
+            month = first_day_of_month(operation.operation_date)
+            self.dirty_assets[asset_id] = min(self.dirty_assets.get(asset_id, month), month)
+        bump_data_version_on_commit(self.user.pk)
+
+    def _create_missing_assets(self, chunk: list[ParsedOperation]) -> int:
+        missing = {}
+        for operation in chunk:
+            if operation.code not in self.assets:
+                missing.setdefault(operation.code, operation.asset_type)
+        if not missing:
+            return 0
+        self.assets.update(Asset.objects.filter(
+            user=self.user, code__in=missing.keys()
+        ).values_list('code', 'id'))
+        to_create = {
+            code: asset_type for code, asset_type in missing.items() if code not in self.assets
+        }
+        if not to_create:
+            return 0
+        Asset.objects.bulk_create([
+            Asset(code=code, type=asset_type, user=self.user)
+            for code, asset_type in to_create.items()
+        ], ignore_conflicts=True)
+        self.assets.update(Asset.objects.filter(
+            user=self.user, code__in=to_create.keys()
+        ).values_list('code', 'id'))
+        return len(to_create)
+
+    def _create_missing_cards(self, chunk: list[ParsedOperation]) -> int:
+        missing = {operation.card_key for operation in chunk} - self.cards.keys()
+        if not missing:
+            return 0
+        self._load_cards(missing)
+        to_create = missing - self.cards.keys()
+        if not to_create:
+            return 0
+        CardInvestiment.objects.bulk_create([
+            CardInvestiment(year=year, month=month, user=self.user) for year, month in to_create
+        ], ignore_conflicts=True)
+        self._load_cards(to_create)
+        return len(to_create)
+
+    def _load_cards(self, keys: set) -> None:
+        self.cards.update({
+            (year, month): card_id
+            for year, month, card_id in CardInvestiment.objects.filter(
+                user=self.user, year__in={year for year, _ in keys}
+            ).values_list('year', 'month', 'id')
+        })
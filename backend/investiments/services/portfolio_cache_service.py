@@ -0,0 +1,73 @@
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from assets.services.price_service import get_prices_version
+from core.cache_versions import bump_version, bump_version_on_commit, get_version
+from investiments.models import CardInvestiment
+from investiments.services.timeseries_service import PortfolioTimeSeriesService
+
+VERSION_KEY = 'investiments:data-version:{user_id}'
+TIMESERIES_KEY = (
+    'investiments:timeseries:{user_id}:{version}:{prices_version}:{start}:{end}:{interval}'
+)
+
+_pending = threading.local()
+
+
+def get_data_version(user_id: int) -> int:
+    return get_version(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_data_version_on_commit(user_id: int) -> None:
+    bump_version_on_commit(VERSION_KEY.format(user_id=user_id))
+
+
+def bump_card_data_version_on_commit(card_id: int) -> None:
+    if not hasattr(_pending, 'card_users'):
+        _pending.card_users = {}
+        _pending.users = set()
+    if card_id not in _pending.card_users:
+        _pending.card_users[card_id] = CardInvestiment.objects.filter(pk=card_id).values_list(
+            'user_id', flat=True
+        ).first()
+    user_id = _pending.card_users[card_id]
+    if user_id is not None:
+        _pending.users.add(user_id)
+        transaction.on_commit(flush_pending_versions)
+
+
+def flush_pending_versions() -> None:
+    users = getattr(_pending, 'users', None)
+    if not users:
+        return
+    _pending.card_users = {}
+    _pending.users = set()
+    for user_id in users:
+        bump_version(VERSION_KEY.format(user_id=user_id))
+
+
+class CachedPortfolioTimeSeries:
+    def __init__(self, user, start=None, end=None, interval='daily'):
+        self.service = PortfolioTimeSeriesService(user, start, end, interval)
+        self.hit = False
+
+    def build(self) -> dict:
+        service = self.service
+        key = TIMESERIES_KEY.format(
+            user_id=service.user.pk,
+            version=get_data_version(service.user.pk),
+            prices_version=get_prices_version(),
+            start=service.start,
+            end=service.end,
+            interval=service.interval
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            self.hit = True
+            return cached
+
+        series = service.build()
+        cache.set(key, series, timeout=settings.PORTFOLIO_TIMESERIES_CACHE_TIMEOUT)
+        return series
@@ -0,0 +1,186 @@
+import datetime
+import threading
+from collections import defaultdict
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+
+from assets.models import Asset
+from costumers.models import CustomUser
+from investiments.models import ItemInvestiment, OrderType, PositionSnapshot
+
+QUANTITY_PLACES = Decimal('0.01')
+PRICE_PLACES = Decimal('0.000001')
+MONEY_PLACES = Decimal('0.01')
+
+_pending = threading.local()
+
+
+def first_day_of_month(date: datetime.date) -> datetime.date:
+    return date.replace(day=1)
+
+
+class Position:
+    def __init__(self, quantity: Decimal = Decimal('0'), average_price: Decimal = Decimal('0')):
+        self.quantity = quantity
+        self.average_price = average_price
+
+    def apply(self, order_type: str, quantity: Decimal, unit_price: Decimal) -> Decimal:
+        if order_type == OrderType.BUY:
+            total_quantity = self.quantity + quantity
+            if total_quantity > 0:
+                self.average_price = (
+                    (self.quantity * self.average_price + quantity * unit_price) / total_quantity
+                ).quantize(PRICE_PLACES)
+            self.quantity = total_quantity
+            return Decimal('0')
+
+        sold_quantity = self.sellable_quantity(quantity)
+        realized_result = sold_quantity * (unit_price - self.average_price)
+        self.quantity -= sold_quantity
+        if self.quantity <= 0:
+            self.quantity = Decimal('0')
+            self.average_price = Decimal('0')
+        return realized_result
+
+    def sellable_quantity(self, quantity: Decimal) -> Decimal:
+        return min(quantity, self.quantity)
+
+
+class MonthState:
+    def __init__(self):
+        self.quantity = Decimal('0')
+        self.average_price = Decimal('0')
+        self.sold_amount = Decimal('0')
+        self.realized_result = Decimal('0')
+
+
+def mark_asset_dirty(asset_id: int, operation_date: datetime.date) -> None:
+    if not hasattr(_pending, 'assets'):
+        _pending.assets = {}
+    month = first_day_of_month(operation_date)
+    current = _pending.assets.get(asset_id)
+    _pending.assets[asset_id] = month if current is None else min(current, month)
+    transaction.on_commit(flush_dirty_positions)
+
+
+def flush_dirty_positions() -> None:
+    assets = getattr(_pending, 'assets', None)
+    if not assets:
+        return
+    _pending.assets = {}
+    PositionService.recompute(assets)
+
+
+class PositionService:
+    @staticmethod
+    @transaction.atomic
+    def recompute(from_months: dict[int, datetime.date]) -> None:
+        asset_users = dict(
+            Asset.objects.filter(id__in=from_months.keys()).values_list('id', 'user_id')
+        )
+        if not asset_users:
+            return
+        # Serialize recomputes per user, as the monthly expense summary does, so concurrent
+        # on_commit flushes cannot both delete and re-insert the same snapshots.
+        list(CustomUser.objects.select_for_update().filter(
+            pk__in=set(asset_users.values())
+        ).order_by('pk').values_list('pk'))
+        from_months = {
+            asset_id: month for asset_id, month in from_months.items() if asset_id in asset_users
+        }
+        earliest = min(from_months.values())
+
+        positions = {asset_id: Position() for asset_id in from_months}
+        starting_snapshots = PositionSnapshot.objects.filter(
+            asset_id__in=from_months.keys(),
+            reference_month__lt=max(from_months.values())
+        ).order_by('reference_month').values_list(
+            'asset_id', 'reference_month', 'quantity', 'average_price'
+        )
+        for asset_id, reference_month, quantity, average_price in starting_snapshots:
+            if reference_month < from_months[asset_id]:
+                positions[asset_id] = Position(quantity, average_price)
+
+        items = ItemInvestiment.objects.filter(
+            asset_id__in=from_months.keys(), operation_date__gte=earliest
+        ).order_by('operation_date', 'id').values_list(
+            'asset_id', 'order_type', 'quantity', 'unit_price', 'operation_date'
+        )
+        month_states = defaultdict(dict)
+        for asset_id, order_type, quantity, unit_price, operation_date in items.iterator(
+            chunk_size=5000
+        ):
+            month = first_day_of_month(operation_date)
+            if month < from_months[asset_id]:
+                continue
+            position = positions[asset_id]
+            state = month_states[asset_id].setdefault(month, MonthState())
+            if order_type == OrderType.SELL:
+                state.sold_amount += position.sellable_quantity(quantity) * unit_price
+                state.realized_result += position.apply(order_type, quantity, unit_price)
+            else:
+                position.apply(order_type, quantity, unit_price)
+            state.quantity, state.average_price = position.quantity, position.average_price
+
+        PositionSnapshot.objects.filter(reduce(or_, (
+            Q(asset_id=asset_id, reference_month__gte=month)
+            for asset_id, month in from_months.items()
+        ))).delete()
+        PositionSnapshot.objects.bulk_create([
+            PositionSnapshot(
+                user_id=asset_users[asset_id],
+                asset_id=asset_id,
+                reference_month=month,
+                quantity=state.quantity.quantize(QUANTITY_PLACES),
+                average_price=state.average_price,
+                invested_capital=(state.quantity * state.average_price).quantize(MONEY_PLACES),
+                sold_amount=state.sold_amount.quantize(MONEY_PLACES),
+                realized_result=state.realized_result.quantize(MONEY_PLACES)
+            )
+            for asset_id, states in month_states.items()
+            for month, state in states.items()
+        ], batch_size=1000)
+
+    @classmethod
+    def rebuild_user(cls, user) -> None:
+        asset_ids = Asset.objects.filter(user=user).values_list('id', flat=True)
+        cls.recompute({asset_id: datetime.date.min for asset_id in asset_ids})
+
+    @staticmethod
+    def latest_positions(user, as_of: datetime.date | None = None, include_closed=False):
+        snapshots = PositionSnapshot.objects.filter(asset=OuterRef('asset'))
+        if as_of is not None:
+            snapshots = snapshots.filter(reference_month__lte=as_of)
+        latest_id = snapshots.order_by('-reference_month').values('id')[:1]
+        queryset = PositionSnapshot.objects.filter(
+            user=user, id=Subquery(latest_id)
+        ).select_related('asset').order_by('asset__code')
+        if not include_closed:
+            queryset = queryset.filter(quantity__gt=0)
+        return queryset
+
+    @staticmethod
+    def positions_before_month(user, month: datetime.date) -> dict[int, Position]:
+        previous_month = (month - datetime.timedelta(days=1)).replace(day=1)
+        return {
+            snapshot.asset_id: Position(snapshot.quantity, snapshot.average_price)
+            for snapshot in PositionService.latest_positions(
+                user, as_of=previous_month, include_closed=True
+            )
+        }
+
+    @classmethod
+    def positions_at(cls, user, date: datetime.date) -> dict[int, Position]:
+        month = first_day_of_month(date)
+        positions = cls.positions_before_month(user, month)
+        items = ItemInvestiment.objects.filter(
+            user=user, operation_date__gte=month, operation_date__lte=date
+        ).order_by('operation_date', 'id').values_list(
+            'asset_id', 'order_type', 'quantity', 'unit_price'
+        )
+        for asset_id, order_type, quantity, unit_price in items:
+            positions.setdefault(asset_id, Position()).apply(order_type, quantity, unit_price)
+        return positions
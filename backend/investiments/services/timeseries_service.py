@@ -0,0 +1,124 @@
+import datetime
+import numpy as np
+
+from assets.models import Asset, AssetPrice
+from assets.services.price_service import annotate_prices_as_of
+from investiments.models import ItemInvestiment
+from investiments.services.position_service import Position
+
+INTERVALS = ('daily', 'weekly', 'monthly')
+
+
+def first_operation_date(user) -> datetime.date | None:
+    return ItemInvestiment.objects.filter(user=user).order_by(
+        'operation_date'
+    ).values_list('operation_date', flat=True).first()
+
+
+class PortfolioTimeSeriesService:
+    def __init__(self, user, start: datetime.date | None = None,
+                 end: datetime.date | None = None, interval: str = 'daily'):
+        self.user = user
+        self.start = start
+        self.end = end or datetime.date.today()
+        self.interval = interval
+
+    def build(self) -> dict:
+        items = list(ItemInvestiment.objects.filter(
+            user=self.user, operation_date__lte=self.end
+        ).order_by('operation_date', 'id').values_list(
+            'asset_id', 'order_type', 'quantity', 'unit_price', 'operation_date'
+        ))
+        start = self.start or (items[0][4] if items else self.end)
+        result = {'interval': self.interval, 'start': start, 'end': self.end, 'points': []}
+        if start > self.end:
+            return result
+
+        days = (self.end - start).days + 1
+        asset_ids = sorted({item[0] for item in items})
+        rows = {asset_id: row for row, asset_id in enumerate(asset_ids)}
+        quantities, invested = self._operation_matrices(items, rows, start, days)
+        prices = self._price_matrix(items, rows, start, days)
+
+        market_value = np.where(np.isnan(prices), 0.0, prices * quantities).sum(axis=0)
+        dates = np.datetime64(start, 'D') + np.arange(days)
+        for index in self._sample_indexes(dates):
+            result['points'].append({
+                'date': dates[index].item(),
+                'invested_capital': round(float(invested[index]), 2),
+                'market_value': round(float(market_value[index]), 2),
+            })
+        return result
+
+    @staticmethod
+    def _operation_matrices(items, rows, start, days):
+        quantity_deltas = np.zeros((len(rows), days))
+        invested_deltas = np.zeros(days)
+        if not items:
+            return quantity_deltas, invested_deltas
+
+        positions = {}
+        asset_rows = np.empty(len(items), dtype=np.intp)
+        day_indexes = np.empty(len(items), dtype=np.intp)
+        quantity_changes = np.empty(len(items))
+        invested_changes = np.empty(len(items))
+        for index, (asset_id, order_type, quantity, unit_price, date) in enumerate(items):
+            position = positions.setdefault(asset_id, Position())
+            previous_quantity = position.quantity
+            previous_invested = position.quantity * position.average_price
+            position.apply(order_type, quantity, unit_price)
+            invested = position.quantity * position.average_price
+            asset_rows[index] = rows[asset_id]
+            day_indexes[index] = max((date - start).days, 0)
+            quantity_changes[index] = position.quantity - previous_quantity
+            invested_changes[index] = invested - previous_invested
+
+        np.add.at(quantity_deltas, (asset_rows, day_indexes), quantity_changes)
+        np.add.at(invested_deltas, day_indexes, invested_changes)
+        return np.cumsum(quantity_deltas, axis=1), np.cumsum(invested_deltas)
+
+    def _price_matrix(self, items, rows, start, days):
+        prices = np.full((len(rows), days), np.nan)
+        if not rows:
+            return prices
+
+        previous_trades = {}
+        for asset_id, _, _, unit_price, operation_date in items:
+            if operation_date < start:
+                previous_trades[asset_id] = (operation_date, unit_price)
+
+        assets = annotate_prices_as_of(
+            Asset.objects.filter(id__in=rows.keys()), start - datetime.timedelta(days=1)
+        ).values_list('id', 'code', 'price', 'price_date')
+        code_rows = {}
+        for asset_id, code, price, price_date in assets:
+            code_rows.setdefault(code, []).append(rows[asset_id])
+            trade_date, trade_price = previous_trades.get(asset_id, (None, None))
+            if price is None or (trade_date is not None and trade_date > price_date):
+                price = trade_price
+            if price is not None:
+                prices[rows[asset_id], 0] = float(price)
+
+        for asset_id, _, _, unit_price, operation_date in items:
+            if operation_date >= start:
+                prices[rows[asset_id], (operation_date - start).days] = float(unit_price)
+
+        quotes = AssetPrice.objects.filter(
+            code__in=code_rows.keys(), date__gte=start, date__lte=self.end
+        ).values_list('code', 'date', 'close')
+        for code, date, close in quotes.iterator(chunk_size=5000):
+            prices[code_rows[code], (date - start).days] = float(close)
+
+        observed = np.where(np.isnan(prices), 0, np.arange(days))
+        np.maximum.accumulate(observed, axis=1, out=observed)
+        return prices[np.arange(len(rows))[:, None], observed]
+
+    def _sample_indexes(self, dates):
+        if self.interval == 'daily':
+            return range(len(dates))
+        if self.interval == 'weekly':
+            periods = (dates.astype('int64') + 3) // 7
+        else:
+            periods = dates.astype('datetime64[M]').astype('int64')
+        last_of_period = np.flatnonzero(np.diff(periods))
+        return np.append(last_of_period, len(dates) - 1)
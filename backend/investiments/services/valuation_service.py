@@ -0,0 +1,59 @@
+import datetime
+from decimal import Decimal
+
+from assets.services.price_service import user_assets_with_prices
+from investiments.services.position_service import MONEY_PLACES, PositionService
+
+
+def _decimal_str(value: Decimal | None) -> str | None:
+    return None if value is None else str(value)
+
+
+class PortfolioValuationService:
+    def __init__(self, user, date: datetime.date):
+        self.user = user
+        self.date = date
+
+    def valuate(self) -> dict:
+        positions = PositionService.positions_at(self.user, self.date)
+        assets = user_assets_with_prices(self.user, self.date)
+
+        invested_total = Decimal('0')
+        market_total = Decimal('0')
+        unpriced = []
+        rows = []
+        for asset_id, position in positions.items():
+            if position.quantity <= 0 or asset_id not in assets:
+                continue
+            asset = assets[asset_id]
+            invested_capital = (position.quantity * position.average_price).quantize(MONEY_PLACES)
+            market_value = None
+            unrealized_result = None
+            if asset.price is not None:
+                market_value = (position.quantity * asset.price).quantize(MONEY_PLACES)
+                unrealized_result = market_value - invested_capital
+                market_total += market_value
+            else:
+                unpriced.append(asset.code)
+            invested_total += invested_capital
+            rows.append({
+                'asset': {'id': asset.id, 'code': asset.code, 'type': asset.type},
+                'quantity': str(position.quantity),
+                'average_price': str(position.average_price),
+                'invested_capital': str(invested_capital),
+                'price': _decimal_str(asset.price),
+                'price_date': asset.price_date,
+                'market_value': _decimal_str(market_value),
+                'unrealized_result': _decimal_str(unrealized_result),
+            })
+        rows.sort(key=lambda row: row['asset']['code'])
+
+        return {
+            'date': self.date,
+            'positions': rows,
+            'totals': {
+                'invested_capital': str(invested_total.quantize(MONEY_PLACES)),
+                'market_value': str(market_total.quantize(MONEY_PLACES)),
+                'unpriced_assets': unpriced,
+            },
+        }
@@ -0,0 +1,49 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from assets.models import Asset
+from investiments.models import ItemInvestiment
+from investiments.services.portfolio_cache_service import (
+    bump_card_data_version_on_commit,
+    bump_data_version_on_commit
+)
+from investiments.services.position_service import mark_asset_dirty
+
+
+@receiver(pre_save, sender=ItemInvestiment)
+def remember_previous_item_position(sender, instance, raw=False, **kwargs):
+    instance._previous_position_key = None
+    if instance.pk and not raw:
+        instance._previous_position_key = sender.objects.filter(pk=instance.pk).values_list(
+            'asset_id', 'operation_date'
+        ).first()
+
+
+@receiver(post_save, sender=ItemInvestiment)
+def refresh_positions_on_item_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous_key = getattr(instance, '_previous_position_key', None)
+    if previous_key:
+        mark_asset_dirty(*previous_key)
+    mark_asset_dirty(instance.asset_id, instance.operation_date)
+
+
+@receiver(post_delete, sender=ItemInvestiment)
+def refresh_positions_on_item_delete(sender, instance, **kwargs):
+    mark_asset_dirty(instance.asset_id, instance.operation_date)
+
+
+@receiver(post_save, sender=ItemInvestiment)
+@receiver(post_delete, sender=ItemInvestiment)
+def bump_portfolio_version(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_card_data_version_on_commit(instance.card_id)
+
+
+@receiver(post_save, sender=Asset)
+def bump_portfolio_version_on_asset_change(sender, instance, raw=False, created=False, **kwargs):
+    if raw or created:
+        return
+    bump_data_version_on_commit(instance.user_id)
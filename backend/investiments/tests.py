@@ -0,0 +1,416 @@
+import datetime
+from decimal import Decimal
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from assets.models import Asset, AssetPrice, TypeAsset
+from costumers.models import CustomUser
+from investiments.models import CardInvestiment, ItemInvestiment, OrderType, PositionSnapshot
+from investiments.services.operation_import_service import OperationImportService
+from investiments.services.position_service import PositionService
+
+
+def create_operation(user, code: str, operation_date: datetime.date, quantity: str,
+                     unit_price: str, order_type: str = OrderType.BUY,
+                     asset_type: str = TypeAsset.ACAO) -> ItemInvestiment:
+    asset, _ = Asset.objects.get_or_create(user=user, code=code, defaults={'type': asset_type})
+    card, _ = CardInvestiment.objects.get_or_create(
+        user=user, year=operation_date.year, month=operation_date.month
+    )
+    return ItemInvestiment.objects.create(
+        card=card, asset=asset, order_type=order_type, quantity=Decimal(quantity),
+        unit_price=Decimal(unit_price), operation_date=operation_date
+    )
+
+
+class ItemInvestimentKeysetPaginationTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='keyset', password='keyset-password')
+        other = CustomUser.objects.create_user(username='other', password='other-password')
+        for day in range(1, 11):
+            for user in (self.user, other):
+                create_operation(user, 'PETR4', datetime.date(2025, 1 + day % 3, day), '1', '10')
+        # Two operations on the same day are ordered by id.
+        create_operation(self.user, 'VALE3', datetime.date(2025, 2, 5), '1', '10')
+        self.expected = list(
+            ItemInvestiment.objects.filter(card__user=self.user)
+            .order_by('-operation_date', '-id').values_list('id', flat=True)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _walk(self, url: str, direction: str) -> list[list[int]]:
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([item['id'] for item in response.data['results']])
+            url = response.data[direction]
+        return pages
+
+    def test_next_links_visit_every_item_once_in_order(self):
+        pages = self._walk(reverse('itens-investiments') + '?page_size=4', 'next')
+        self.assertEqual([item for page in pages for item in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [4, 4, 3])
+
+    def test_previous_links_walk_back_to_the_first_page(self):
+        last_url = reverse('itens-investiments') + '?page_size=4'
+        while True:
+            response = self.client.get(last_url)
+            if response.data['next'] is None:
+                break
+            last_url = response.data['next']
+
+        pages = self._walk(response.data['previous'], 'previous')
+        self.assertEqual(
+            [item for page in reversed(pages) for item in page], self.expected[:8]
+        )
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get(reverse('itens-investiments'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_items_copy_the_card_owner(self):
+        self.assertEqual(ItemInvestiment.objects.count(), 21)
+        self.assertFalse(ItemInvestiment.objects.exclude(user=F('card__user')).exists())
+
+    def test_user_item_pages_use_the_user_date_index(self):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE investiments_iteminvestiment')
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        queryset = ItemInvestiment.objects.filter(user=self.user).order_by(
+            '-operation_date', '-id'
+        )[:4]
+        self.assertIn('item_inv_user_date_idx', queryset.explain())
+
+
+class PositionServiceTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='positions', password='positions')
+
+    def _operate(self, *args, **kwargs) -> ItemInvestiment:
+        with self.captureOnCommitCallbacks(execute=True):
+            return create_operation(self.user, *args, **kwargs)
+
+    def _snapshots(self) -> list[tuple]:
+        return list(PositionSnapshot.objects.filter(user=self.user).order_by(
+            'reference_month'
+        ).values_list(
+            'reference_month', 'quantity', 'average_price', 'sold_amount', 'realized_result'
+        ))
+
+    def test_monthly_snapshots_follow_buys_and_sells(self):
+        self._operate('ITSA4', datetime.date(2025, 1, 10), '10', '10.00')
+        self._operate('ITSA4', datetime.date(2025, 1, 20), '10', '12.00')
+        self._operate('ITSA4', datetime.date(2025, 3, 5), '5', '15.00', OrderType.SELL)
+
+        self.assertEqual(self._snapshots(), [
+            (datetime.date(2025, 1, 1), Decimal('20.00'), Decimal('11.000000'),
+             Decimal('0.00'), Decimal('0.00')),
+            (datetime.date(2025, 3, 1), Decimal('15.00'), Decimal('11.000000'),
+             Decimal('75.00'), Decimal('20.00')),
+        ])
+
+    def test_overselling_clamps_sold_amount_and_result_alike(self):
+        self._operate('BBAS3', datetime.date(2025, 1, 10), '10', '10.00')
+        self._operate('BBAS3', datetime.date(2025, 2, 10), '15', '20.00', OrderType.SELL)
+
+        _, quantity, average_price, sold_amount, realized_result = self._snapshots()[-1]
+        self.assertEqual(quantity, Decimal('0.00'))
+        self.assertEqual(average_price, Decimal('0'))
+        self.assertEqual(sold_amount, Decimal('200.00'))
+        self.assertEqual(realized_result, Decimal('100.00'))
+
+    def test_deleting_an_operation_recomputes_later_months(self):
+        first = self._operate('WEGE3', datetime.date(2025, 1, 10), '10', '30.00')
+        self._operate('WEGE3', datetime.date(2025, 2, 10), '10', '40.00')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+
+        self.assertEqual(self._snapshots(), [
+            (datetime.date(2025, 2, 1), Decimal('10.00'), Decimal('40.000000'),
+             Decimal('0.00'), Decimal('0.00')),
+        ])
+
+    def test_recompute_locks_the_owner_before_rewriting_snapshots(self):
+        item = create_operation(self.user, 'ABEV3', datetime.date(2025, 1, 10), '1', '12.00')
+
+        with CaptureQueriesContext(connection) as queries:
+            PositionService.recompute({item.asset_id: datetime.date(2025, 1, 1)})
+
+        statements = [query['sql'] for query in queries.captured_queries]
+        lock = next(
+            index for index, sql in enumerate(statements) if 'costumers_customuser' in sql
+        )
+        rewrite = next(
+            index for index, sql in enumerate(statements)
+            if sql.startswith('DELETE') and 'positionsnapshot' in sql
+        )
+        self.assertLess(lock, rewrite)
+        if connection.features.has_select_for_update:
+            self.assertIn('FOR UPDATE', statements[lock])
+
+
+class CapitalGainsTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='gains', password='gains-password')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        operations = [
+            ('PETR4', (1, 10), '1000', '30.00', OrderType.BUY, TypeAsset.ACAO),
+            ('PETR4', (2, 10), '1000', '25.00', OrderType.SELL, TypeAsset.ACAO),
+            ('HGLG11', (3, 5), '10', '100.00', OrderType.BUY, TypeAsset.FII),
+            ('HGLG11', (3, 20), '10', '150.00', OrderType.SELL, TypeAsset.FII),
+            ('BOVA11', (4, 10), '100', '100.00', OrderType.BUY, TypeAsset.ETF),
+            ('BOVA11', (5, 10), '100', '130.00', OrderType.SELL, TypeAsset.ETF),
+            ('VALE3', (6, 5), '100', '50.00', OrderType.BUY, TypeAsset.ACAO),
+            ('VALE3', (6, 20), '100', '60.00', OrderType.SELL, TypeAsset.ACAO),
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            for code, (month, day), quantity, price, order_type, asset_type in operations:
+                create_operation(
+                    self.user, code, datetime.date(2025, month, day), quantity, price,
+                    order_type, asset_type
+                )
+
+    def _months(self) -> dict:
+        response = self.client.get(reverse('capital-gains'), {'year': 2025})
+        self.assertEqual(response.status_code, 200)
+        return {row['month']: row for row in response.data}
+
+    def test_losses_carry_forward_within_the_common_pool(self):
+        months = self._months()
+
+        february = months['2025-02']['types']['ACAO']
+        self.assertEqual(february['realized_result'], '-5000.00')
+        self.assertEqual(february['loss_carried_forward'], '5000.00')
+        self.assertEqual(months['2025-02']['tax_due'], '0.00')
+
+        may = months['2025-05']['types']['ETF']
+        self.assertEqual(may['realized_result'], '3000.00')
+        self.assertEqual(may['loss_used'], '3000.00')
+        self.assertEqual(may['loss_carried_forward'], '2000.00')
+        self.assertEqual(may['tax_due'], '0.00')
+
+    def test_fii_gains_do_not_use_stock_losses(self):
+        march = self._months()['2025-03']
+        self.assertEqual(march['types']['FII']['loss_used'], '0.00')
+        self.assertEqual(march['types']['FII']['tax_due'], '100.00')
+        self.assertEqual(march['tax_due'], '100.00')
+
+    def test_exempt_stock_sales_keep_the_carried_loss(self):
+        june = self._months()['2025-06']['types']['ACAO']
+        self.assertTrue(june['exempt'])
+        self.assertEqual(june['loss_used'], '0.00')
+        self.assertEqual(june['loss_carried_forward'], '2000.00')
+
+    def test_sells_report_average_price_and_result(self):
+        response = self.client.get(reverse('capital-gains-sells'), {'year': 2025, 'month': 2})
+
+        self.assertEqual(response.status_code, 200)
+        [sell] = response.data
+        self.assertEqual(sell['asset']['code'], 'PETR4')
+        self.assertEqual(Decimal(sell['average_price']), Decimal('30'))
+        self.assertEqual(sell['realized_result'], '-5000.00')
+
+    def test_out_of_range_year_is_rejected(self):
+        response = self.client.get(reverse('capital-gains'), {'year': 9999})
+        self.assertEqual(response.status_code, 400)
+
+
+class PortfolioValuationTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='valuation', password='valuation')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            create_operation(self.user, 'TAEE11', datetime.date(2025, 1, 10), '10', '30.00')
+            create_operation(self.user, 'KLBN11', datetime.date(2025, 1, 10), '5', '20.00')
+        AssetPrice.objects.create(code='TAEE11', date=datetime.date(2025, 1, 31), close='35.50')
+
+    def test_amounts_are_decimal_strings_and_unpriced_assets_are_null(self):
+        response = self.client.get(reverse('portfolio-valuation'), {'date': '2025-02-01'})
+
+        self.assertEqual(response.status_code, 200)
+        klabin, taesa = response.data['positions']
+        self.assertEqual(taesa['invested_capital'], '300.00')
+        self.assertEqual(taesa['market_value'], '355.00')
+        self.assertEqual(taesa['unrealized_result'], '55.00')
+        self.assertIsNone(klabin['market_value'])
+        self.assertIsNone(klabin['unrealized_result'])
+        self.assertEqual(response.data['totals'], {
+            'invested_capital': '400.00',
+            'market_value': '355.00',
+            'unpriced_assets': ['KLBN11'],
+        })
+
+    def test_invalid_date_is_rejected(self):
+        response = self.client.get(reverse('portfolio-valuation'), {'date': '01/02/2025'})
+        self.assertEqual(response.status_code, 400)
+
+
+class PortfolioTimeSeriesViewTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='series', password='series')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        create_operation(self.user, 'ITUB4', datetime.date(2010, 1, 5), '10', '20.00')
+
+    def test_long_histories_default_to_the_latest_allowed_range(self):
+        response = self.client.get(
+            reverse('portfolio-timeseries'), {'end': '2025-06-30', 'interval': 'monthly'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['start'], datetime.date(2015, 7, 1))
+        self.assertEqual(len(response.data['points']), 120)
+
+    def test_short_histories_start_at_the_first_operation(self):
+        response = self.client.get(
+            reverse('portfolio-timeseries'), {'end': '2010-03-31', 'interval': 'monthly'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['start'], datetime.date(2010, 1, 5))
+
+    def test_explicit_ranges_over_the_limit_are_rejected(self):
+        response = self.client.get(
+            reverse('portfolio-timeseries'), {'start': '2010-01-01', 'end': '2025-06-30'}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class CardInvestimentSummaryTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='cards', password='cards-password')
+        other = CustomUser.objects.create_user(username='cards-other', password='cards-password')
+        create_operation(self.user, 'PETR4', datetime.date(2025, 1, 10), '10', '30.00')
+        create_operation(self.user, 'PETR4', datetime.date(2025, 1, 20), '5', '32.00')
+        create_operation(self.user, 'VALE3', datetime.date(2025, 1, 25), '2', '60.50')
+        create_operation(
+            self.user, 'PETR4', datetime.date(2025, 2, 5), '4', '35.00', OrderType.SELL
+        )
+        create_operation(other, 'PETR4', datetime.date(2025, 1, 10), '100', '30.00')
+        CardInvestiment.objects.create(user=self.user, year=2025, month=3)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('cardinvestiment-list')
+
+    def test_summary_mode_reports_totals_per_card(self):
+        response = self.client.get(self.url, {'summary': '1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([
+            (card['year'], card['month'], card['buy_volume'], card['sell_volume'],
+             card['items_count'], card['distinct_assets'])
+            for card in response.data['results']
+        ], [
+            (2025, 3, '0.00', '0.00', 0, 0),
+            (2025, 2, '0.00', '140.00', 1, 1),
+            (2025, 1, '581.00', '0.00', 3, 2),
+        ])
+        self.assertNotIn('itens', response.data['results'][0])
+
+    def test_full_mode_query_count_does_not_grow_with_items(self):
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(self.url)
+        for day in range(1, 21):
+            create_operation(self.user, 'ITSA4', datetime.date(2025, 1, day), '1', '10.00')
+
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results'][-1]['itens']), 23)
+        self.assertEqual(len(after.captured_queries), len(before.captured_queries))
+
+
+class OperationImportServiceTest(TestCase):
+    statement = (
+        'code,type,order_type,quantity,unit_price,operation_date\n'
+        'PETR4,ACAO,C,10,30.00,2025-01-10\n'
+        'petr4,ACAO,COMPRA,10,32.00,2025-01-20\n'
+        'HGLG11,FII,BUY,5,160.00,2025-02-03\n'
+        'PETR4,ACAO,V,5,35.00,2025-02-15\n'
+        'HGLG11,FII,C,5,150.00,2025-03-03\n'
+    )
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='import', password='import-password')
+
+    def _import(self, content: str, service=None) -> dict:
+        service = service or OperationImportService(self.user, chunk_size=2)
+        return service.import_csv(StringIO(content)).as_dict()
+
+    def test_rows_are_imported_across_chunks_creating_each_asset_and_card_once(self):
+        result = self._import(self.statement)
+
+        self.assertEqual(result['imported'], 5)
+        self.assertEqual(result['created_assets'], 2)
+        self.assertEqual(result['created_cards'], 3)
+        self.assertEqual(Asset.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(CardInvestiment.objects.filter(user=self.user).count(), 3)
+        self.assertFalse(ItemInvestiment.objects.exclude(user=self.user).exists())
+
+    def test_positions_are_recomputed_after_the_import(self):
+        self._import(self.statement)
+
+        snapshot = PositionSnapshot.objects.get(
+            user=self.user, asset__code='PETR4', reference_month=datetime.date(2025, 2, 1)
+        )
+        self.assertEqual(snapshot.quantity, Decimal('15.00'))
+        self.assertEqual(snapshot.realized_result, Decimal('20.00'))
+
+    def test_assets_and_cards_created_elsewhere_are_not_counted(self):
+        service = OperationImportService(self.user, chunk_size=2)
+        Asset.objects.create(user=self.user, code='PETR4', type=TypeAsset.ACAO)
+        CardInvestiment.objects.create(user=self.user, year=2025, month=1)
+
+        result = self._import(self.statement, service)
+
+        self.assertEqual(result['created_assets'], 1)
+        self.assertEqual(result['created_cards'], 2)
+        self.assertEqual(Asset.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(CardInvestiment.objects.filter(user=self.user).count(), 3)
+
+    def test_reimporting_reuses_assets_and_cards(self):
+        self._import(self.statement)
+
+        result = self._import(self.statement)
+
+        self.assertEqual(result['imported'], 5)
+        self.assertEqual(result['created_assets'], 0)
+        self.assertEqual(result['created_cards'], 0)
+
+    def test_invalid_rows_are_reported_with_their_line(self):
+        result = self._import(
+            'code,type,order_type,quantity,unit_price,operation_date\n'
+            'PETR4,ACAO,X,10,30.00,2025-01-10\n'
+            'PETR4,XPTO,C,10,30.00,2025-01-10\n'
+            'PETR4,ACAO,C,abc,30.00,2025-01-10\n'
+            'PETR4,ACAO,C,10,30.00,2025-01-10\n'
+        )
+
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual(result['error_count'], 3)
+        self.assertEqual([error['line'] for error in result['errors']], [2, 3, 4])
+
+    def test_upload_endpoint_imports_the_file(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        upload = SimpleUploadedFile('operations.csv', self.statement.encode(), 'text/csv')
+
+        response = client.post(
+            reverse('itens-investiments-import'), {'file': upload}, format='multipart'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['imported'], 5)
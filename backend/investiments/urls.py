@@ -1,5 +1,14 @@
 from rest_framework.routers import DefaultRouter
-from .views import CardInvestimentViewSet, ItemInvestimentViewSet
+from .views import (
+    CardInvestimentViewSet,
+    ItemInvestimentViewSet,
+    PositionsView,
+    CapitalGainsView,
+    CapitalGainsSellsView,
+    PortfolioValuationView,
+    PortfolioTimeSeriesView,
+    OperationImportView
+)
 from django.urls import path, include
 
 
@@ -21,5 +30,19 @@ item_investiment_detail = ItemInvestimentViewSet.as_view({
 urlpatterns = [
     path('', include(router.urls)),
     path('itens-investiments/', item_investiment_list, name='itens-investiments'),
-    path('itens-investiments/<int:pk>/', item_investiment_detail, name='itens-investiments-detail')
+    path(
+        'itens-investiments/import/',
+        OperationImportView.as_view(),
+        name='itens-investiments-import'
+    ),
+    path(
+        'itens-investiments/<int:pk>/',
+        item_investiment_detail,
+        name='itens-investiments-detail'
+    ),
+    path('positions/', PositionsView.as_view(), name='positions'),
+    path('capital-gains/', CapitalGainsView.as_view(), name='capital-gains'),
+    path('capital-gains/sells/', CapitalGainsSellsView.as_view(), name='capital-gains-sells'),
+    path('portfolio/valuation/', PortfolioValuationView.as_view(), name='portfolio-valuation'),
+    path('portfolio/timeseries/', PortfolioTimeSeriesView.as_view(), name='portfolio-timeseries')
 ]
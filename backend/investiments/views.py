@@ -1,18 +1,41 @@
+import datetime
+import io
+from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+from django.db.models import Count, DecimalField, F, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from rest_framework.permissions import IsAuthenticated
-from .models import CardInvestiment, ItemInvestiment
-from .serializer import CardInvestimentSerializer, ItemInvestimentSerializer
-from rest_framework import viewsets
+from .models import CardInvestiment, ItemInvestiment, OrderType
+from .serializer import (
+    CardInvestimentSerializer,
+    CardInvestimentSummarySerializer,
+    ItemInvestimentSerializer,
+    PositionSnapshotSerializer
+)
+from .services.position_service import PositionService
+from .services.capital_gains_service import CapitalGainsService
+from .services.valuation_service import PortfolioValuationService
+from .services.portfolio_cache_service import CachedPortfolioTimeSeries
+from .services.timeseries_service import INTERVALS, first_operation_date
+from .services.operation_import_service import OperationImportService
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework import serializers
 from .filters import CardInvestimentMonthFilter
+from .paginations import CardInvestimentKeysetPagination, ItemInvestimentKeysetPagination
+from core.async_views import AsyncListModelMixin
 
 
 class ItemInvestimentViewSet(viewsets.ModelViewSet):
     queryset = ItemInvestiment.objects.all()
     serializer_class = ItemInvestimentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ItemInvestimentKeysetPagination
 
     def get_queryset(self):
-        return ItemInvestiment.objects.filter(card__user=self.request.user)
+        return ItemInvestiment.objects.filter(user=self.request.user).select_related('asset')
 
     def perform_create(self, serializer):
         card_id = self.request.data.get('card')
@@ -32,14 +55,187 @@ class ItemInvestimentViewSet(viewsets.ModelViewSet):
             })
 
 
-class CardInvestimentViewSet(viewsets.ModelViewSet):
+class CardInvestimentViewSet(AsyncListModelMixin, viewsets.ModelViewSet):
     queryset = CardInvestiment.objects.all()
     serializer_class = CardInvestimentSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = CardInvestimentMonthFilter
+    pagination_class = CardInvestimentKeysetPagination
 
     def get_queryset(self):
-        return CardInvestiment.objects.filter(user=self.request.user)
+        queryset = CardInvestiment.objects.filter(user=self.request.user)
+        if self._is_summary():
+            return self._annotate_summary(queryset)
+        return queryset.prefetch_related(
+            Prefetch('itens', queryset=ItemInvestiment.objects.select_related('asset'))
+        )
+
+    def get_serializer_class(self):
+        if self._is_summary():
+            return CardInvestimentSummarySerializer
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+    def _is_summary(self) -> bool:
+        return self.request.method == 'GET' and self.request.query_params.get(
+            'summary', ''
+        ).lower() in ('1', 'true')
+
+    @staticmethod
+    def _annotate_summary(queryset):
+        volume = F('itens__quantity') * F('itens__unit_price')
+        volume_field = DecimalField(max_digits=30, decimal_places=4)
+        zero = Value(Decimal('0'), output_field=volume_field)
+        return queryset.annotate(
+            buy_volume=Coalesce(
+                Sum(volume, filter=Q(itens__order_type=OrderType.BUY), output_field=volume_field),
+                zero
+            ),
+            sell_volume=Coalesce(
+                Sum(volume, filter=Q(itens__order_type=OrderType.SELL), output_field=volume_field),
+                zero
+            ),
+            items_count=Count('itens'),
+            distinct_assets=Count('itens__asset', distinct=True)
+        ).order_by('-year', '-month')
+
+
+class PositionsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        as_of = None
+        if 'year' in request.query_params or 'month' in request.query_params:
+            try:
+                as_of = datetime.date(
+                    int(request.query_params.get('year', datetime.date.today().year)),
+                    int(request.query_params.get('month', 12)),
+                    1
+                )
+            except (TypeError, ValueError):
+                return Response(
+                    {'error': 'parametros de ano/mês inválidos'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        include_closed = request.query_params.get('include_closed', '').lower() in ('1', 'true')
+        positions = PositionService.latest_positions(
+            request.user, as_of=as_of, include_closed=include_closed
+        )
+        return Response(PositionSnapshotSerializer(positions, many=True).data)
+
+
+class CapitalGainsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            year = int(request.query_params.get('year', datetime.date.today().year))
+            if not datetime.MINYEAR <= year < datetime.MAXYEAR:
+                raise ValueError(year)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'parametro de ano inválido'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(CapitalGainsService(request.user).monthly_results(year))
+
+
+class CapitalGainsSellsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            year = int(request.query_params.get('year', datetime.date.today().year))
+            month = int(request.query_params.get('month', datetime.date.today().month))
+            if not datetime.MINYEAR <= year < datetime.MAXYEAR:
+                raise ValueError(year)
+            datetime.date(year, month, 1)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'parametros de ano/mês inválidos'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(CapitalGainsService(request.user).sells(year, month))
+
+
+class PortfolioValuationView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            date = datetime.date.fromisoformat(
+                request.query_params.get('date', datetime.date.today().isoformat())
+            )
+        except ValueError:
+            return Response(
+                {'error': 'parametro de data inválido, use o formato AAAA-MM-DD'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(PortfolioValuationService(request.user, date).valuate())
+
+
+class PortfolioTimeSeriesView(APIView):
+    permission_classes = [IsAuthenticated]
+    max_range_months = 120
+
+    def get(self, request, *args, **kwargs):
+        interval = request.query_params.get('interval', 'daily')
+        if interval not in INTERVALS:
+            return Response(
+                {'error': f'intervalo inválido, use um de: {", ".join(INTERVALS)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            start = request.query_params.get('start')
+            start = datetime.date.fromisoformat(start) if start else None
+            end = datetime.date.fromisoformat(
+                request.query_params.get('end', datetime.date.today().isoformat())
+            )
+        except ValueError:
+            return Response(
+                {'error': 'parametro de data inválido, use o formato AAAA-MM-DD'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if start and start > end:
+            return Response(
+                {'error': 'a data inicial deve ser anterior ou igual à data final'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        first_operation = first_operation_date(request.user) or end
+        if start is None:
+            earliest_start = end.replace(day=1) - relativedelta(months=self.max_range_months - 1)
+            start = min(max(first_operation, earliest_start), end)
+        else:
+            start = max(start, first_operation)
+        months_in_range = (end.year - start.year) * 12 + end.month - start.month + 1
+        if months_in_range > self.max_range_months:
+            return Response(
+                {'error': f'o intervalo máximo é de {self.max_range_months} meses'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        series = CachedPortfolioTimeSeries(request.user, start, end, interval)
+        response = Response(series.build())
+        response['X-Cache'] = 'HIT' if series.hit else 'MISS'
+        return response
+
+
+class OperationImportView(APIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'error': 'envie o arquivo CSV no campo "file"'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        operations_file = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        result = OperationImportService(request.user).import_csv(operations_file)
+        return Response(
+            result.as_dict(),
+            status=status.HTTP_201_CREATED if result.imported else status.HTTP_400_BAD_REQUEST
+        )
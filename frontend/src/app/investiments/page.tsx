@@ -9,14 +9,13 @@ import { Skeleton } from "@base/components/ui/custom/Skeleton"
 import ErrorComponent from "@base/components/ui/custom/ErrorComponent"
 import BackButton from "@base/components/ui/custom/backButton"
 import GenericFormModal from "@base/components/ui/custom/GenericFormModal"
-import ReusablePagination from "@base/components/ui/custom/ReusablePagination"
+import CursorPagination from "@base/components/ui/custom/CursorPagination"
 import { Label } from "@base/components/ui/label"
 import { InvestimentCard } from "@base/components/investiments/listInvestiment"
 
 export default function Investiments(){
     const [isSubmittingMonth, setIsSubmittingMonth] = useState(false);
-    const [currentPage, setCurrentPage] = useState(1);
-    const itensPerPage = 3;
+    const [cursor, setCursor] = useState<string | null>(null);
     const [newMonthData, setNewMonthData] = useState({
         month: new Date().getMonth() + 1,
         year: new Date().getFullYear(),
@@ -24,7 +23,6 @@ export default function Investiments(){
     const [filters, setFilters] = useState({ year: '', month: '' })
 
     const {
-        count,
         cards,
         isLoading,
         isError,
@@ -33,19 +31,22 @@ export default function Investiments(){
         removeInvestmentItem,
         addMonthCard,
         removeMonthCard,
-    } = useInvestments(filters, currentPage)
+        nextCursor,
+        previousCursor,
+    } = useInvestments(filters, cursor)
 
     const { assets } = useAssets()
 
-    const handlePageChange = (page: number) => setCurrentPage(page)
-    const totalPages = Math.ceil(count / itensPerPage)
-
     const handleFilterChange = (e: React.ChangeEvent<HTMLSelectElement | HTMLInputElement>) => {
         const { name, value } = e.target;
         setFilters((prev) => ({ ...prev, [name]: value }));
+        setCursor(null);
     }
 
-    const clearFilters = () => setFilters({ year: '', month: '' })
+    const clearFilters = () => {
+        setFilters({ year: '', month: '' })
+        setCursor(null)
+    }
 
     const handleAddMonthSubmit = async () => {
         setIsSubmittingMonth(true);
@@ -203,10 +204,10 @@ export default function Investiments(){
                 </div>
             </div>
             <div className="mt-10">
-                <ReusablePagination
-                    currentPage={currentPage}
-                    totalPages={totalPages}
-                    onPageChange={handlePageChange}
+                <CursorPagination
+                    previousCursor={previousCursor}
+                    nextCursor={nextCursor}
+                    onCursorChange={setCursor}
                 />
             </div>
         </div>
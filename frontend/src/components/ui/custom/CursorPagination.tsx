@@ -0,0 +1,51 @@
+"use client"
+
+import {
+    Pagination,
+    PaginationContent,
+    PaginationItem,
+    PaginationNext,
+    PaginationPrevious,
+} from "@base/components/ui/pagination"
+
+type CursorPaginationProps = {
+    previousCursor: string | null;
+    nextCursor: string | null;
+    onCursorChange: (cursor: string) => void;
+    className?: string;
+}
+
+export default function CursorPagination({
+    previousCursor,
+    nextCursor,
+    onCursorChange,
+    className = ''
+}: CursorPaginationProps){
+    if(!previousCursor && !nextCursor) return null;
+    return(
+        <Pagination className={className}>
+            <PaginationContent>
+                <PaginationItem>
+                    <PaginationPrevious
+                        href="#"
+                        onClick={(e) => {
+                            e.preventDefault();
+                            if (previousCursor) onCursorChange(previousCursor);
+                        }}
+                        className={previousCursor ? 'hover:bg-slate-800' : 'pointer-events-none opacity-50'}
+                    />
+                </PaginationItem>
+                <PaginationItem>
+                    <PaginationNext
+                        href="#"
+                        onClick={(e) => {
+                            e.preventDefault();
+                            if (nextCursor) onCursorChange(nextCursor);
+                        }}
+                        className={nextCursor ? 'hover:bg-slate-800' : 'pointer-events-none opacity-50'}
+                    />
+                </PaginationItem>
+            </PaginationContent>
+        </Pagination>
+    );
+}
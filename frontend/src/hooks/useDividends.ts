@@ -10,18 +10,18 @@ import {
 } from '@base/services/dividendsService'
 import type { NewItemDividend, EditItemDividend, NewDividendMonth } from '@base/types/dividends'
 import toast from 'react-hot-toast'
-import { extractApiError } from '@base/lib/api'
+import { cursorFromLink, extractApiError } from '@base/lib/api'
 
 export const DIVIDENDS_QUERY_KEY = 'dividends' as const
 
-export function useDividends(filters: DividendFilters = {}, page: number = 1) {
+export function useDividends(filters: DividendFilters = {}, cursor: string | null = null) {
     const queryClient = useQueryClient()
 
-    const queryKey = [DIVIDENDS_QUERY_KEY, filters, page]
+    const queryKey = [DIVIDENDS_QUERY_KEY, filters, cursor]
 
     const query = useQuery({
         queryKey,
-        queryFn: () => getDividends(filters, page),
+        queryFn: () => getDividends(filters, cursor),
     })
 
     const invalidate = () =>
@@ -60,7 +60,8 @@ export function useDividends(filters: DividendFilters = {}, page: number = 1) {
 
     return {
         cards: query.data?.results ?? [],
-        count: query.data?.count ?? 0,
+        nextCursor: cursorFromLink(query.data?.next ?? null),
+        previousCursor: cursorFromLink(query.data?.previous ?? null),
         isLoading: query.isLoading,
         isError: query.isError,
         addDividendItem,
@@ -10,18 +10,18 @@ import {
 } from '@base/services/investmentsService'
 import type { NewItemInvestiment, EditItemInvestiment, NewCardInvestiment } from '@base/types/investiments'
 import toast from 'react-hot-toast'
-import { extractApiError } from '@base/lib/api'
+import { cursorFromLink, extractApiError } from '@base/lib/api'
 
 export const INVESTMENTS_QUERY_KEY = 'investments' as const
 
-export function useInvestments(filters: InvestmentFilters = {}, page: number = 1) {
+export function useInvestments(filters: InvestmentFilters = {}, cursor: string | null = null) {
     const queryClient = useQueryClient()
 
-    const queryKey = [INVESTMENTS_QUERY_KEY, filters, page]
+    const queryKey = [INVESTMENTS_QUERY_KEY, filters, cursor]
 
     const query = useQuery({
         queryKey,
-        queryFn: () => getInvestments(filters, page),
+        queryFn: () => getInvestments(filters, cursor),
     })
 
     const invalidate = () =>
@@ -60,7 +60,8 @@ export function useInvestments(filters: InvestmentFilters = {}, page: number = 1
 
     return {
         cards: query.data?.results ?? [],
-        count: query.data?.count ?? 0,
+        nextCursor: cursorFromLink(query.data?.next ?? null),
+        previousCursor: cursorFromLink(query.data?.previous ?? null),
         isLoading: query.isLoading,
         isError: query.isError,
         addInvestmentItem,
@@ -14,6 +14,11 @@ export function extractApiError(error: unknown, fallback: string): string {
     return fallback;
 }
 
+export function cursorFromLink(link: string | null): string | null {
+    if (!link) return null;
+    return new URL(link).searchParams.get('cursor');
+}
+
 const api = axios.create({
     baseURL: process.env.NEXT_PUBLIC_API_BASE_URL,
     withCredentials: true,
@@ -9,10 +9,10 @@ export type DividendFilters = {
 
 export const getDividends = async (
     filters: DividendFilters = {},
-    page: number = 1
+    cursor: string | null = null
 ): Promise<PaginatedResponse<DividendMonth>> => {
     const response = await api.get<PaginatedResponse<DividendMonth>>('/cards-dividends/', {
-        params: { ...filters, page }
+        params: cursor ? { ...filters, cursor } : filters
     })
     return response.data
 }
@@ -9,10 +9,10 @@ export type InvestmentFilters = {
 
 export const getInvestments = async (
     filters: InvestmentFilters = {},
-    page: number = 1
+    cursor: string | null = null
 ): Promise<PaginatedResponse<CardInvestimentMonth>> => {
     const response = await api.get<PaginatedResponse<CardInvestimentMonth>>('/cards-investiments/', {
-        params: { ...filters, page }
+        params: cursor ? { ...filters, cursor } : filters
     })
     return response.data
 }
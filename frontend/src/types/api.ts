@@ -1,5 +1,4 @@
 export type PaginatedResponse<T> = {
-    count: number;
     next: string | null;
     previous: string | null;
     results: T[];